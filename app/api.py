@@ -1,15 +1,17 @@
 from __future__ import annotations
-from fastapi import FastAPI, Depends, UploadFile, File, HTTPException
+from fastapi import FastAPI, Depends, UploadFile, File, HTTPException, Query, Request, Response
 from fastapi.security import OAuth2PasswordRequestForm
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlmodel import SQLModel, Session, select
 import csv
+import hashlib
 import io
 
 from .constants import BOM_TEMPLATE_HEADERS
 
 from .database import get_session, ensure_schema, new_session
 from .models import Customer, Project, Assembly, Part, Task, TaskStatus, User
+from .routers import jobs as jobs_router
 from .routers import schematic_packs as schematic_packs_router
 from .routers import test_methods as test_methods_router
 from .services import (
@@ -20,7 +22,12 @@ from .services import (
     create_assembly as svc_create_assembly,
     list_tasks as svc_list_tasks,
     list_bom_items as svc_list_bom_items,
+    list_bom_items_page as svc_list_bom_items_page,
+    BOMItemPage,
     BOMItemRead,
+    CoverageSummary,
+    get_test_coverage as svc_get_test_coverage,
+    submit_import_job,
 )
 from .auth import (
     get_current_user,
@@ -29,10 +36,13 @@ from .auth import (
     create_default_users,
 )
 from .services import test_assets
+from .services.assemblies import DEFAULT_BOM_PAGE_SIZE, MAX_BOM_PAGE_SIZE
+from .services.bom_versions import get_bom_version
 
 app = FastAPI()
 app.include_router(test_methods_router.router)
 app.include_router(schematic_packs_router.router)
+app.include_router(jobs_router.router)
 
 
 @app.on_event("startup")
@@ -130,23 +140,114 @@ def create_part(
 def import_bom_endpoint(
     assembly_id: int,
     file: UploadFile = File(...),
+    run_async: bool = Query(False, alias="async"),
+    dry_run: bool = Query(False),
+    sheet: str | None = Query(None),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ):
-    data = file.file.read()
-    report = import_bom(assembly_id, data, session)
-    if report.errors:
+    if run_async:
+        if session.get(Assembly, assembly_id) is None:
+            raise HTTPException(status_code=404, detail="Assembly not found")
+        bind = session.get_bind()
+        job = submit_import_job(
+            assembly_id, file.file, lambda: Session(bind), dry_run=dry_run, sheet=sheet
+        )
+        return JSONResponse(
+            status_code=202,
+            content=jobs_router.serialize_job(job).model_dump(mode="json"),
+            headers={"Location": f"/jobs/{job.id}"},
+        )
+    # Hand the spooled upload to the importer so rows stream from disk.
+    report = import_bom(assembly_id, file.file, session, dry_run=dry_run, sheet=sheet)
+    # Previews report row errors alongside the diff instead of failing.
+    if report.errors and not dry_run:
         raise HTTPException(status_code=422, detail=report.errors)
     return report
 
 
-@app.get("/assemblies/{assembly_id}/bom/items", response_model=list[BOMItemRead])
+def _bom_etag(session: Session, assembly_id: int, request: Request) -> str | None:
+    version = get_bom_version(session, assembly_id)
+    if version is None:
+        return None
+    # Paging/projection parameters select a different representation.
+    variant = hashlib.sha1(request.url.query.encode("utf-8")).hexdigest()[:12]
+    return f'W/"bom-{assembly_id}-{version}-{variant}"'
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    wanted = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == wanted:
+            return True
+    return False
+
+
+@app.get(
+    "/assemblies/{assembly_id}/bom/items",
+    response_model=list[BOMItemRead] | BOMItemPage,
+)
 def list_bom_items(
     assembly_id: int,
+    request: Request,
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_BOM_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: str | None = None,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+):
+    """List BOM items; ``limit``/``cursor``/``fields`` switch to keyset pages.
+
+    Responses carry an ETag derived from the assembly's BOM change version so
+    pollers get a 304 without the BOM being loaded or resolved.
+    """
+
+    etag = _bom_etag(session, assembly_id, request)
+    if etag is not None:
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+    if limit is None and cursor is None and fields is None:
+        return svc_list_bom_items(assembly_id, session)
+    field_list = None
+    if fields is not None:
+        field_list = [f.strip() for f in fields.split(",") if f.strip()]
+    try:
+        return svc_list_bom_items_page(
+            assembly_id,
+            session,
+            limit=limit or DEFAULT_BOM_PAGE_SIZE,
+            cursor=cursor,
+            fields=field_list,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@app.get("/assemblies/{assembly_id}/test-coverage", response_model=CoverageSummary)
+def get_test_coverage(
+    assembly_id: int,
+    request: Request,
+    response: Response,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ):
-    return svc_list_bom_items(assembly_id, session)
+    """Counts of resolved tests by source, method, part type and power mode."""
+
+    if session.get(Assembly, assembly_id) is None:
+        raise HTTPException(status_code=404, detail="Assembly not found")
+    etag = _bom_etag(session, assembly_id, request)
+    if etag is not None:
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+    return svc_get_test_coverage(session, assembly_id)
 
 
 @app.get("/projects/{project_id}/tasks", response_model=list[Task])
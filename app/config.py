@@ -12,6 +12,12 @@ Environment variables (quick overrides):
   - BOM_DATA_ROOT: base directory for application data
   - BOM_DATASHEETS_DIR: directory for the datasheets store
   - BOM_MAX_DS_MB: max datasheet size (MB)
+  - BOM_IMPORT_MAX_WORKERS: concurrent background BOM import jobs
+  - BOM_FX_CACHE_HOURS: how long fetched FX rates stay fresh
+
+SQLite connections are tuned from ``[database.sqlite]`` (see
+:func:`get_sqlite_pragmas`); server databases such as PostgreSQL use a
+QueuePool configured from ``[database.pool]`` (see :func:`get_pool_settings`).
 """
 
 from __future__ import annotations
@@ -21,10 +27,15 @@ import os
 import sys
 import copy
 from contextlib import suppress
-from typing import Any, Dict, Mapping, Optional
+import logging
+import threading
+from typing import Any, Dict, Mapping, Optional, Tuple
 from sqlmodel import create_engine
+from sqlalchemy import event
 from sqlalchemy.engine import Engine, make_url
 
+logger = logging.getLogger(__name__)
+
 # TOML read/write helpers: prefer stdlib tomllib (3.11+),
 # fall back to third-party toml if available; otherwise write minimal TOML.
 try:  # Python 3.11+
@@ -173,10 +184,20 @@ def _ensure_settings() -> None:
                 f.write("[database]\n")
                 f.write(f"url = \"{DEFAULT_URL}\"\n")
 
-def _read_settings_dict() -> Dict[str, Any]:
-    _ensure_settings()
-    if not SETTINGS_PATH.exists():
-        return {}
+_settings_lock = threading.Lock()
+# ((path, mtime_ns, size), parsed settings) of the last settings.toml read.
+_settings_cache: Optional[Tuple[Tuple[str, int, int], Dict[str, Any]]] = None
+
+
+def invalidate_settings_cache() -> None:
+    """Drop the memoised settings so the next read parses settings.toml."""
+
+    global _settings_cache
+    with _settings_lock:
+        _settings_cache = None
+
+
+def _parse_settings_file() -> Dict[str, Any]:
     try:
         if _toml_reader is not None:
             with open(SETTINGS_PATH, "rb") as handle:
@@ -187,6 +208,25 @@ def _read_settings_dict() -> Dict[str, Any]:
         return {}
     return {}
 
+
+def _read_settings_dict() -> Dict[str, Any]:
+    """Return a copy of the parsed settings, re-parsing only when the file changed."""
+
+    global _settings_cache
+    _ensure_settings()
+    try:
+        stat = SETTINGS_PATH.stat()
+    except OSError:
+        return {}
+    stamp = (str(SETTINGS_PATH), stat.st_mtime_ns, stat.st_size)
+    with _settings_lock:
+        cached = _settings_cache
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, _parse_settings_file())
+        with _settings_lock:
+            _settings_cache = cached
+    return copy.deepcopy(cached[1])
+
 _BOOL_TRUE_VALUES = {"1", "true", "yes", "on"}
 _UNSET = object()
 
@@ -231,6 +271,196 @@ def _load_auto_ds_max_workers(default: int = 4) -> int:
                 return _coerce_positive_int(data[key], default)
     return default
 
+def _load_import_job_max_workers(default: int = 2) -> int:
+    env_value = os.getenv("BOM_IMPORT_MAX_WORKERS")
+    if env_value is not None:
+        return _coerce_positive_int(env_value, default)
+    data = _read_settings_dict().get("imports")
+    if isinstance(data, Mapping) and "max_workers" in data:
+        return _coerce_positive_int(data["max_workers"], default)
+    return default
+
+def _load_fx_cache_hours(default: int = 24) -> int:
+    env_value = os.getenv("BOM_FX_CACHE_HOURS")
+    if env_value is not None:
+        return _coerce_positive_int(env_value, default)
+    data = _read_settings_dict().get("fx")
+    if isinstance(data, Mapping) and "cache_hours" in data:
+        return _coerce_positive_int(data["cache_hours"], default)
+    return default
+
+def get_bom_header_aliases() -> Dict[str, list[str]]:
+    """Return extra BOM column aliases from ``[imports.header_aliases]``.
+
+    Each key is a canonical import field and each value a string or list of
+    header names, e.g. ``reference = ["Designator List"]``.
+    """
+
+    data = _read_settings_dict().get("imports")
+    section = data.get("header_aliases") if isinstance(data, Mapping) else None
+    aliases: Dict[str, list[str]] = {}
+    if not isinstance(section, Mapping):
+        return aliases
+    for field, values in section.items():
+        if isinstance(values, str):
+            values = [values]
+        if not isinstance(values, (list, tuple)):
+            continue
+        cleaned = [v for v in values if isinstance(v, str) and v.strip()]
+        if cleaned:
+            aliases[str(field)] = cleaned
+    return aliases
+
+_SQLITE_PRAGMA_DEFAULTS: Dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "cache_size": -20000,
+    "mmap_size": 268435456,
+    "temp_store": "MEMORY",
+}
+_SQLITE_PRAGMA_CHOICES: Dict[str, set[str]] = {
+    "journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA"},
+    "temp_store": {"DEFAULT", "FILE", "MEMORY"},
+}
+
+
+def get_sqlite_pragmas() -> Dict[str, Any]:
+    """Return the PRAGMA profile applied to every new SQLite connection.
+
+    Values come from ``[database.sqlite]`` over WAL-friendly defaults;
+    ``enabled = false`` turns the profile off.  ``cache_size`` follows
+    SQLite's convention (negative values are KiB).  WAL needs shared memory,
+    so set ``journal_mode = "DELETE"`` for databases on network shares.
+    """
+
+    database = _read_settings_dict().get("database")
+    section = database.get("sqlite") if isinstance(database, Mapping) else None
+    pragmas = dict(_SQLITE_PRAGMA_DEFAULTS)
+    if not isinstance(section, Mapping):
+        return pragmas
+    if not _coerce_bool(section.get("enabled"), True):
+        return {}
+    for key, choices in _SQLITE_PRAGMA_CHOICES.items():
+        value = section.get(key)
+        if value is not None and str(value).strip().upper() in choices:
+            pragmas[key] = str(value).strip().upper()
+    for key in ("busy_timeout", "cache_size", "mmap_size"):
+        value = section.get(key)
+        if value is None:
+            continue
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            continue
+        if number >= 0 or key == "cache_size":
+            pragmas[key] = number
+    return pragmas
+
+
+def _sqlite_is_memory(url: str) -> bool:
+    database = make_url(url).database
+    return not database or database == ":memory:" or database.startswith("file::memory:")
+
+
+def _install_sqlite_pragmas(engine: Engine, pragmas: Mapping[str, Any]) -> None:
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return
+    items = list(pragmas.items())
+    if _sqlite_is_memory(str(engine.url)):
+        # In-memory databases have no journal file or mapping to tune.
+        items = [(k, v) for k, v in items if k not in ("journal_mode", "mmap_size")]
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, _record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for key, value in items:
+                try:
+                    cursor.execute(f"PRAGMA {key}={value}")
+                except Exception as exc:  # pragma: no cover - read-only media etc.
+                    logger.warning("SQLite PRAGMA %s=%s failed: %s", key, value, exc)
+        finally:
+            cursor.close()
+
+
+_POOL_DEFAULTS: Dict[str, Any] = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_timeout": 30,
+    "pool_recycle": 1800,
+    "pre_ping": True,
+    "statement_timeout_ms": 0,
+}
+
+
+def get_pool_settings() -> Dict[str, Any]:
+    """Return QueuePool options for server databases from ``[database.pool]``.
+
+    ``statement_timeout_ms`` (PostgreSQL only) aborts statements running
+    longer than the limit; 0 disables it.
+    """
+
+    database = _read_settings_dict().get("database")
+    section = database.get("pool") if isinstance(database, Mapping) else None
+    settings = dict(_POOL_DEFAULTS)
+    if not isinstance(section, Mapping):
+        return settings
+    settings["pre_ping"] = _coerce_bool(section.get("pre_ping"), settings["pre_ping"])
+    for key in ("pool_size", "pool_timeout", "pool_recycle"):
+        if key in section:
+            settings[key] = _coerce_positive_int(section[key], settings[key])
+    for key in ("max_overflow", "statement_timeout_ms"):
+        try:
+            value = int(section.get(key, settings[key]))
+        except (TypeError, ValueError):
+            continue
+        if value >= 0:
+            settings[key] = value
+    return settings
+
+
+def _engine_options(url: str) -> Dict[str, Any]:
+    """Settings that shape the engine for ``url`` (SQLite PRAGMAs or pool)."""
+
+    if make_url(url).get_backend_name() == "sqlite":
+        return {"pragmas": get_sqlite_pragmas()}
+    return {"pool": get_pool_settings()}
+
+
+def _engine_kwargs(url: str, options: Mapping[str, Any]) -> Dict[str, Any]:
+    pool = options.get("pool")
+    if not pool:
+        return {}
+    kwargs: Dict[str, Any] = {
+        "pool_size": pool["pool_size"],
+        "max_overflow": pool["max_overflow"],
+        "pool_timeout": pool["pool_timeout"],
+        "pool_recycle": pool["pool_recycle"],
+        "pool_pre_ping": pool["pre_ping"],
+    }
+    if pool["statement_timeout_ms"] and make_url(url).get_backend_name() == "postgresql":
+        kwargs["connect_args"] = {"options": f"-c statement_timeout={pool['statement_timeout_ms']}"}
+    return kwargs
+
+
+def _freeze(options: Mapping[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    return tuple((k, tuple(sorted(v.items()))) for k, v in sorted(options.items()))
+
+
+def _create_engine(url: str) -> Tuple[Engine, Tuple[Tuple[str, Any], ...]]:
+    options = _engine_options(url)
+    engine = create_engine(url, echo=False, **_engine_kwargs(url, options))
+    _install_sqlite_pragmas(engine, options.get("pragmas") or {})
+    # Sessions on this engine must bump BOM change versions on every write,
+    # even in processes (CLI tools, GUI paths) that never import app.services.
+    from .services.bom_versions import install_session_hooks
+
+    install_session_hooks()
+    return engine, _freeze(options)
+
+
 def _toml_scalar(value: Any) -> str:
     if isinstance(value, bool):
         return str(value).lower()
@@ -248,6 +478,13 @@ def _write_settings_data(data: Dict[str, Any]) -> None:
     TOML subset that supports nested tables containing primitive values.
     Unknown value types are ignored to avoid corrupting the settings file.
     """
+    try:
+        _dump_settings_data(data)
+    finally:
+        invalidate_settings_cache()
+
+
+def _dump_settings_data(data: Dict[str, Any]) -> None:
     SETTINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
     if _toml_rw is not None:
         with open(SETTINGS_PATH, 'w', encoding='utf-8') as handle:
@@ -383,60 +620,44 @@ def load_settings() -> str:
     _ensure_settings()
     env_url = os.getenv("DATABASE_URL")
     url = env_url
-    settings_data: Dict[str, Any] | None = None
-    if SETTINGS_PATH.exists():
-        try:
-            if _toml_reader is not None:
-                with open(SETTINGS_PATH, "rb") as f:
-                    settings_data = _toml_reader.load(f)  # type: ignore[arg-type]
-            elif _toml_rw is not None:
-                settings_data = _toml_rw.load(SETTINGS_PATH)  # type: ignore[call-arg]
-            else:
-                settings_data = {}
-        except Exception:
-            settings_data = {}
-        if settings_data is not None:
-            url = settings_data.get("database", {}).get("url", url)
+    database = _read_settings_dict().get("database")
+    if isinstance(database, Mapping):
+        url = database.get("url", url)
     raw_url = url or DEFAULT_URL
     data_root_hint = None if env_url else _configured_data_root()
     return _ensure_sqlite_directory(raw_url, data_root=data_root_hint)
 
 DATABASE_URL = load_settings()
-_ENGINE: Engine = create_engine(DATABASE_URL, echo=False)
+_ENGINE, _ENGINE_OPTIONS = _create_engine(DATABASE_URL)
 
 def get_engine(url: Optional[str] = None) -> Engine:
-    """Return engine, recreating if the URL changed."""
-    global _ENGINE, DATABASE_URL
+    """Return engine, recreating if the URL, SQLite profile or pool settings changed."""
+    global _ENGINE, _ENGINE_OPTIONS, DATABASE_URL
     if url is not None:
         data_root_hint = None if os.getenv("DATABASE_URL") else _configured_data_root()
         new_url = _ensure_sqlite_directory(url, data_root=data_root_hint)
     else:
         new_url = load_settings()
-    if new_url != DATABASE_URL:
+    options = _freeze(_engine_options(new_url))
+    if new_url != DATABASE_URL or options != _ENGINE_OPTIONS:
         DATABASE_URL = new_url
         _ENGINE.dispose()
-        _ENGINE = create_engine(DATABASE_URL, echo=False)
+        _ENGINE, _ENGINE_OPTIONS = _create_engine(DATABASE_URL)
     return _ENGINE
 
 def reload_settings() -> None:
     """Reload settings from disk and rebuild engine if needed."""
-    global MAX_DATASHEET_MB, AUTO_DATASHEET_MAX_WORKERS
+    global MAX_DATASHEET_MB, AUTO_DATASHEET_MAX_WORKERS, IMPORT_JOB_MAX_WORKERS
     get_engine(load_settings())
     refresh_paths()
     MAX_DATASHEET_MB = _load_max_datasheet_mb()
     AUTO_DATASHEET_MAX_WORKERS = _load_auto_ds_max_workers()
+    IMPORT_JOB_MAX_WORKERS = _load_import_job_max_workers()
 
 def _from_settings(section: str, key: str, default: str) -> str:
-    try:
-        if _toml_reader is not None and SETTINGS_PATH.exists():
-            with open(SETTINGS_PATH, "rb") as f:
-                data = _toml_reader.load(f)  # type: ignore[arg-type]
-            return str(((data.get(section) or {}).get(key)) or default)
-        elif _toml_rw is not None and SETTINGS_PATH.exists():
-            data = _toml_rw.load(SETTINGS_PATH)  # type: ignore[call-arg]
-            return str(((data.get(section) or {}).get(key)) or default)
-    except Exception:
-        pass
+    data = _read_settings_dict().get(section)
+    if isinstance(data, Mapping):
+        return str(data.get(key) or default)
     return default
 
 # ------------------------- Path configuration -------------------------
@@ -571,6 +792,8 @@ PDF_OPEN_DEBUG = _as_bool(
 
 MAX_DATASHEET_MB = _load_max_datasheet_mb()
 AUTO_DATASHEET_MAX_WORKERS = _load_auto_ds_max_workers()
+IMPORT_JOB_MAX_WORKERS = _load_import_job_max_workers()
+FX_CACHE_HOURS = _load_fx_cache_hours()
 
 def get_complex_editor_settings() -> Dict[str, Any]:
     """Return Complex Editor UI/bridge configuration with defaults applied."""
@@ -1,41 +1,132 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+import weakref
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, select
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import SQLModel, Session
 
+from . import db_safe_migrate
 from .db_safe_migrate import run_sqlite_safe_migrations
 from .config import get_engine
 
-_schema_checked_urls: set[str] = set()
 engine: Engine | None = None
-__schema_ok: bool = False
+
+# Engines whose schema was verified (or found stamped) in this process.
+_verified_engines: "weakref.WeakKeyDictionary[Engine, str]" = weakref.WeakKeyDictionary()
+_schema_lock = threading.Lock()
+
+# Kept out of SQLModel.metadata so the stamp never changes the fingerprint.
+_stamp_metadata = MetaData()
+schema_stamp = Table(
+    "app_schema_stamp",
+    _stamp_metadata,
+    Column("name", String, primary_key=True),
+    Column("fingerprint", String, nullable=False),
+    Column("verified_at", DateTime, nullable=False),
+)
+_STAMP_NAME = "schema"
 
 
-def _resolve_engine() -> Engine:
+def resolve_engine() -> Engine:
+    """Return the application engine, creating it from settings on first use."""
+
     global engine
     if engine is None:
         engine = get_engine()
     return engine
 
 
+def _model_tables() -> list[Table]:
+    from . import models
+
+    names = {
+        obj.__table__.name
+        for obj in vars(models).values()
+        if isinstance(obj, type) and issubclass(obj, SQLModel) and hasattr(obj, "__table__")
+    }
+    return [t for t in SQLModel.metadata.sorted_tables if t.name in names]
+
+
+def schema_fingerprint() -> str:
+    """Hash of the model tables and safe-migration spec this build expects."""
+
+    parts: list[str] = []
+    for table in _model_tables():
+        parts.append(table.name)
+        parts.extend(f"{c.name}:{c.type!r}:{c.nullable}" for c in table.columns)
+        parts.extend(sorted(f"ix:{ix.name}:{ix.unique}" for ix in table.indexes))
+    parts.append(db_safe_migrate.migration_spec())
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def read_schema_stamp(bind: Engine) -> str | None:
+    """Return the fingerprint recorded in the database, if any."""
+
+    try:
+        with bind.connect() as conn:
+            return conn.execute(
+                select(schema_stamp.c.fingerprint).where(schema_stamp.c.name == _STAMP_NAME)
+            ).scalar()
+    except SQLAlchemyError:
+        return None
+
+
+def record_schema_version(bind: Engine, fingerprint: str | None = None) -> str:
+    """Store ``fingerprint`` (default: this build's) as the verified schema."""
+
+    fingerprint = fingerprint or schema_fingerprint()
+    with bind.begin() as conn:
+        _stamp_metadata.create_all(conn)
+        conn.execute(schema_stamp.delete().where(schema_stamp.c.name == _STAMP_NAME))
+        conn.execute(
+            schema_stamp.insert().values(
+                name=_STAMP_NAME, fingerprint=fingerprint, verified_at=datetime.utcnow()
+            )
+        )
+    return fingerprint
+
+
+def verify_schema(bind: Engine) -> str:
+    """Create missing tables, apply safe migrations and stamp the result."""
+
+    SQLModel.metadata.create_all(bind)
+    run_sqlite_safe_migrations(bind)
+    return record_schema_version(bind)
+
+
 def ensure_schema() -> None:
-    global __schema_ok
-    resolved = _resolve_engine()
-    url = str(resolved.url)
-    if url not in _schema_checked_urls or not __schema_ok:
-        SQLModel.metadata.create_all(resolved)
-        run_sqlite_safe_migrations(resolved)
-        _schema_checked_urls.add(url)
-        __schema_ok = True
+    """Verify the schema once per engine.
+
+    After the first call for an engine this is a dictionary lookup.  The
+    first call itself only reads the stamp table when the database was
+    already verified for this build (by an earlier start or
+    ``python -m app.tools.db migrate``); otherwise it runs the full check.
+    """
+
+    resolved = resolve_engine()
+    if resolved in _verified_engines:
+        return
+    with _schema_lock:
+        if resolved in _verified_engines:
+            return
+        expected = schema_fingerprint()
+        if read_schema_stamp(resolved) != expected:
+            verify_schema(resolved)
+        _verified_engines[resolved] = expected
 
 
 def get_session():
     ensure_schema()
-    resolved = _resolve_engine()
+    resolved = resolve_engine()
     with Session(resolved) as session:
         yield session
 
 
 def new_session() -> Session:
     ensure_schema()
-    return Session(_resolve_engine())
+    return Session(resolve_engine())
@@ -44,6 +44,8 @@ _MIGRATIONS: dict[str, dict[str, str]] = {
         "tol_p": "TEXT DEFAULT ''",
         "tol_n": "TEXT DEFAULT ''",
         "created_at": "TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
+        "part_number_norm": "TEXT",
+        "part_number_base": "TEXT",
     },
     "task": {
         "title": "TEXT DEFAULT ''",
@@ -64,6 +66,7 @@ _MIGRATIONS: dict[str, dict[str, str]] = {
         "alt_part_number": "TEXT DEFAULT ''",
         "is_fitted": "INTEGER DEFAULT 1",
         "notes": "TEXT DEFAULT ''",
+        "reference_key": "TEXT",
     },
 }
 
@@ -95,6 +98,186 @@ def _ensure_complex_links_table(conn) -> bool:
     conn.execute(text('CREATE INDEX IF NOT EXISTS ix_complex_links_ce ON complex_links(ce_complex_id)'))
     return True
 
+_BOMITEM_INDEXES = (
+    ("ux_bomitem_assembly_reference", "assembly_id, reference", True),
+    ("ix_bomitem_part_id", "part_id", False),
+    ("ix_bomitem_assembly_reference_key", "assembly_id, reference_key, id", False),
+)
+
+# Every (assembly_id, reference) pair keeps its lowest id, matching the
+# importer's "first row wins" lookup.
+_DUPLICATE_BOM_ITEMS = """
+SELECT id FROM bomitem WHERE id NOT IN (
+  SELECT MIN(id) FROM bomitem GROUP BY assembly_id, reference
+)
+"""
+
+
+def _index_exists(conn, name: str) -> bool:
+    return conn.execute(
+        text("SELECT name FROM sqlite_master WHERE type='index' AND name=:name"),
+        {"name": name},
+    ).fetchone() is not None
+
+
+def _dedupe_bom_items(conn) -> int:
+    """Delete duplicate ``(assembly_id, reference)`` rows and their overrides."""
+
+    dup_ids = [row[0] for row in conn.execute(text(_DUPLICATE_BOM_ITEMS))]
+    if not dup_ids:
+        return 0
+    # Overrides first: the sub-select must still see the duplicate rows.
+    if _table_exists(conn, "bom_item_test_override"):
+        conn.execute(
+            text(f"DELETE FROM bom_item_test_override WHERE bom_item_id IN ({_DUPLICATE_BOM_ITEMS})")
+        )
+    conn.execute(text(f"DELETE FROM bomitem WHERE id IN ({_DUPLICATE_BOM_ITEMS})"))
+    logger.warning("Removed %d duplicate BOM item(s) before adding unique index", len(dup_ids))
+    return len(dup_ids)
+
+
+def _backfill_reference_keys(conn) -> int:
+    """Fill ``bomitem.reference_key`` left NULL by older writers."""
+
+    from .logic.designators import designator_sort_key
+
+    rows = conn.execute(
+        text('SELECT id, reference FROM "bomitem" WHERE reference_key IS NULL')
+    ).fetchall()
+    if rows:
+        conn.execute(
+            text('UPDATE "bomitem" SET reference_key = :key WHERE id = :id'),
+            [{"id": item_id, "key": designator_sort_key(ref or "")} for item_id, ref in rows],
+        )
+    return len(rows)
+
+
+def _ensure_bomitem_indexes(conn) -> List[str]:
+    """Create BOM item lookup indexes; return the names created."""
+
+    if not _table_exists(conn, "bomitem"):
+        return []
+    if _column_exists(conn, "bomitem", "reference_key"):
+        _backfill_reference_keys(conn)
+    created: List[str] = []
+    for name, columns, unique in _BOMITEM_INDEXES:
+        if _index_exists(conn, name):
+            continue
+        if not all(_column_exists(conn, "bomitem", c.strip()) for c in columns.split(",")):
+            continue
+        if unique:
+            _dedupe_bom_items(conn)
+        kind = "UNIQUE INDEX" if unique else "INDEX"
+        conn.execute(text(f'CREATE {kind} IF NOT EXISTS {name} ON "bomitem"({columns})'))
+        created.append(name)
+    return created
+
+
+_PART_KEY_INDEXES = ("ix_part_part_number_norm", "ix_part_part_number_base")
+
+
+def _backfill_part_number_keys(conn) -> int:
+    """Fill normalised/base part-number columns left NULL by older writers."""
+
+    from .logic.part_numbers import base_part_number, normalize_part_number
+
+    rows = conn.execute(
+        text('SELECT id, part_number FROM "part" WHERE part_number_norm IS NULL')
+    ).fetchall()
+    if rows:
+        conn.execute(
+            text('UPDATE "part" SET part_number_norm = :norm, part_number_base = :base WHERE id = :id'),
+            [
+                {"id": pid, "norm": normalize_part_number(pn), "base": base_part_number(pn)}
+                for pid, pn in rows
+            ],
+        )
+    return len(rows)
+
+
+def _ensure_part_number_keys(conn) -> List[str]:
+    """Backfill the part-number lookup keys and index them; return indexes created."""
+
+    if not _table_exists(conn, "part") or not _column_exists(conn, "part", "part_number_norm"):
+        return []
+    _backfill_part_number_keys(conn)
+    created: List[str] = []
+    for name in _PART_KEY_INDEXES:
+        if not _index_exists(conn, name):
+            column = name[len("ix_part_"):]
+            conn.execute(text(f'CREATE INDEX IF NOT EXISTS {name} ON "part"({column})'))
+            created.append(name)
+    return created
+
+
+# Trigram FTS5 index over the searchable part columns, kept in sync with
+# ``part`` by triggers.  External content: the index stores no copy of the
+# text, only the trigrams.
+PART_FTS_TABLE = "part_fts"
+PART_FTS_COLUMNS = (
+    "part_number",
+    "description",
+    "package",
+    "value",
+    "function",
+    "datasheet_url",
+    "product_url",
+)
+_PART_FTS_TRIGGER_COLUMNS = ", ".join(PART_FTS_COLUMNS)
+_PART_FTS_NEW = ", ".join(f"new.{c}" for c in PART_FTS_COLUMNS)
+_PART_FTS_OLD = ", ".join(f"old.{c}" for c in PART_FTS_COLUMNS)
+_PART_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {PART_FTS_TABLE} USING fts5("
+    f"{_PART_FTS_TRIGGER_COLUMNS}, content='part', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS part_fts_ai AFTER INSERT ON part BEGIN "
+    f"INSERT INTO {PART_FTS_TABLE}(rowid, {_PART_FTS_TRIGGER_COLUMNS}) "
+    f"VALUES (new.id, {_PART_FTS_NEW}); END",
+    f"CREATE TRIGGER IF NOT EXISTS part_fts_ad AFTER DELETE ON part BEGIN "
+    f"INSERT INTO {PART_FTS_TABLE}({PART_FTS_TABLE}, rowid, {_PART_FTS_TRIGGER_COLUMNS}) "
+    f"VALUES ('delete', old.id, {_PART_FTS_OLD}); END",
+    f"CREATE TRIGGER IF NOT EXISTS part_fts_au AFTER UPDATE OF id, {_PART_FTS_TRIGGER_COLUMNS} "
+    f"ON part BEGIN "
+    f"INSERT INTO {PART_FTS_TABLE}({PART_FTS_TABLE}, rowid, {_PART_FTS_TRIGGER_COLUMNS}) "
+    f"VALUES ('delete', old.id, {_PART_FTS_OLD}); "
+    f"INSERT INTO {PART_FTS_TABLE}(rowid, {_PART_FTS_TRIGGER_COLUMNS}) "
+    f"VALUES (new.id, {_PART_FTS_NEW}); END",
+)
+
+
+def _ensure_part_search_index(conn) -> bool:
+    """Create and populate the part FTS index; ``False`` if present or unsupported."""
+
+    if _table_exists(conn, PART_FTS_TABLE) or not _table_exists(conn, "part"):
+        return False
+    if not all(_column_exists(conn, "part", c) for c in PART_FTS_COLUMNS):
+        return False
+    try:
+        conn.execute(text(_PART_FTS_DDL[0]))
+    except Exception:  # pragma: no cover - SQLite built without FTS5/trigram (< 3.34)
+        logger.warning("SQLite lacks FTS5 trigram support; part search stays unindexed")
+        return False
+    for ddl in _PART_FTS_DDL[1:]:
+        conn.execute(text(ddl))
+    conn.execute(text(f"INSERT INTO {PART_FTS_TABLE}({PART_FTS_TABLE}) VALUES ('rebuild')"))
+    return True
+
+
+def migration_spec() -> str:
+    """Describe every column, index and FTS object these migrations create.
+
+    Part of the schema fingerprint: any change here invalidates stamps
+    recorded by older builds.
+    """
+
+    return "\n".join(
+        (
+            repr(sorted(_MIGRATIONS.items())),
+            repr(_BOMITEM_INDEXES),
+            repr(_PART_FTS_DDL),
+        )
+    )
+
+
 def _missing_columns(conn, table: str, columns: dict[str, str]) -> List[Tuple[str, str, str]]:
     """Return list of (table, column, ddl) for missing columns."""
     exists = conn.execute(
@@ -250,6 +433,9 @@ def run_sqlite_safe_migrations(engine: Engine) -> List[Tuple[str, str]]:
                 applied.append((_table, column))
                 logger.info("Added column %s.%s", _table, column)
 
+        for name in _ensure_bomitem_indexes(conn):
+            applied.append(("bomitem", name))
+
         if _column_exists(conn, "part", "part_number"):
             conn.execute(
                 text(
@@ -257,4 +443,10 @@ def run_sqlite_safe_migrations(engine: Engine) -> List[Tuple[str, str]]:
                 )
             )
 
+        for name in _ensure_part_number_keys(conn):
+            applied.append(("part", name))
+
+        if _ensure_part_search_index(conn):
+            applied.append((PART_FTS_TABLE, "create"))
+
     return applied
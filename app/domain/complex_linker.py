@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Literal, Optional
+from typing import Any, Literal, Mapping, Optional
 
 from sqlmodel import Field, SQLModel, Session, select
 
@@ -22,6 +23,7 @@ from app.integration.ce_bridge_linker import (
 )
 from app.integration.ce_supervisor import CEBridgeError
 from app.models import PartTestAssignment, TestMethod
+from app.services._sql import chunked
 
 logger = logging.getLogger(__name__)
 
@@ -311,3 +313,61 @@ def auto_link_by_pn(part_id: int, pn: str, limit: int = 10) -> bool:
         decision.trace_id,
     )
     return True
+
+
+def auto_link_parts(
+    parts: Mapping[int, str], *, max_workers: int = 4, limit: int = 10
+) -> dict[int, bool]:
+    """Auto-link many parts in one pass.
+
+    Parts that already have a :class:`ComplexLink` are skipped.  The bridge
+    state is probed once up front and the remaining part numbers are
+    resolved concurrently with at most ``max_workers`` in-flight searches.
+    Returns ``{part_id: linked}`` for the parts that were attempted.
+    """
+
+    targets = {pid: (pn or "").strip() for pid, pn in parts.items()}
+    targets = {pid: pn for pid, pn in targets.items() if pn}
+    if not targets:
+        return {}
+
+    session = _session()
+    try:
+        linked: set[int] = set()
+        for chunk in chunked(list(targets)):
+            linked.update(
+                session.exec(select(ComplexLink.part_id).where(ComplexLink.part_id.in_(chunk)))
+            )
+    finally:
+        session.close()
+    pending = {pid: pn for pid, pn in targets.items() if pid not in linked}
+    if not pending:
+        return {}
+
+    try:
+        ce_bridge_linker.probe_bridge_state()
+    except LinkerError as exc:
+        logger.info(
+            "Complex Editor bridge unavailable; skipped auto-link for %d parts: %s",
+            len(pending),
+            exc,
+        )
+        return {pid: False for pid in pending}
+
+    def _link(part_id: int, pn: str) -> bool:
+        try:
+            return auto_link_by_pn(part_id, pn, limit=limit)
+        except ce_bridge_client.CENetworkError:
+            logger.debug("Complex Editor bridge unavailable during auto-link for %s", pn)
+            return False
+
+    workers = max(1, min(max_workers, len(pending)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ce-autolink") as pool:
+        futures = {pid: pool.submit(_link, pid, pn) for pid, pn in pending.items()}
+    results = {pid: future.result() for pid, future in futures.items()}
+    if any(results.values()):
+        ce_bridge_linker.invalidate_bridge_state()
+    logger.info(
+        "Auto-linked %d of %d parts by PN", sum(results.values()), len(results)
+    )
+    return results
@@ -12,11 +12,11 @@ class FXRate(SQLModel, table=True):
 
 def get(code: str) -> float:
     code = code.upper()
-    from . import main
-    engine = main.engine
+    from . import database
+    engine = database.resolve_engine()
     with Session(engine) as session:
         stmt = select(FXRate).where(FXRate.code == code)
-        if engine.dialect.name == "postgresql":
+        if engine.dialect.name != "sqlite":
             stmt = stmt.with_for_update()
         rate_obj = session.exec(stmt).one_or_none()
         if rate_obj and datetime.utcnow() - rate_obj.fetched_at < timedelta(hours=FX_CACHE_HOURS):
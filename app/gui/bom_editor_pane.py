@@ -93,6 +93,7 @@ import subprocess, shutil, time, os
 from datetime import datetime
 from functools import partial
 from ..logic.autofill_rules import infer_from_pn_and_desc
+from ..logic.designators import compress_designators, iter_designators
 from ..logic.prefix_macros import load_prefix_macros
 from ..models import Assembly, TestMode, TestProfile
 from . import state as app_state
@@ -497,6 +498,7 @@ class BOMEditorPane(QWidget):
         # Track parts with an in-progress Auto Datasheet operation
         self._datasheet_loading: set[int] = set()
         self._test_assignments: Dict[int, dict] = {}
+        self._part_test_labels: Dict[int, services.PartTestLabels] = {}
         self._part_packages: Dict[int, Optional[str]] = {}
         self._dirty_packages: Dict[int, Optional[str]] = {}
         self._part_values: Dict[int, Optional[str]] = {}
@@ -1016,6 +1018,9 @@ QTableView::item:selected:hover {
         # Keep canonical raw rows
         with app_state.get_session() as session:
             self._rows_raw = services.get_joined_bom_for_assembly(session, self._assembly_id)
+            self._part_test_labels = services.load_part_test_labels(
+                session, {r.part_id for r in self._rows_raw}
+            )
             asm = session.get(Assembly, self._assembly_id)
         if asm is not None:
             mode_val = getattr(asm, "test_mode", TestMode.unpowered)
@@ -1103,6 +1108,28 @@ QTableView::item:selected:hover {
             return "test_method_powered", "test_detail_powered"
         return "test_method", "test_detail"
 
+    def _resolved_test(self, row: object, mode: TestMode) -> tuple[Optional[str], Optional[str]]:
+        """Return the resolved ``(method, detail)`` shown for ``row`` in ``mode``.
+
+        The resolver reports Quick test defaults as "Python code"; when the
+        effective test comes from the part's published defaults, use the
+        shared part label so the editor matches the Parts terminal.
+        """
+        method_key, detail_key = self._column_keys_for_mode(mode)
+        method = getattr(row, method_key, None)
+        detail = getattr(row, detail_key, None)
+        labels = self._part_test_labels.get(row.part_id)
+        if labels is None or row.test_resolution_source not in ("mapping", "fallback"):
+            return method, detail
+        effective = (
+            TestMode.powered
+            if self._assembly_mode == TestMode.powered and row.active_passive == "active"
+            else TestMode.unpowered
+        )
+        if mode == TestMode.powered and effective != TestMode.powered:
+            return method, detail
+        return labels.powered if effective == TestMode.powered else labels.unpowered
+
     def _assignment_view(self, assignment: dict, mode: TestMode) -> dict:
         method_key, detail_key, qt_key = self._assignment_keys_for_mode(mode)
         return {
@@ -1283,8 +1310,7 @@ QTableView::item:selected:hover {
 
         for part_id, rows in groups.items():
             # Aggregate references
-            refs_sorted = sorted((x.reference for x in rows), key=natural_key)
-            refs_str = ",".join(refs_sorted)
+            refs_str = compress_designators(x.reference for x in rows)
             # Determine value: use explicit if present, else auto-infer, then overlay staged
             explicit = next((x.active_passive for x in rows if getattr(x, "active_passive", None) in ("active", "passive")), None)
             mode_val = explicit or self._auto_infer(None, rows[0].reference)
@@ -1299,10 +1325,12 @@ QTableView::item:selected:hover {
                 mode_val == "active"
                 or any(getattr(x, "active_passive", None) == "active" for x in rows)
             )
-            resolved_powered_method = rows[0].test_method_powered if show_powered else ""
-            resolved_powered_detail = rows[0].test_detail_powered if show_powered else ""
-            method_item = self._make_method_item(rows[0].test_method, ta, TestMode.unpowered)
-            detail_item = self._make_detail_item(rows[0].test_detail, ta, TestMode.unpowered)
+            resolved_powered_method, resolved_powered_detail = (
+                self._resolved_test(rows[0], TestMode.powered) if show_powered else ("", "")
+            )
+            resolved_method, resolved_detail = self._resolved_test(rows[0], TestMode.unpowered)
+            method_item = self._make_method_item(resolved_method, ta, TestMode.unpowered)
+            detail_item = self._make_detail_item(resolved_detail, ta, TestMode.unpowered)
             row_items = [
                 QStandardItem(rows[0].part_number),
                 QStandardItem(refs_str),
@@ -1370,10 +1398,12 @@ QTableView::item:selected:hover {
             ta = self._get_assignment(r.part_id)
             powered_cols = "test_method_powered" in self._col_indices
             is_active = mode_val == "active" or getattr(r, "active_passive", None) == "active"
-            resolved_powered_method = r.test_method_powered if powered_cols and is_active else ""
-            resolved_powered_detail = r.test_detail_powered if powered_cols and is_active else ""
-            method_item = self._make_method_item(r.test_method, ta, TestMode.unpowered)
-            detail_item = self._make_detail_item(r.test_detail, ta, TestMode.unpowered)
+            resolved_powered_method, resolved_powered_detail = (
+                self._resolved_test(r, TestMode.powered) if powered_cols and is_active else ("", "")
+            )
+            resolved_method, resolved_detail = self._resolved_test(r, TestMode.unpowered)
+            method_item = self._make_method_item(resolved_method, ta, TestMode.unpowered)
+            detail_item = self._make_detail_item(resolved_detail, ta, TestMode.unpowered)
             items = [
                 QStandardItem(r.reference),
                 QStandardItem(r.part_number),
@@ -2063,7 +2093,7 @@ QTableView::item:selected:hover {
                 if not tm_text:
                     ref_text = str(proxy.data(proxy.index(r, ref_col)) or "")
                     if self._view_mode == "by_pn":
-                        first_ref = ref_text.split(",")[0].strip() if ref_text else ""
+                        first_ref = next(iter_designators(ref_text), "")
                     else:
                         first_ref = ref_text
                     macro = self._macro_for_reference(first_ref)
@@ -2278,12 +2308,34 @@ QTableView::item:selected:hover {
         ):
             return
         failures = []
-        for part_id, value in list(self._dirty_parts.items()):
+        # Part-level edits from every column go out as one bulk update.
+        edits: dict[int, dict[str, object]] = {}
+        for part_id, value in self._dirty_parts.items():
+            edits.setdefault(part_id, {})["active_passive"] = value
+        for part_id, pkg in self._dirty_packages.items():
+            edits.setdefault(part_id, {})["package"] = pkg or ""
+        for part_id, val in self._dirty_values.items():
+            edits.setdefault(part_id, {})["value"] = val or ""
+        for part_id, (tp, tn) in self._dirty_tolerances.items():
+            edits.setdefault(part_id, {}).update(tol_p=tp, tol_n=tn)
+        for part_id, desc in getattr(self, "_dirty_desc", {}).items():
+            edits.setdefault(part_id, {})["description"] = desc or ""
+        for part_id, link in self._dirty_links.items():
+            edits.setdefault(part_id, {})["product_url"] = link
+        for part_id, ds in self._dirty_datasheets.items():
+            if ds:
+                edits.setdefault(part_id, {})["datasheet_url"] = ds
+        failed: dict[int, str] = {}
+        if edits:
             try:
                 with app_state.get_session() as session:
-                    services.update_part_active_passive(session, part_id, value)
+                    failed = services.bulk_update_parts(session, edits).failed
             except Exception as exc:
-                failures.append(str(exc))
+                failed = {part_id: str(exc) for part_id in edits}
+        failures.extend(failed.values())
+
+        for part_id, value in list(self._dirty_parts.items()):
+            if part_id in failed:
                 # revert
                 old_val = self._parts_state.get(part_id, None)
                 for row in range(self.model.rowCount()):
@@ -2294,47 +2346,27 @@ QTableView::item:selected:hover {
                 self._parts_state[part_id] = value
                 del self._dirty_parts[part_id]
         for part_id, pkg in list(self._dirty_packages.items()):
-            try:
-                with app_state.get_session() as session:
-                    services.update_part_package(session, part_id, pkg or "")
-            except Exception as exc:
-                failures.append(str(exc))
-                old_val = self._part_packages.get(part_id, None)
-                self._fanout_part_field(part_id, "package", old_val)
+            if part_id in failed:
+                self._fanout_part_field(part_id, "package", self._part_packages.get(part_id, None))
             else:
                 self._part_packages[part_id] = pkg or None
                 del self._dirty_packages[part_id]
         for part_id, val in list(self._dirty_values.items()):
-            try:
-                with app_state.get_session() as session:
-                    services.update_part_value(session, part_id, val or "")
-            except Exception as exc:
-                failures.append(str(exc))
-                old_val = self._part_values.get(part_id, None)
-                self._fanout_part_field(part_id, "value", old_val)
+            if part_id in failed:
+                self._fanout_part_field(part_id, "value", self._part_values.get(part_id, None))
             else:
                 self._part_values[part_id] = val or None
                 del self._dirty_values[part_id]
         for part_id, (tp, tn) in list(self._dirty_tolerances.items()):
-            try:
-                with app_state.get_session() as session:
-                    services.update_part_tolerances(session, part_id, tp, tn)
-            except Exception as exc:
-                failures.append(str(exc))
+            if part_id in failed:
                 old = self._tolerances.get(part_id, (None, None))
                 self._fanout_part_field(part_id, "tol_p", old[0])
                 self._fanout_part_field(part_id, "tol_n", old[1])
             else:
                 self._tolerances[part_id] = (tp, tn)
                 del self._dirty_tolerances[part_id]
-        # Persist edited descriptions
-        for part_id, desc in list(getattr(self, "_dirty_desc", {}).items()):
-            try:
-                with app_state.get_session() as session:
-                    services.update_part_description(session, part_id, desc or "")
-            except Exception as exc:
-                failures.append(str(exc))
-            else:
+        for part_id in list(getattr(self, "_dirty_desc", {})):
+            if part_id not in failed:
                 del self._dirty_desc[part_id]
         # Persist edited manufacturers (apply to all BOM items for this part in this assembly)
         for part_id, mfg in list(getattr(self, "_dirty_mfg", {}).items()):
@@ -2353,29 +2385,26 @@ QTableView::item:selected:hover {
                 failures.append(str(exc))
             else:
                 self._dirty_tests.discard(part_id)
-        # Persist product links
+        # Product links were saved with the bulk update
         for part_id, link in list(self._dirty_links.items()):
-            try:
-                with app_state.get_session() as session:
-                    services.update_part_product_url(session, part_id, link)
-            except Exception as exc:
-                failures.append(str(exc))
-            else:
+            if part_id not in failed:
                 self._part_product_links[part_id] = link
                 del self._dirty_links[part_id]
-        # Persist datasheet add/removes
+        # Datasheet additions were saved with the bulk update; removals also
+        # delete the stored file
         for part_id, ds in list(self._dirty_datasheets.items()):
-            try:
-                with app_state.get_session() as session:
-                    if ds:
-                        services.update_part_datasheet_url(session, part_id, ds)
-                    else:
-                        services.remove_part_datasheet(session, part_id, delete_file=True)
-            except Exception as exc:
-                failures.append(str(exc))
+            if ds:
+                if part_id in failed:
+                    continue
             else:
-                self._part_datasheets[part_id] = ds or None
-                del self._dirty_datasheets[part_id]
+                try:
+                    with app_state.get_session() as session:
+                        services.remove_part_datasheet(session, part_id, delete_file=True)
+                except Exception as exc:
+                    failures.append(str(exc))
+                    continue
+            self._part_datasheets[part_id] = ds or None
+            del self._dirty_datasheets[part_id]
         if failures:
             QMessageBox.warning(self, "Save failed", "; ".join(failures))
         else:
@@ -2451,7 +2480,7 @@ QTableView::item:selected:hover {
             if isinstance(part_id, int):
                 part_scope.add(part_id)
             if self._view_mode == "by_pn":
-                ref_list = [x.strip() for x in str(refs or "").split(",") if x.strip()]
+                ref_list = list(iter_designators(str(refs or "")))
                 for ref in ref_list:
                     rows.append(
                         {
@@ -1,25 +1,26 @@
 from __future__ import annotations
 
-import re
 import sys
+from collections import OrderedDict
 from functools import partial
 from typing import Any, Callable
 
 from PySide6.QtCore import (
+    QAbstractTableModel,
     QItemSelection,
     QItemSelectionModel,
+    QModelIndex,
     QSettings,
     QSize,
     Qt,
-    QSortFilterProxyModel,
+    Signal,
     QTimer,
 )
 from PySide6.QtGui import (
     QDesktopServices,
     QKeySequence,
-    QStandardItem,
-    QStandardItemModel,
     QCloseEvent,
+    QShortcut,
 )
 from PySide6.QtWidgets import (
     QApplication,
@@ -32,7 +33,6 @@ from PySide6.QtWidgets import (
     QMainWindow,
     QMessageBox,
     QPushButton,
-    QShortcut,
     QSplitter,
     QTableView,
     QToolButton,
@@ -43,10 +43,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import QUrl
 from PySide6.QtWidgets import QAbstractItemView, QHeaderView
 
-from sqlmodel import select
-
 from .. import services
-from ..models import Part, PartType, PartTestMap, TestMode, TestProfile, PythonTest
+from ..models import Part, PartType
 from .state import get_session
 
 
@@ -69,45 +67,174 @@ COLUMNS = [
 ]
 
 
-def _natural_key(value: str) -> list[Any]:
-    parts = re.split(r"(\d+)", value)
-    key: list[Any] = []
-    for part in parts:
-        if part.isdigit():
-            key.append(int(part))
-        else:
-            key.append(part.lower())
-    return key
+PartRow = tuple[int, tuple[str, ...]]
+PartPage = Callable[[str, int, int, "str | None", bool], list[PartRow]]
+
+
+class PartsTableModel(QAbstractTableModel):
+    """Read-only parts table filled page by page through ``fetchMore``.
+
+    ``fetch_page(query, offset, limit, order_by, descending)`` returns
+    ``(part_id, cells)`` rows from the server-side search.  Only the
+    ``MAX_PAGES`` most recently used pages are kept; an evicted page is
+    fetched again when the view paints it, so memory stays bounded however
+    far the catalogue is scrolled.  Sorting is part of the search itself:
+    :meth:`sort` resets the model with the new order.  Fetch errors are
+    reported through :attr:`fetchFailed` rather than from inside Qt's
+    paint/scroll callbacks.
+    """
+
+    PAGE_SIZE = 200
+    MAX_PAGES = 10
+    # Column -> ``search_parts(order_by=...)`` key; test columns are not sortable.
+    SORT_FIELDS = (
+        "part_number",
+        "description",
+        "package",
+        "value",
+        "function",
+        "active_passive",
+        "datasheet_url",
+        "product_url",
+        "tol_p",
+        "tol_n",
+        "created_at",
+    )
+
+    fetchFailed = Signal(str)
+
+    def __init__(self, fetch_page: PartPage) -> None:
+        super().__init__()
+        self._fetch_page = fetch_page
+        self._query = ""
+        self._order_by: str | None = None
+        self._descending = False
+        self._pages: OrderedDict[int, list[PartRow]] = OrderedDict()
+        self._row_count = 0
+        self._exhausted = True
+        self._failed = False
+
+    def reset(self, query: str) -> None:
+        self.beginResetModel()
+        self._query = query
+        self._pages.clear()
+        self._row_count = 0
+        self._exhausted = False
+        self._failed = False
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def is_sortable(self, column: int) -> bool:
+        return column < len(self.SORT_FIELDS)
+
+    def sort_column(self) -> int:
+        return -1 if self._order_by is None else self.SORT_FIELDS.index(self._order_by)
+
+    def sort_order(self) -> Qt.SortOrder:
+        return Qt.SortOrder.DescendingOrder if self._descending else Qt.SortOrder.AscendingOrder
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:  # type: ignore[override]
+        if not self.is_sortable(column):
+            return
+        order_by = self.SORT_FIELDS[column] if column >= 0 else None
+        descending = order == Qt.SortOrder.DescendingOrder
+        if (order_by, descending) == (self._order_by, self._descending):
+            return
+        self._order_by, self._descending = order_by, descending
+        self.reset(self._query)
 
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else self._row_count
 
-class PartsProxyModel(QSortFilterProxyModel):
-    def __init__(self) -> None:
-        super().__init__()
-        self._filter_text = ""
-        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
-
-    def setFilterText(self, text: str) -> None:
-        self._filter_text = (text or "").strip().lower()
-        self.invalidateFilter()
-
-    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:  # type: ignore[override]
-        if not self._filter_text:
-            return True
-        model = self.sourceModel()
-        if model is None:
-            return True
-        index = model.index(source_row, 0, source_parent)
-        blob = index.data(Qt.ItemDataRole.UserRole + 1)
-        if not blob:
-            return True
-        return self._filter_text in str(blob)
-
-    def lessThan(self, left, right) -> bool:  # type: ignore[override]
-        left_data = left.data(Qt.ItemDataRole.DisplayRole)
-        right_data = right.data(Qt.ItemDataRole.DisplayRole)
-        left_str = str(left_data) if left_data is not None else ""
-        right_str = str(right_data) if right_data is not None else ""
-        return _natural_key(left_str) < _natural_key(right_str)
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:  # type: ignore[override]
+        if not index.isValid():
+            return None
+        row = self._row(index.row())
+        if row is None:
+            return None
+        part_id, cells = row
+        if role == Qt.ItemDataRole.DisplayRole:
+            return cells[index.column()]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return cells[index.column()] or None
+        if role == Qt.ItemDataRole.UserRole:
+            return part_id
+        return None
+
+    def headerData(self, section: int, orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:  # type: ignore[override]
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:  # type: ignore[override]
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:  # type: ignore[override]
+        if not self.canFetchMore(parent):
+            return
+        page_no = self._row_count // self.PAGE_SIZE
+        page = self._load(page_no)
+        if page is None or len(page) < self.PAGE_SIZE:
+            self._exhausted = True
+        if not page:
+            return
+        start = self._row_count
+        self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+        self._keep(page_no, page)
+        self._row_count += len(page)
+        self.endInsertRows()
+
+    def part_id(self, row: int) -> int | None:
+        found = self._row(row) if 0 <= row < self._row_count else None
+        return found[0] if found else None
+
+    def row_for_part(self, part_id: int) -> int | None:
+        """Row of ``part_id`` among the pages currently held, if any."""
+
+        for page_no, page in self._pages.items():
+            for offset, (pid, _cells) in enumerate(page):
+                if pid == part_id:
+                    return page_no * self.PAGE_SIZE + offset
+        return None
+
+    def _row(self, row: int) -> PartRow | None:
+        page_no, offset = divmod(row, self.PAGE_SIZE)
+        page = self._pages.get(page_no)
+        if page is None:
+            page = self._load(page_no)
+            if page is None:
+                return None
+            self._keep(page_no, page)
+        else:
+            self._pages.move_to_end(page_no)
+        return page[offset] if offset < len(page) else None
+
+    def _keep(self, page_no: int, page: list[PartRow]) -> None:
+        self._pages[page_no] = page
+        self._pages.move_to_end(page_no)
+        while len(self._pages) > self.MAX_PAGES:
+            self._pages.popitem(last=False)
+
+    def _load(self, page_no: int) -> list[PartRow] | None:
+        # One failure per reset: the view keeps repainting, so retrying on
+        # every paint would flood the user with the same error.
+        if self._failed:
+            return None
+        try:
+            return self._fetch_page(
+                self._query,
+                page_no * self.PAGE_SIZE,
+                self.PAGE_SIZE,
+                self._order_by,
+                self._descending,
+            )
+        except Exception as exc:
+            self._failed = True
+            self.fetchFailed.emit(str(exc))
+            return None
 
 
 class PartsTerminalWindow(QMainWindow):
@@ -123,7 +250,6 @@ class PartsTerminalWindow(QMainWindow):
         self._updating_form = False
         self._current_part_id: int | None = None
         self._current_original: dict[str, Any] | None = None
-        self._parts: list[Part] = []
 
         container = QWidget()
         layout = QVBoxLayout(container)
@@ -162,14 +288,18 @@ class PartsTerminalWindow(QMainWindow):
         splitter = QSplitter(Qt.Orientation.Horizontal)
         self._splitter = splitter
 
-        self.model = QStandardItemModel(0, len(COLUMNS))
-        self.model.setHorizontalHeaderLabels(COLUMNS)
-        self.proxy = PartsProxyModel()
-        self.proxy.setSourceModel(self.model)
+        self.model = PartsTableModel(self._fetch_part_rows)
+        # Queued: fetches run inside Qt's paint/scroll callbacks.
+        self.model.fetchFailed.connect(
+            self._on_fetch_failed, Qt.ConnectionType.QueuedConnection
+        )
 
         self.table = QTableView()
-        self.table.setModel(self.proxy)
+        self.table.setModel(self.model)
+        # No indicator means search relevance order; header clicks re-query.
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.table.setSortingEnabled(True)
+        self.table.horizontalHeader().sortIndicatorChanged.connect(self._on_sort_changed)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table.verticalHeader().setVisible(False)
@@ -329,36 +459,54 @@ class PartsTerminalWindow(QMainWindow):
 
     # ------------------------------------------------------------------
     def refresh_parts(self) -> None:
-        query = self.search_edit.text()
-        try:
-            parts = self._with_session(lambda s: services.search_parts(s, query, limit=500))
-        except Exception as exc:  # pragma: no cover - user feedback
-            QMessageBox.warning(self, "Search", str(exc))
-            return
         current_id = self._current_part_id
-        self._populate_table(parts)
-        self._set_status(f"{len(parts)} parts loaded")
+        self.model.reset(self.search_edit.text())
+        loaded = self.model.rowCount()
+        more = "+" if self.model.canFetchMore() else ""
+        self._set_status(f"{loaded}{more} parts loaded")
         if current_id and self._select_part(current_id):
             return
-        if parts:
-            first_id = parts[0].id
-            if first_id is not None:
-                self._select_part(first_id)
+        first_id = self.model.part_id(0)
+        if first_id is not None:
+            self._select_part(first_id)
         else:
             self._load_part(None)
 
     # ------------------------------------------------------------------
-    def _populate_table(self, parts: list[Part]) -> None:
-        self._parts = parts
-        self.model.removeRows(0, self.model.rowCount())
-        part_ids = [part.id for part in parts if part.id is not None]
-        part_types = {
-            pid: self._normalize_part_type(part.active_passive)
-            for part, pid in ((p, p.id) for p in parts if p.id is not None)
-        }
-        test_map = self._load_test_map_snapshot(part_ids, part_types)
-        for row, part in enumerate(parts):
-            part_id = part.id or -1
+    def _fetch_part_rows(
+        self, query: str, offset: int, limit: int, order_by: str | None, descending: bool
+    ) -> list[tuple[int, tuple[str, ...]]]:
+        return self._with_session(
+            lambda s: self._part_rows(
+                s,
+                services.search_parts(
+                    s, query, limit=limit, offset=offset, order_by=order_by, descending=descending
+                ),
+            )
+        )
+
+    def _on_fetch_failed(self, message: str) -> None:  # pragma: no cover - user feedback
+        QMessageBox.warning(self, "Search", message)
+
+    def _on_sort_changed(self, column: int, _order: Qt.SortOrder) -> None:
+        # Test-label columns cannot be sorted by the search; put the
+        # indicator back on the order the rows actually have.
+        if self.model.is_sortable(column):
+            return
+        header = self.table.horizontalHeader()
+        header.blockSignals(True)
+        header.setSortIndicator(self.model.sort_column(), self.model.sort_order())
+        header.blockSignals(False)
+
+    # ------------------------------------------------------------------
+    def _part_rows(self, session, parts: list[Part]) -> list[tuple[int, tuple[str, ...]]]:
+        test_labels = services.load_part_test_labels(
+            session, [part.id for part in parts if part.id is not None]
+        )
+        rows: list[tuple[int, tuple[str, ...]]] = []
+        for part in parts:
+            if part.id is None:
+                continue
             type_value = part.active_passive
             if isinstance(type_value, PartType):
                 type_label = type_value.value.capitalize()
@@ -366,13 +514,10 @@ class PartsTerminalWindow(QMainWindow):
                 type_label = type_value.capitalize()
             else:
                 type_label = ""
-            powered_method, powered_detail = test_map.get(part_id, {}).get(
-                TestMode.powered, ("", "")
-            )
-            unpowered_method, unpowered_detail = test_map.get(part_id, {}).get(
-                TestMode.unpowered, ("", "")
-            )
-            values = [
+            labels = test_labels.get(part.id)
+            powered_method, powered_detail = labels.powered if labels else ("", "")
+            unpowered_method, unpowered_detail = labels.unpowered if labels else ("", "")
+            values = (
                 part.part_number,
                 part.description or "",
                 part.package or "",
@@ -384,158 +529,30 @@ class PartsTerminalWindow(QMainWindow):
                 part.tol_p or "",
                 part.tol_n or "",
                 part.created_at.strftime("%Y-%m-%d %H:%M"),
-                powered_method or "",
-                powered_detail or "",
-                unpowered_method or "",
-                unpowered_detail or "",
-            ]
-            row_items: list[QStandardItem] = []
-            search_blob = " ".join(values).lower()
-            for col, value in enumerate(values):
-                item = QStandardItem(value)
-                item.setEditable(False)
-                if part.id is not None:
-                    item.setData(part.id, Qt.ItemDataRole.UserRole)
-                item.setData(search_blob, Qt.ItemDataRole.UserRole + 1)
-                if value:
-                    item.setToolTip(value)
-                row_items.append(item)
-            self.model.appendRow(row_items)
-        self.proxy.setFilterText(self.search_edit.text())
-        # Selection handling will toggle delete button
-
-    def _load_test_map_snapshot(
-        self,
-        part_ids: list[int],
-        part_types: dict[int, PartType | None],
-    ) -> dict[int, dict[TestMode, tuple[str, str]]]:
-        if not part_ids:
-            return {}
-
-        def loader(session):
-            rows = session.exec(
-                select(PartTestMap).where(PartTestMap.part_id.in_(part_ids))
-            ).all()
-            python_ids = {row.python_test_id for row in rows if row.python_test_id}
-            python_lookup: dict[int, PythonTest] = {}
-            if python_ids:
-                python_rows = session.exec(
-                    select(PythonTest).where(PythonTest.id.in_(python_ids))
-                ).all()
-                python_lookup = {row.id: row for row in python_rows}
-            grouped: dict[int, list[PartTestMap]] = {}
-            for row in rows:
-                grouped.setdefault(row.part_id, []).append(row)
-            result: dict[int, dict[TestMode, tuple[str, str]]] = {}
-            for part_id, entries in grouped.items():
-                part_type = part_types.get(part_id)
-                powered = self._select_mapping(entries, part_type, TestMode.powered)
-                unpowered = self._select_mapping(entries, part_type, TestMode.unpowered)
-                result[part_id] = {
-                    TestMode.powered: self._label_for_mapping(powered, python_lookup),
-                    TestMode.unpowered: self._label_for_mapping(unpowered, python_lookup),
-                }
-            return result
-
-        return self._with_session(loader)
-
-    def _normalize_part_type(self, value: Any) -> PartType | None:
-        if isinstance(value, PartType):
-            return value
-        if isinstance(value, str):
-            try:
-                return PartType(value)
-            except ValueError:
-                return None
-        return None
-
-    def _select_mapping(
-        self,
-        entries: list[PartTestMap],
-        part_type: PartType | None,
-        mode: TestMode,
-    ) -> PartTestMap | None:
-        if not entries:
-            return None
-        profiles = self._profile_order(part_type, mode)
-        candidates = [row for row in entries if row.power_mode == mode]
-        match = self._match_by_profile(candidates, profiles)
-        if match:
-            return match
-        if mode == TestMode.powered:
-            fallback_profiles = self._profile_order(part_type, TestMode.unpowered)
-            fallback_entries = [row for row in entries if row.power_mode == TestMode.unpowered]
-            return self._match_by_profile(fallback_entries, fallback_profiles)
-        return None
-
-    def _profile_order(
-        self, part_type: PartType | None, mode: TestMode
-    ) -> list[TestProfile]:
-        if part_type == PartType.passive:
-            return [TestProfile.PASSIVE, TestProfile.ACTIVE]
-        if mode == TestMode.powered:
-            return [TestProfile.ACTIVE, TestProfile.PASSIVE]
-        return [TestProfile.PASSIVE, TestProfile.ACTIVE]
-
-    def _match_by_profile(
-        self, entries: list[PartTestMap], order: list[TestProfile]
-    ) -> PartTestMap | None:
-        for profile in order:
-            for row in entries:
-                row_profile = self._normalize_profile(row.profile)
-                if row_profile == profile:
-                    return row
-        return entries[0] if entries else None
-
-    def _normalize_profile(self, value: Any) -> TestProfile | None:
-        if isinstance(value, TestProfile):
-            return value
-        if isinstance(value, str):
-            try:
-                return TestProfile(value)
-            except ValueError:
-                return None
-        return None
-
-    def _label_for_mapping(
-        self, mapping: PartTestMap | None, python_lookup: dict[int, PythonTest]
-    ) -> tuple[str, str]:
-        if mapping is None:
-            return "", ""
-        if mapping.python_test_id:
-            python_row = python_lookup.get(mapping.python_test_id)
-            name = (python_row.name or "").strip().lower() if python_row else ""
-            if name == "quick test":
-                method = "Quick test (QT)"
-            else:
-                method = "Python code"
-        elif mapping.test_macro_id:
-            method = "Macro"
-        else:
-            method = ""
-        detail = mapping.detail or ""
-        return method, detail
+                powered_method,
+                powered_detail,
+                unpowered_method,
+                unpowered_detail,
+            )
+            rows.append((part.id, values))
+        return rows
 
     # ------------------------------------------------------------------
     def _select_part(self, part_id: int) -> bool:
-        for row in range(self.model.rowCount()):
-            item = self.model.item(row, 0)
-            if item is None:
-                continue
-            item_id = item.data(Qt.ItemDataRole.UserRole)
-            if item_id == part_id:
-                source_index = self.model.index(row, 0)
-                proxy_index = self.proxy.mapFromSource(source_index)
-                if proxy_index.isValid():
-                    selection = QItemSelection(proxy_index, proxy_index)
-                    self.table.selectionModel().select(
-                        selection,
-                        QItemSelectionModel.SelectionFlag.ClearAndSelect
-                        | QItemSelectionModel.SelectionFlag.Rows,
-                    )
-                    self.table.scrollTo(proxy_index)
-                    return True
-        return False
+        row = self.model.row_for_part(part_id)
+        if row is None:
+            return False
+        index = self.model.index(row, 0)
+        if not index.isValid():
+            return False
+        selection = QItemSelection(index, index)
+        self.table.selectionModel().select(
+            selection,
+            QItemSelectionModel.SelectionFlag.ClearAndSelect
+            | QItemSelectionModel.SelectionFlag.Rows,
+        )
+        self.table.scrollTo(index)
+        return True
 
     # ------------------------------------------------------------------
     def _on_selection_changed(self, selected: QItemSelection, _deselected: QItemSelection) -> None:
@@ -543,17 +560,7 @@ class PartsTerminalWindow(QMainWindow):
         if not indexes:
             self._load_part(None)
             return
-        proxy_index = indexes[0]
-        source_index = self.proxy.mapToSource(proxy_index)
-        item = self.model.itemFromIndex(source_index)
-        if item is None:
-            self._load_part(None)
-            return
-        part_id = item.data(Qt.ItemDataRole.UserRole)
-        if part_id is None:
-            self._load_part(None)
-            return
-        self._load_part(part_id)
+        self._load_part(self.model.part_id(indexes[0].row()))
 
     # ------------------------------------------------------------------
     def _load_part(self, part_id: int | None) -> None:
@@ -564,7 +571,7 @@ class PartsTerminalWindow(QMainWindow):
             self._clear_form()
             self.delete_btn.setEnabled(False)
             return
-        part = next((p for p in self._parts if p.id == part_id), None)
+        part = self._with_session(lambda s: s.get(Part, part_id))
         if part is None:
             self._current_original = None
             self._set_form_enabled(False)
@@ -2,20 +2,21 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Callable, Iterable, Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal, QThread
 from sqlmodel import Session
 
-from ..database import new_session, ensure_schema
+from ..database import new_session
 from .. import services
 
 
-ensure_schema()
-
-
 def get_session() -> Session:
-    """Return a new database session bound to the configured engine."""
+    """Return a new database session bound to the configured engine.
+
+    The schema is verified on the first session rather than at import.
+    """
 
     return new_session()
 
@@ -87,16 +88,23 @@ class AppState(QObject):
             lambda: services.list_tasks(project_id, status, get_session()), self.tasksChanged
         )
 
-    def import_bom(self, assembly_id: int, data: bytes) -> None:
-        self._run(
-            lambda: services.import_bom(
-                assembly_id,
-                data,
-                get_session(),
-                progress_cb=lambda current, total: self.bomImportProgress.emit(
-                    current, total
-                ),
-            ),
-            self.bomImported,
-        )
+    def import_bom(self, assembly_id: int, source: bytes | str | Path) -> None:
+        """Import a BOM from raw bytes or a file path on a worker thread.
+
+        Paths are opened inside the worker so the file is streamed rather
+        than read into memory on the GUI thread.
+        """
+
+        def _import():
+            progress = lambda current, total: self.bomImportProgress.emit(current, total)
+            if isinstance(source, (bytes, bytearray)):
+                return services.import_bom(
+                    assembly_id, source, get_session(), progress_cb=progress
+                )
+            with open(source, "rb") as handle:
+                return services.import_bom(
+                    assembly_id, handle, get_session(), progress_cb=progress
+                )
+
+        self._run(_import, self.bomImported)
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+import os
 import re
 from pathlib import Path
 from typing import Optional
@@ -575,17 +576,14 @@ class AssembliesPane(QWidget):
         )
         if not path:
             return
-        self.import_btn.setEnabled(False)
-        try:
-            with open(path, "rb") as f:
-                data = f.read()
-        except Exception as e:
-            QMessageBox.warning(self, "Import BOM", f"Could not read file:\n{e}")
-            self.import_btn.setEnabled(True)
+        if not os.access(path, os.R_OK):
+            QMessageBox.warning(self, "Import BOM", f"Could not read file:\n{path}")
             return
+        self.import_btn.setEnabled(False)
         self._show_import_progress_dialog()
-        # Use AppState API which emits bomImported
-        self._state.import_bom(aid, data)
+        # Use AppState API which emits bomImported; the file is streamed
+        # from disk by the worker thread.
+        self._state.import_bom(aid, path)
 
     def _open_schematics(self) -> None:  # pragma: no cover - UI glue
         aid = (
@@ -1,5 +1,15 @@
-"""Integration client layer for external services."""
+"""Integration client layer for external services.
 
-from . import ce_bridge_linker  # noqa: F401
+Submodules are imported on first use so that importing one client does not
+load the whole bridge stack.
+"""
+
+import importlib
 
 __all__ = ["ce_bridge_linker"]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
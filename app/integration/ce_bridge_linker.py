@@ -5,6 +5,7 @@ High-level, ranked search and normalization diagnostics over the CE bridge.
 
 Public API (stable):
 - select_best_match(pn: str, *, limit: int = 50, timeout: float | None = None) -> LinkerDecision
+- probe_bridge_state(timeout: float | None = None) -> dict
 - fetch_normalization_info(timeout: float | None = None) -> dict
 
 Exceptions:
@@ -178,6 +179,28 @@ def _probe_state(trace_id: str, timeout: float) -> Dict[str, Any]:
     return payload
 
 
+def probe_bridge_state(timeout: float | None = None) -> Dict[str, Any]:
+    """Validate bridge features once and warm the ``/state`` cache.
+
+    Batch callers probe up front so the per-PN searches that follow reuse the
+    cached state instead of each issuing their own ``/state`` request.
+    """
+
+    return _probe_state(uuid.uuid4().hex, timeout or 0.0)
+
+
+def invalidate_bridge_state() -> None:
+    """Drop the cached ``/state`` payload so the next probe asks the bridge.
+
+    Batch writers call this once they have created links, so a re-run or a
+    GUI refresh sees the new links instead of a state up to
+    ``_STATE_CACHE_TTL`` seconds old.
+    """
+
+    global _STATE_CACHE
+    _STATE_CACHE = None
+
+
 @dataclass
 class LinkCandidate:
     """A single CE match candidate with analysis fields normalized for UI/logic."""
@@ -0,0 +1,225 @@
+"""Reference-designator range parsing, lazy expansion and compression.
+
+Accepted forms, freely mixed with comma, semicolon or whitespace separators::
+
+    R1            single designator
+    C1-C400       numeric range (``C1-400`` and ``U1:U8`` work too)
+    R10A-R10F     letter-suffix range on one designator (``R10A-F``)
+    R001-R010     zero padding is preserved
+
+Tokens that do not parse as a range (mismatched prefixes, free text) are
+passed through unchanged.  Expansion is lazy so panelised BOMs with
+thousands of placements never build intermediate lists per token.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Iterable, Iterator, Union
+
+_SEPARATORS = re.compile(r"[,;\s]+")
+_RANGE_GLUE = re.compile(r"\s*([-:])\s*")
+_DESIGNATOR = re.compile(r"^([A-Za-z]+)(\d+)([A-Za-z]?)$")
+_SPLIT_DIGITS = re.compile(r"(\d+)")
+
+
+@dataclass(frozen=True)
+class DesignatorSpan:
+    """Inclusive run ``prefix + start..stop`` or ``prefix + start + letters``."""
+
+    prefix: str
+    start: int
+    stop: int
+    width: int = 0
+    suffix_start: str = ""
+    suffix_stop: str = ""
+
+    def _number(self, value: int) -> str:
+        return str(value).zfill(self.width) if self.width else str(value)
+
+    def __iter__(self) -> Iterator[str]:
+        if self.suffix_start:
+            head = f"{self.prefix}{self._number(self.start)}"
+            for code in range(ord(self.suffix_start), ord(self.suffix_stop) + 1):
+                yield f"{head}{chr(code)}"
+        else:
+            for value in range(self.start, self.stop + 1):
+                yield f"{self.prefix}{self._number(value)}"
+
+    def __len__(self) -> int:
+        if self.suffix_start:
+            return ord(self.suffix_stop) - ord(self.suffix_start) + 1
+        return self.stop - self.start + 1
+
+    def __str__(self) -> str:
+        first = f"{self.prefix}{self._number(self.start)}{self.suffix_start}"
+        last = (
+            f"{self.prefix}{self._number(self.start)}{self.suffix_stop}"
+            if self.suffix_start
+            else f"{self.prefix}{self._number(self.stop)}"
+        )
+        return first if first == last else f"{first}-{last}"
+
+
+DesignatorToken = Union[str, DesignatorSpan]
+
+
+def _width(digits: str) -> int:
+    return len(digits) if len(digits) > 1 and digits.startswith("0") else 0
+
+
+def _parse_range(token: str) -> DesignatorSpan | None:
+    left, sep, right = token.partition("-")
+    if not sep:
+        left, sep, right = token.partition(":")
+    if not sep or not right:
+        return None
+    lm = _DESIGNATOR.match(left)
+    if lm is None:
+        return None
+    prefix, digits, suffix = lm.groups()
+
+    if suffix and len(right) == 1 and right.isalpha():
+        # ``R10A-F``: letters only on the right-hand side.
+        rprefix, rdigits, rsuffix = prefix, digits, right
+    else:
+        rm = _DESIGNATOR.match(right if right[0].isalpha() else prefix + right)
+        if rm is None:
+            return None
+        rprefix, rdigits, rsuffix = rm.groups()
+    if rprefix != prefix:
+        return None
+
+    width = _width(digits)
+    if suffix or rsuffix:
+        if not (suffix and rsuffix) or int(digits) != int(rdigits):
+            return None
+        lo, hi = sorted((suffix, rsuffix))
+        if lo.isupper() != hi.isupper():
+            return None
+        return DesignatorSpan(prefix, int(digits), int(digits), width, lo, hi)
+    lo_n, hi_n = sorted((int(digits), int(rdigits)))
+    return DesignatorSpan(prefix, lo_n, hi_n, width)
+
+
+def parse_designators(text: str) -> Iterator[DesignatorToken]:
+    """Yield literal designators and :class:`DesignatorSpan` runs from ``text``."""
+
+    for token in _SEPARATORS.split(_RANGE_GLUE.sub(r"\1", text or "")):
+        if not token:
+            continue
+        span = _parse_range(token)
+        yield token if span is None else span
+
+
+def iter_designators(text: str) -> Iterator[str]:
+    """Lazily expand ``text`` into individual designators."""
+
+    for token in parse_designators(text):
+        if isinstance(token, str):
+            yield token
+        else:
+            yield from token
+
+
+def count_designators(text: str) -> int:
+    """Return how many designators ``text`` expands to without expanding it."""
+
+    return sum(1 if isinstance(t, str) else len(t) for t in parse_designators(text))
+
+
+def designator_key(ref: str) -> list[object]:
+    """Natural sort key: ``R2`` before ``R10``."""
+
+    return [int(t) if t.isdigit() else t.lower() for t in _SPLIT_DIGITS.split(ref)]
+
+
+def designator_sort_key(ref: str) -> str:
+    """:func:`designator_key` as a string that sorts the same byte-wise.
+
+    Stored as ``BOMItem.reference_key`` so the database can page BOMs in
+    natural order.  Numbers become their digit count (two digits) followed by
+    the digits, so longer numbers sort after shorter ones; tokens are joined
+    by ``\x01``, which sorts before any printable character.
+    """
+
+    parts = []
+    for token in _SPLIT_DIGITS.split(ref):
+        if token.isdigit():
+            digits = token.lstrip("0") or "0"
+            parts.append(f"{len(digits):02d}{digits}")
+        else:
+            parts.append(token.lower())
+    return "\x01".join(parts)
+
+
+def _runs(refs: list[tuple[str, str, str, str]]) -> Iterator[list[tuple[str, str, str, str]]]:
+    """Split natural-sorted ``(ref, prefix, digits, suffix)`` rows into contiguous runs."""
+
+    run: list[tuple[str, str, str, str]] = []
+    for row in refs:
+        if run:
+            _, prefix, digits, suffix = run[-1]
+            _, n_prefix, n_digits, n_suffix = row
+            same_shape = n_prefix == prefix and _width(n_digits) == _width(digits)
+            if suffix or n_suffix:
+                contiguous = (
+                    same_shape
+                    and int(n_digits) == int(digits)
+                    and bool(suffix) and bool(n_suffix)
+                    and ord(n_suffix) == ord(suffix) + 1
+                )
+            else:
+                contiguous = same_shape and int(n_digits) == int(digits) + 1
+            if not contiguous:
+                yield run
+                run = []
+        run.append(row)
+    if run:
+        yield run
+
+
+def compress_designators(
+    refs: Iterable[str], *, separator: str = ",", min_run: int = 3
+) -> str:
+    """Collapse ``refs`` into a sorted, de-duplicated range string.
+
+    Runs of at least ``min_run`` consecutive designators become ``R1-R8``
+    (or ``R10A-R10F``); shorter runs and unparseable references are listed
+    individually.  The result round-trips through :func:`iter_designators`.
+    """
+
+    parts: list[str] = []
+    parsed: list[tuple[str, str, str, str]] = []
+    for ref in sorted({r.strip() for r in refs if r and r.strip()}, key=designator_key):
+        match = _DESIGNATOR.match(ref)
+        if match is None:
+            parts.append(ref)
+        else:
+            parsed.append((ref, *match.groups()))
+
+    # Group by shape so e.g. R001.. and R1.. never merge into one run.
+    def _shape(row: tuple[str, str, str, str]) -> tuple[str, int, bool]:
+        return row[1], _width(row[2]), bool(row[3])
+
+    for _, rows in groupby(sorted(parsed, key=lambda r: (_shape(r), designator_key(r[0]))), key=_shape):
+        for run in _runs(list(rows)):
+            if len(run) >= max(min_run, 2):
+                parts.append(f"{run[0][0]}-{run[-1][0]}")
+            else:
+                parts.extend(row[0] for row in run)
+    parts.sort(key=lambda p: designator_key(p.split("-", 1)[0]))
+    return separator.join(parts)
+
+
+__all__ = [
+    "DesignatorSpan",
+    "compress_designators",
+    "count_designators",
+    "designator_key",
+    "designator_sort_key",
+    "iter_designators",
+    "parse_designators",
+]
@@ -0,0 +1,33 @@
+"""Part-number normalisation shared by matching, import and search.
+
+``normalize_part_number`` drops case and punctuation so ``sn74hct-240n``
+and ``SN74HCT240N`` compare equal.  ``base_part_number`` additionally
+strips ordering suffixes: everything after the first ``-`` (``-20PU``)
+and trailing letters after the last digit run (package codes such as
+``N`` or ``AN``), so ``SN74HCT240N`` and ``SN74HCT240DW`` share the base
+``SN74HCT240``.
+"""
+
+from __future__ import annotations
+
+import re
+
+_NON_ALNUM = re.compile(r"[^A-Z0-9]+")
+_TRAILING_LETTERS = re.compile(r"^(.*?\d+)[A-Z]*$")
+
+
+def normalize_part_number(pn: str | None) -> str:
+    """Return ``pn`` upper-cased with everything but ``[A-Z0-9]`` removed."""
+
+    return _NON_ALNUM.sub("", (pn or "").upper())
+
+
+def base_part_number(pn: str | None) -> str:
+    """Return the normalised part number without ordering/package suffixes."""
+
+    base = normalize_part_number((pn or "").split("-")[0])
+    m = _TRAILING_LETTERS.match(base)
+    return m.group(1) if m else base
+
+
+__all__ = ["base_part_number", "normalize_part_number"]
@@ -15,6 +15,9 @@ from sqlalchemy import (
 )
 from sqlmodel import SQLModel, Field
 
+from .logic.designators import designator_sort_key
+from .logic.part_numbers import base_part_number, normalize_part_number
+
 if SQLModel.metadata.tables:
     SQLModel.metadata.clear()
 
@@ -122,6 +125,26 @@ class Part(SQLModel, table=True):
     tol_p: Optional[str] = Field(default=None, max_length=8)
     tol_n: Optional[str] = Field(default=None, max_length=8)
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Derived from part_number on every ORM write (see _sync_part_number_keys).
+    part_number_norm: Optional[str] = Field(default=None, index=True)
+    part_number_base: Optional[str] = Field(default=None, index=True)
+
+
+def part_number_keys(part_number: str | None) -> dict[str, str]:
+    """Column values of the normalised lookup keys for ``part_number``."""
+
+    return {
+        "part_number_norm": normalize_part_number(part_number),
+        "part_number_base": base_part_number(part_number),
+    }
+
+
+@sa.event.listens_for(Part, "before_insert")
+@sa.event.listens_for(Part, "before_update")
+def _sync_part_number_keys(_mapper, _connection, target: Part) -> None:
+    for key, value in part_number_keys(target.part_number).items():
+        if getattr(target, key) != value:
+            setattr(target, key, value)
 
 
 class TestMethod(str, Enum):
@@ -269,6 +292,14 @@ class BOMItemTestOverride(SQLModel, table=True):
 
 
 class BOMItem(SQLModel, table=True):
+    # The unique index also serves ``assembly_id``-only lookups (leftmost prefix).
+    __table_args__ = (
+        Index("ux_bomitem_assembly_reference", "assembly_id", "reference", unique=True),
+        Index("ix_bomitem_part_id", "part_id"),
+        # Keyset pagination in natural reference order (list_bom_items_page).
+        Index("ix_bomitem_assembly_reference_key", "assembly_id", "reference_key", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     assembly_id: int = Field(foreign_key="assembly.id")
     part_id: Optional[int] = Field(default=None, foreign_key="part.id")
@@ -281,6 +312,30 @@ class BOMItem(SQLModel, table=True):
     alt_part_number: Optional[str] = None
     is_fitted: bool = True
     notes: Optional[str] = None
+    # Derived from reference on every ORM write (see _sync_reference_key).
+    reference_key: Optional[str] = None
+
+
+@sa.event.listens_for(BOMItem, "before_insert")
+@sa.event.listens_for(BOMItem, "before_update")
+def _sync_reference_key(_mapper, _connection, target: BOMItem) -> None:
+    key = designator_sort_key(target.reference or "")
+    if target.reference_key != key:
+        target.reference_key = key
+
+
+class BOMChangeVersion(SQLModel, table=True):
+    """Counter bumped whenever data shown in an assembly's BOM changes.
+
+    ``assembly_id`` 0 is a global epoch for writes that cannot be attributed
+    to specific assemblies.
+    """
+
+    __tablename__ = "bom_change_version"
+    assembly_id: int = Field(
+        primary_key=True, sa_column_kwargs={"autoincrement": False}
+    )
+    version: int = Field(default=0, nullable=False)
 
 
 class TaskStatus(str, Enum):
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+
+from ..auth import get_current_user
+from ..models import User
+from ..services import ImportJob, ImportReport, get_import_job
+from ..services.import_jobs import JobStatus
+
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+class JobRead(BaseModel):
+    id: str
+    kind: str = "bom_import"
+    assembly_id: int
+    status: JobStatus
+    processed: int
+    total: int
+    report: Optional[ImportReport] = None
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+
+def serialize_job(job: ImportJob) -> JobRead:
+    return JobRead(
+        id=job.id,
+        assembly_id=job.assembly_id,
+        status=job.status,
+        processed=job.processed,
+        total=job.total,
+        report=job.report,
+        error=job.error,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+    )
+
+
+@router.get("/{job_id}", response_model=JobRead)
+def read_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+) -> JobRead:
+    job = get_import_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return serialize_job(job)
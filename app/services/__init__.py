@@ -4,10 +4,14 @@ This package exposes thin wrappers around common CRUD workflows used by
 both the desktop GUI and the forthcoming FastAPI layer.  Each function is
 UI agnostic and operates directly on a SQLModel ``Session`` instance.
 
-The modules re-export the most commonly used functions so existing imports
-like ``from app.services import import_bom`` continue to work.
+The package re-exports the most commonly used functions so existing imports
+like ``from app.services import import_bom`` continue to work.  Re-exports
+are resolved lazily on first access, so importing the package does not pull
+in PDF tooling, HTTP clients or the Complex Editor bridge until a service
+that needs them is used.
 """
 
+import importlib
 from decimal import Decimal
 
 from pydantic import BaseModel
@@ -34,165 +38,152 @@ class BOMItemRead(BaseModel):
     test_resolution_message: str | None = None
 
 
-from .customers import (
-    list_customers,
-    create_customer,
-    delete_customer,
-    DeleteBlockedError,
-)
-from .projects import list_projects, create_project, delete_project
-from .assemblies import (
-    list_assemblies,
-    list_bom_items,
-    create_assembly,
-    delete_assembly,
-    delete_bom_items,
-    delete_bom_items_for_part,
-    update_bom_item_manufacturer,
-    update_manufacturer_for_part_in_assembly,
-    update_assembly_test_mode,
-)
-from .tasks import list_tasks
-from .bom_import import ImportReport, validate_headers, import_bom
-from .bom_read_models import JoinedBOMRow, get_joined_bom_for_assembly
-from .parts import (
-    create_part,
-    search_parts,
-    update_part,
-    count_part_references,
-    unlink_part_from_boms,
-    delete_part,
-    update_part_active_passive,
-    update_part_datasheet_url,
-    update_part_product_url,
-    update_part_description_if_empty,
-    update_part_description,
-    remove_part_datasheet,
-    update_part_function,
-    update_part_package,
-    update_part_value,
-    update_part_tolerances,
-    clear_part_datasheet,
-)
-from .export_viva import (
-    VIVABOMLine,
-    VIVAExportDiagnostics,
-    VIVAExportOutcome,
-    VIVAExportPaths,
-    VIVAMissingComplex,
-    VIVAExportValidationError,
-    build_export_folder_name,
-    build_export_paths,
-    build_viva_groups,
-    collect_bom_lines,
-    determine_comp_ids,
-    perform_viva_export,
-    sanitize_token,
-    write_viva_txt,
-)
-from .bom_to_ce_export import export_bom_to_ce_bridge
-from .datasheets import (
-    DATASHEET_STORE,
-    sha256_of_file,
-    canonical_path_for_hash,
-    ensure_store_dirs,
-    register_datasheet_for_part,
-)
-from .test_defaults import (
-    upsert_part_test_map,
-    upsert_python_test,
-    upsert_test_macro,
-)
-from .schematics import (
-    SchematicFileInfo,
-    SchematicPackInfo,
-    list_schematic_packs,
-    create_schematic_pack,
-    get_pack_detail,
-    rename_schematic_pack,
-    add_schematic_file_from_path,
-    add_schematic_files_from_uploads,
-    replace_schematic_file_from_path,
-    remove_schematic_file,
-    reorder_schematic_files,
-    mark_schematic_file_reindexed,
-)
+_LAZY_EXPORTS: dict[str, tuple[str, ...]] = {
+    "customers": (
+        "list_customers",
+        "create_customer",
+        "delete_customer",
+        "DeleteBlockedError",
+    ),
+    "projects": (
+        "list_projects",
+        "create_project",
+        "delete_project",
+    ),
+    "assemblies": (
+        "BOMItemPage",
+        "list_assemblies",
+        "list_bom_items",
+        "list_bom_items_page",
+        "create_assembly",
+        "delete_assembly",
+        "delete_bom_items",
+        "delete_bom_items_for_part",
+        "update_bom_item_manufacturer",
+        "update_manufacturer_for_part_in_assembly",
+        "update_assembly_test_mode",
+    ),
+    "tasks": (
+        "list_tasks",
+    ),
+    "bom_import": (
+        "HeaderMatch",
+        "ImportDiff",
+        "ImportReport",
+        "import_bom",
+        "match_headers",
+        "validate_headers",
+    ),
+    "import_jobs": (
+        "ImportJob",
+        "submit_import_job",
+        "get_import_job",
+    ),
+    "bom_versions": (
+        "bump_bom_versions",
+        "get_bom_version",
+    ),
+    "bom_read_models": (
+        "BulkTestResolution",
+        "JoinedBOMRow",
+        "get_joined_bom_for_assembly",
+        "resolve_tests_bulk",
+    ),
+    "test_coverage": (
+        "CoverageBucket",
+        "CoverageSummary",
+        "get_test_coverage",
+    ),
+    "parts": (
+        "create_part",
+        "search_parts",
+        "update_part",
+        "bulk_update_parts",
+        "BulkPartUpdateResult",
+        "count_part_references",
+        "unlink_part_from_boms",
+        "delete_part",
+        "update_part_active_passive",
+        "update_part_datasheet_url",
+        "update_part_product_url",
+        "update_part_description_if_empty",
+        "update_part_description",
+        "remove_part_datasheet",
+        "update_part_function",
+        "update_part_package",
+        "update_part_value",
+        "update_part_tolerances",
+        "clear_part_datasheet",
+    ),
+    "export_viva": (
+        "VIVABOMLine",
+        "VIVAExportDiagnostics",
+        "VIVAExportOutcome",
+        "VIVAExportPaths",
+        "VIVAMissingComplex",
+        "VIVAExportValidationError",
+        "build_export_folder_name",
+        "build_export_paths",
+        "build_viva_groups",
+        "collect_bom_lines",
+        "determine_comp_ids",
+        "perform_viva_export",
+        "sanitize_token",
+        "write_viva_txt",
+    ),
+    "bom_to_ce_export": (
+        "export_bom_to_ce_bridge",
+    ),
+    "datasheets": (
+        "DATASHEET_STORE",
+        "sha256_of_file",
+        "canonical_path_for_hash",
+        "ensure_store_dirs",
+        "register_datasheet_for_part",
+    ),
+    "part_test_labels": (
+        "PartTestLabels",
+        "load_part_test_labels",
+    ),
+    "test_defaults": (
+        "upsert_part_test_map",
+        "upsert_python_test",
+        "upsert_test_macro",
+    ),
+    "schematics": (
+        "SchematicFileInfo",
+        "SchematicPackInfo",
+        "list_schematic_packs",
+        "create_schematic_pack",
+        "get_pack_detail",
+        "rename_schematic_pack",
+        "add_schematic_file_from_path",
+        "add_schematic_files_from_uploads",
+        "replace_schematic_file_from_path",
+        "remove_schematic_file",
+        "reorder_schematic_files",
+        "mark_schematic_file_reindexed",
+    ),
+}
 
-__all__ = [
-    "list_customers",
-    "create_customer",
-    "list_projects",
-    "create_project",
-    "delete_project",
-    "list_assemblies",
-    "list_bom_items",
-    "create_assembly",
-    "delete_assembly",
-    "delete_bom_items",
-    "delete_bom_items_for_part",
-    "update_assembly_test_mode",
-    "update_bom_item_manufacturer",
-    "update_manufacturer_for_part_in_assembly",
-    "delete_customer",
-    "DeleteBlockedError",
-    "list_tasks",
-    "BOMItemRead",
-    "ImportReport",
-    "validate_headers",
-    "import_bom",
-    "JoinedBOMRow",
-    "get_joined_bom_for_assembly",
-    "create_part",
-    "search_parts",
-    "update_part",
-    "count_part_references",
-    "unlink_part_from_boms",
-    "delete_part",
-    "update_part_active_passive",
-    "update_part_datasheet_url",
-    "update_part_product_url",
-    "update_part_description_if_empty",
-    "update_part_description",
-    "remove_part_datasheet",
-    "update_part_function",
-    "update_part_package",
-    "update_part_value",
-    "update_part_tolerances",
-    "clear_part_datasheet",
-    "VIVABOMLine",
-    "VIVAExportDiagnostics",
-    "VIVAExportOutcome",
-    "VIVAExportPaths",
-    "VIVAMissingComplex",
-    "VIVAExportValidationError",
-    "build_export_folder_name",
-    "build_export_paths",
-    "build_viva_groups",
-    "collect_bom_lines",
-    "determine_comp_ids",
-    "perform_viva_export",
-    "sanitize_token",
-    "write_viva_txt",
-    "export_bom_to_ce_bridge",
-    "DATASHEET_STORE",
-    "sha256_of_file",
-    "canonical_path_for_hash",
-    "ensure_store_dirs",
-    "register_datasheet_for_part",
-    "upsert_part_test_map",
-    "upsert_python_test",
-    "upsert_test_macro",
-    "SchematicFileInfo",
-    "SchematicPackInfo",
-    "list_schematic_packs",
-    "create_schematic_pack",
-    "get_pack_detail",
-    "rename_schematic_pack",
-    "add_schematic_file_from_path",
-    "add_schematic_files_from_uploads",
-    "replace_schematic_file_from_path",
-    "remove_schematic_file",
-    "reorder_schematic_files",
-    "mark_schematic_file_reindexed",
-]
+_EXPORT_MODULES = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
 
+# Imported eagerly: it registers the session hooks that keep BOM change
+# versions (ETags, resolved-test cache) correct for every write.
+from . import bom_versions  # noqa: E402,F401
+
+
+def __getattr__(name: str):
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORT_MODULES))
+
+
+__all__ = ["BOMItemRead", *_EXPORT_MODULES]
@@ -0,0 +1,44 @@
+"""Batched SQL helpers shared by the bulk import and edit services."""
+
+from __future__ import annotations
+
+from typing import Any, Iterator, Mapping, Sequence, TypeVar
+
+from sqlalchemy import bindparam, update as sa_update
+from sqlmodel import Session
+
+T = TypeVar("T")
+
+# Ids/values per ``IN (...)`` list; keeps every statement well under
+# SQLite's bound-parameter limit.
+PARAM_CHUNK = 500
+
+
+def chunked(values: Sequence[T], size: int = PARAM_CHUNK) -> Iterator[Sequence[T]]:
+    """Yield consecutive slices of ``values`` holding at most ``size`` items."""
+
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def bulk_update_by_id(session: Session, table, updates: Mapping[int, dict[str, Any]]) -> None:
+    """Apply ``{row_id: {column: value}}`` updates with one executemany per column set."""
+
+    grouped: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for row_id, values in updates.items():
+        if not values:
+            continue
+        keys = tuple(sorted(values))
+        params = {f"v_{k}": v for k, v in values.items()}
+        params["b_id"] = row_id
+        grouped.setdefault(keys, []).append(params)
+    for keys, params in grouped.items():
+        stmt = (
+            sa_update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values({k: bindparam(f"v_{k}") for k in keys})
+        )
+        session.execute(stmt, params)
+
+
+__all__ = ["PARAM_CHUNK", "bulk_update_by_id", "chunked"]
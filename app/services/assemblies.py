@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+import base64
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from pydantic import BaseModel
+from sqlalchemy import tuple_
 from sqlalchemy.exc import OperationalError
 from sqlmodel import Session, select
 
-from ..models import Assembly, BOMItem, Part, PartType, TestMode
+from ..logic.designators import designator_sort_key
+from ..models import Assembly, BOMItem, PartType, TestMode
 from . import BOMItemRead
-from .test_resolution import BOMTestResolver
+from .bom_read_models import BOMSnapshot, load_bom_snapshot
 
 
 def list_assemblies(project_id: int, session: Session) -> List[Assembly]:
@@ -26,67 +31,157 @@ def list_assemblies(project_id: int, session: Session) -> List[Assembly]:
         ) from e
 
 
+_ITEM_READ_FIELDS = (
+    "id",
+    "assembly_id",
+    "part_id",
+    "reference",
+    "qty",
+    "manufacturer",
+    "unit_cost",
+    "currency",
+    "datasheet_url",
+    "alt_part_number",
+    "is_fitted",
+    "notes",
+)
+
+
+def _build_bom_item_reads(snapshot: BOMSnapshot, *, resolve: bool = True) -> List[BOMItemRead]:
+    mode = snapshot.test_mode
+    resolve_test = snapshot.resolver.resolve_effective_test
+    results: list[BOMItemRead] = []
+    for item, part in snapshot.rows:
+        data = dict(zip(_ITEM_READ_FIELDS, item))
+        data["part_number"] = part.part_number if part is not None else None
+        if resolve:
+            resolved = resolve_test(item.id, mode)
+            data.update(
+                {
+                    "test_method": resolved.method,
+                    "test_detail": resolved.detail,
+                    "test_resolution_source": resolved.source,
+                    "test_resolution_message": resolved.message,
+                }
+            )
+            part_type = part.active_passive if part is not None else None
+            if isinstance(part_type, str) and not isinstance(part_type, PartType):
+                try:
+                    part_type = PartType(part_type)
+                except ValueError:
+                    part_type = None
+            if mode == TestMode.powered and part_type == PartType.active:
+                data["test_method_powered"] = resolved.powered_method
+                data["test_detail_powered"] = resolved.powered_detail
+        results.append(BOMItemRead.model_validate(data))
+    return results
+
+
 def list_bom_items(assembly_id: int, session: Session) -> List[BOMItemRead]:
     """Return BOM items for an assembly with the related ``part_number``."""
 
-    stmt = (
-        select(BOMItem, Part)
-        .join(Part, Part.id == BOMItem.part_id, isouter=True)
-        .where(BOMItem.assembly_id == assembly_id)
-    )
     try:
-        rows = session.exec(stmt).all()
+        snapshot = load_bom_snapshot(session, assembly_id)
     except OperationalError as e:  # pragma: no cover - depends on DB schema
         raise RuntimeError(
             "BOM items query failed; run 'python -m app.tools.db migrate'. Details: "
             f"{e}"
         ) from e
+    return _build_bom_item_reads(snapshot)
 
-    assembly = session.get(Assembly, assembly_id)
-    resolver = BOMTestResolver.from_session(session, assembly_id, rows)
-    assembly_mode = TestMode.unpowered
-    if assembly is not None:
-        mode_val = getattr(assembly, "test_mode", None)
-        if isinstance(mode_val, TestMode):
-            assembly_mode = mode_val
-        elif isinstance(mode_val, str):
-            try:
-                assembly_mode = TestMode(mode_val)
-            except ValueError:
-                assembly_mode = TestMode.unpowered
-    results: list[BOMItemRead] = []
-    for item, part in rows:
-        pn = part.part_number if part is not None else None
-        resolved = resolver.resolve_effective_test(item.id, assembly_mode)
-        part_type = None
-        if part is not None:
-            part_type = getattr(part, "active_passive", None)
-            if isinstance(part_type, str):
-                try:
-                    part_type = PartType(part_type)
-                except ValueError:
-                    part_type = None
-        data = item.model_dump()
-        data.update(
-            {
-                "part_number": pn,
-                "test_method": resolved.method,
-                "test_detail": resolved.detail,
-                "test_method_powered": None,
-                "test_detail_powered": None,
-                "test_resolution_source": resolved.source,
-                "test_resolution_message": resolved.message,
-            }
+
+BOM_ITEM_FIELDS: tuple[str, ...] = tuple(BOMItemRead.model_fields)
+DEFAULT_BOM_PAGE_SIZE = 200
+MAX_BOM_PAGE_SIZE = 1000
+_RESOLVED_FIELDS = frozenset(
+    {
+        "test_method",
+        "test_detail",
+        "test_method_powered",
+        "test_detail_powered",
+        "test_resolution_source",
+        "test_resolution_message",
+    }
+)
+
+
+class BOMItemPage(BaseModel):
+    """One keyset page of BOM items, optionally projected to ``fields``."""
+
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+
+def _encode_cursor(reference: str, item_id: int) -> str:
+    raw = json.dumps([reference, item_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        reference, item_id = json.loads(raw)
+        return str(reference), int(item_id)
+    except Exception as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def list_bom_items_page(
+    assembly_id: int,
+    session: Session,
+    *,
+    limit: int = DEFAULT_BOM_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> BOMItemPage:
+    """Return a page of BOM items in natural reference order.
+
+    ``cursor`` is the opaque ``next_cursor`` of the previous page; paging is
+    keyset based on ``(reference_key, id)`` (the stored
+    :func:`~app.logic.designators.designator_sort_key`), so each page is one
+    indexed range query and concurrent inserts or deletes do not shift later
+    pages.  Only the page's rows are loaded and resolved, and test
+    resolution is skipped entirely when ``fields`` excludes it.
+    Raises ``ValueError`` for an invalid cursor or unknown field names.
+    """
+
+    if fields is not None:
+        unknown = [f for f in fields if f not in BOM_ITEM_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    limit = max(1, min(int(limit), MAX_BOM_PAGE_SIZE))
+
+    stmt = select(BOMItem.id, BOMItem.reference).where(BOMItem.assembly_id == assembly_id)
+    if cursor:
+        after_ref, after_id = _decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(BOMItem.reference_key, BOMItem.id)
+            > tuple_(designator_sort_key(after_ref), after_id)
         )
-        if (
-            assembly_mode == TestMode.powered
-            and isinstance(part_type, PartType)
-            and part_type == PartType.active
-        ):
-            data["test_method_powered"] = resolved.powered_method
-            data["test_detail_powered"] = resolved.powered_detail
-        results.append(BOMItemRead(**data))
-    return results
+    # One extra row tells whether another page follows.
+    rows = session.exec(
+        stmt.order_by(BOMItem.reference_key, BOMItem.id).limit(limit + 1)
+    ).all()
+    page = rows[:limit]
+    page_ids = [item_id for item_id, _ in page]
+
+    resolve = fields is None or bool(_RESOLVED_FIELDS.intersection(fields))
+    snapshot = load_bom_snapshot(
+        session, assembly_id, item_ids=page_ids, resolve=resolve
+    )
+    position = {item_id: idx for idx, item_id in enumerate(page_ids)}
+    snapshot.rows.sort(key=lambda row: position[row[0].id])
+    reads = _build_bom_item_reads(snapshot, resolve=resolve)
+    include = set(fields) if fields is not None else None
+
+    next_cursor = None
+    if len(rows) > limit:
+        last_id, last_ref = page[-1]
+        next_cursor = _encode_cursor(last_ref, last_id)
+    return BOMItemPage(
+        items=[read.model_dump(include=include) for read in reads],
+        next_cursor=next_cursor,
+    )
 
 
 def create_assembly(
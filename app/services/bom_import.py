@@ -5,32 +5,70 @@ from __future__ import annotations
 import csv
 import io
 import re
-import shutil
 import logging
+from dataclasses import dataclass, field
 from decimal import Decimal
-from pathlib import Path
-from typing import Callable, List
+from functools import lru_cache
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from pydantic import BaseModel, Field, validator
 from sqlmodel import Session, select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import insert as sa_insert
 
-from ..models import Assembly, BOMItem, Part, PartType
-from ..config import DATASHEETS_DIR, get_complex_editor_settings
-from ..domain.complex_linker import auto_link_by_pn
-from ..integration.ce_bridge_client import CENetworkError
-from ..integration.ce_supervisor import CEBridgeError, ensure_ready
+from ..logic.designators import designator_sort_key, iter_designators
+from ..logic.part_numbers import normalize_part_number
+from ..models import Assembly, BOMItem, Part, PartType, part_number_keys
+from ..config import get_bom_header_aliases, get_complex_editor_settings
+from ._sql import PARAM_CHUNK, bulk_update_by_id, chunked
+from .bom_versions import bulk_write, bump_bom_versions
+from .datasheet_downloads import normalize_datasheet_source, schedule_datasheet_downloads
 
 
 logger = logging.getLogger(__name__)
 
 
+class HeaderMatch(BaseModel):
+    """How one input column was mapped; ``field`` is ``None`` when ignored."""
+
+    index: int
+    header: str
+    field: str | None = None
+    alias: str | None = None
+    sheet: str | None = None
+
+
+class ImportDiff(BaseModel):
+    """What an import would change, keyed by part number / reference."""
+
+    new_parts: List[str] = Field(default_factory=list)
+    updated_parts: List[str] = Field(default_factory=list)
+    inserted_items: List[str] = Field(default_factory=list)
+    updated_items: List[str] = Field(default_factory=list)
+    unchanged_items: List[str] = Field(default_factory=list)
+    # Existing references absent from the file; imports leave them in place.
+    missing_items: List[str] = Field(default_factory=list)
+
+
 class ImportReport(BaseModel):
     total: int
     matched: int
     unmatched: int
     created_task_ids: List[int] = Field(default_factory=list)
     errors: List[str] = Field(default_factory=list)
+    columns: List[HeaderMatch] = Field(default_factory=list)
+    diff: ImportDiff | None = None
+    sheet: str | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -58,23 +96,81 @@ HEADER_MAP = {
 }
 
 
-def validate_headers(headers: List[str]) -> dict[str, int]:
-    """Validate headers and return a mapping of canonical name to index."""
-
-    col_map: dict[str, int] = {}
-    for idx, h in enumerate(headers):
-        hn = _norm(h)
-        for canon, variants in HEADER_MAP.items():
-            norm_set = {_norm(canon)} | {_norm(v) for v in variants}
-            if hn in norm_set and canon not in col_map:
-                col_map[canon] = idx
+# normalized header -> candidate (canonical field, alias) pairs in priority order
+_HeaderLookup = dict[str, tuple[tuple[str, str], ...]]
+_AliasKey = tuple[tuple[str, tuple[str, ...]], ...]
+
+
+@lru_cache(maxsize=8)
+def _compile_header_lookup(extra: _AliasKey = ()) -> _HeaderLookup:
+    """Compile ``HEADER_MAP`` plus ``extra`` aliases into a normalized lookup.
+
+    Built-in aliases come first so settings can add names but never steal
+    one from another field.  A normalized name may still map to several
+    fields (``Tolerance+``/``Tolerance-``); repeated columns then fill them
+    in order.
+    """
+
+    lookup: dict[str, list[tuple[str, str]]] = {}
+
+    def _add(canon: str, alias: str) -> None:
+        key = _norm(alias)
+        if not key:
+            return
+        candidates = lookup.setdefault(key, [])
+        if all(c != canon for c, _ in candidates):
+            candidates.append((canon, alias))
+
+    for canon, variants in HEADER_MAP.items():
+        _add(canon, canon)
+        for variant in sorted(variants):
+            _add(canon, variant)
+    for canon, aliases in extra:
+        if canon not in HEADER_MAP:
+            logger.warning("Ignoring header aliases for unknown BOM field %r", canon)
+            continue
+        for alias in aliases:
+            _add(canon, alias)
+    return {key: tuple(candidates) for key, candidates in lookup.items()}
+
+
+def _header_lookup() -> _HeaderLookup:
+    extra = get_bom_header_aliases()
+    key = tuple(sorted((canon, tuple(aliases)) for canon, aliases in extra.items()))
+    return _compile_header_lookup(key)
+
+
+def match_headers(headers: Sequence[str], *, sheet: str | None = None) -> list[HeaderMatch]:
+    """Map each header to a canonical field, recording the alias that matched."""
+
+    lookup = _header_lookup()
+    taken: set[str] = set()
+    matches: list[HeaderMatch] = []
+    for idx, header in enumerate(headers):
+        match = HeaderMatch(index=idx, header=header, sheet=sheet)
+        for canon, alias in lookup.get(_norm(header), ()):
+            if canon not in taken:
+                taken.add(canon)
+                match.field, match.alias = canon, alias
                 break
+        matches.append(match)
+    return matches
+
+
+def _column_map(matches: Sequence[HeaderMatch]) -> dict[str, int]:
+    col_map = {m.field: m.index for m in matches if m.field}
     missing = [c for c in ("part_number", "reference") if c not in col_map]
     if missing:
         raise ValueError(f"Missing columns: {', '.join(missing)}")
     return col_map
 
 
+def validate_headers(headers: List[str]) -> dict[str, int]:
+    """Validate headers and return a mapping of canonical name to index."""
+
+    return _column_map(match_headers(headers))
+
+
 # ---------------------------------------------------------------------------
 # Row schema
 
@@ -109,6 +205,11 @@ class BOMRow(BaseModel):
         except Exception:  # pragma: no cover - defensive
             raise ValueError("qty must be integer")
 
+    @validator("datasheet_url")
+    def _datasheet_source(cls, v):
+        # Stored as given to the downloader, which matches on this value.
+        return normalize_datasheet_source(v)
+
     @validator("currency")
     def _cur_up(cls, v):
         return (v or "").upper() or None
@@ -123,87 +224,221 @@ class BOMRow(BaseModel):
         return Decimal(s)
 
 
-_RANGE = re.compile(r"^([A-Za-z]+)(\d+)\s*-\s*([A-Za-z]+)?(\d+)$")
+# ---------------------------------------------------------------------------
+# File parsing helpers
 
 
-def _expand_references(ref_str: str) -> list[str]:
-    # Split on commas first
-    tokens = [t.strip() for t in ref_str.split(",") if t.strip()]
-    out: list[str] = []
-    for tok in tokens:
-        m = _RANGE.match(tok)
-        if m:
-            p1, n1, p2, n2 = m.group(1), m.group(2), m.group(3), m.group(4)
-            if p2 and p2 != p1:
-                out.append(tok)
-                continue
-            start, end = int(n1), int(n2)
-            if start > end:
-                start, end = end, start
-            out.extend([f"{p1}{i}" for i in range(start, end + 1)])
-        else:
-            out.append(tok)
-    return out
+ImportSource = Union[bytes, bytearray, BinaryIO]
 
+RowStream = Iterator[Tuple[str, dict[str, str]]]
 
-# ---------------------------------------------------------------------------
-# File parsing helpers
+_SNIFF_CHUNK = 1 << 16
 
 
-def _is_xlsx(data: bytes) -> bool:
-    return data[:2] == b"PK"
+def _open_source(data: ImportSource) -> BinaryIO:
+    if isinstance(data, (bytes, bytearray)):
+        return io.BytesIO(data)
+    data.seek(0)
+    return data
 
 
-def _iter_rows(data: bytes) -> tuple[list[str], list[list[str]]]:
-    if _is_xlsx(data):
-        from openpyxl import load_workbook
+def _is_xlsx(stream: BinaryIO) -> bool:
+    head = stream.read(2)
+    stream.seek(0)
+    return head == b"PK"
 
-        wb = load_workbook(filename=io.BytesIO(data), read_only=True, data_only=True)
-        ws = wb.active
-        rows = [[(c if c is not None else "") for c in r] for r in ws.iter_rows(values_only=True)]
-        headers = [str(x or "") for x in rows[0]] if rows else []
-        return headers, [list(map(lambda x: "" if x is None else str(x), r)) for r in rows[1:]]
-    else:
-        text = data.decode("utf-8-sig", errors="ignore")
-        rdr = csv.reader(io.StringIO(text))
-        rows = list(rdr)
-        headers = rows[0] if rows else []
-        return headers, rows[1:]
 
-# ---------------------------------------------------------------------------
-# Datasheet caching
+def _cell_text(value: object) -> str:
+    return "" if value is None else str(value)
 
 
-DATASHEETS_DIR.mkdir(parents=True, exist_ok=True)
+def _map_row(row: Sequence[object], col_map: Mapping[str, int]) -> dict[str, str]:
+    return {key: _cell_text(row[idx]) if idx < len(row) else "" for key, idx in col_map.items()}
 
 
-def _safe_pn(pn: str) -> str:
-    return re.sub(r"[^A-Za-z0-9._-]+", "_", pn.strip())[:80]
+def _count_csv_rows(stream: BinaryIO) -> int:
+    """Estimate the number of data rows by counting newlines chunk by chunk."""
 
+    lines = 0
+    last = b""
+    for chunk in iter(lambda: stream.read(_SNIFF_CHUNK), b""):
+        lines += chunk.count(b"\n")
+        last = chunk
+    stream.seek(0)
+    if last and not last.endswith(b"\n"):
+        lines += 1
+    return max(lines - 1, 0)
 
-def _cache_datasheet_for_pn(pn: str, url_or_path: str) -> str | None:
-    if not url_or_path:
-        return None
+
+def _iter_csv_rows(stream: BinaryIO) -> tuple[RowStream, int, list[HeaderMatch]]:
+    total = _count_csv_rows(stream)
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", errors="ignore", newline="")
+    reader = csv.reader(text)
     try:
-        p = Path(url_or_path)
-        if p.exists() and p.is_file():
-            ext = p.suffix or ".pdf"
-            dst = DATASHEETS_DIR / f"{_safe_pn(pn)}{ext}"
-            shutil.copyfile(p, dst)
-            return str(dst)
-        if url_or_path.lower().startswith(("http://", "https://")):
-            import requests
-
-            r = requests.get(url_or_path, timeout=15)
-            r.raise_for_status()
-            ext = ".pdf"
-            dst = DATASHEETS_DIR / f"{_safe_pn(pn)}{ext}"
-            with open(dst, "wb") as f:
-                f.write(r.content)
-            return str(dst)
-    except Exception:  # pragma: no cover - cache failures are non-fatal
-        return url_or_path
-    return None
+        columns = match_headers(next(reader, []))
+        col_map = _column_map(columns)
+    except Exception:
+        text.detach()
+        raise
+
+    def _rows() -> RowStream:
+        try:
+            for i, row in enumerate(reader, start=2):
+                yield f"Row {i}", _map_row(row, col_map)
+        finally:
+            # Leave the caller's stream open (e.g. the spooled upload file).
+            text.detach()
+
+    return _rows(), total, columns
+
+
+def _iter_xlsx_rows(
+    stream: BinaryIO, sheet: str | None = None
+) -> tuple[RowStream, int, list[HeaderMatch]]:
+    from openpyxl import load_workbook
+
+    wb = load_workbook(filename=stream, read_only=True, data_only=True)
+    if sheet is not None:
+        if sheet not in wb.sheetnames:
+            wb.close()
+            raise ValueError(f"Worksheet '{sheet}' not found")
+        sheets = [wb[sheet]]
+    else:
+        sheets = [wb.active] + [ws for ws in wb.worksheets if ws is not wb.active]
+
+    # Exactly one sheet is imported: the named one, else the first with
+    # recognisable headers.  Workbooks often keep superseded revisions on
+    # other tabs, which must not be merged into the assembly.
+    first_error: Exception | None = None
+    for ws in sheets:
+        rows_iter = ws.iter_rows(values_only=True)
+        header = next(rows_iter, None) or ()
+        columns = match_headers([_cell_text(h) for h in header], sheet=ws.title)
+        try:
+            col_map = _column_map(columns)
+        except ValueError as exc:
+            first_error = first_error or exc
+            continue
+        break
+    else:
+        wb.close()
+        raise first_error or ValueError("Missing columns: part_number, reference")
+
+    total = max((ws.max_row or 1) - 1, 0)
+
+    def _rows() -> RowStream:
+        try:
+            for i, row in enumerate(rows_iter, start=2):
+                if not row or all(c is None for c in row):
+                    continue
+                yield f"Row {i}", _map_row(row, col_map)
+        finally:
+            wb.close()
+
+    return _rows(), total, columns
+
+
+def _iter_rows(
+    data: ImportSource, sheet: str | None = None
+) -> tuple[RowStream, int, list[HeaderMatch]]:
+    """Validate headers and return a lazy ``(label, row)`` stream, a row
+    estimate and the per-column header matches.
+
+    Rows are read incrementally from ``data`` (bytes or a binary file object
+    such as an upload's spooled file) so memory stays flat for large files.
+    ``sheet`` names the XLSX worksheet to read; CSV sources ignore it.
+    """
+
+    stream = _open_source(data)
+    if _is_xlsx(stream):
+        return _iter_xlsx_rows(stream, sheet)
+    return _iter_csv_rows(stream)
+
+# ---------------------------------------------------------------------------
+# Bulk prefetch / write helpers
+
+
+# Concurrent CE bridge searches during the post-import auto-link pass.
+_AUTO_LINK_WORKERS = 4
+
+_PART_FILL_FIELDS = ("active_passive", "function", "tol_p", "tol_n", "datasheet_url")
+_ITEM_OPTIONAL_FIELDS = ("manufacturer", "unit_cost", "currency", "datasheet_url", "notes")
+_ITEM_INSERT_FIELDS = ("assembly_id", "reference", "part_id", "qty") + _ITEM_OPTIONAL_FIELDS
+
+
+def _prefetch_parts(session: Session, part_numbers: Iterable[str]) -> dict[str, dict[str, Any]]:
+    """Return ``part_number -> column values`` for the parts that already exist."""
+
+    pns = sorted(set(part_numbers))
+    found: dict[str, dict[str, Any]] = {}
+    cols = (Part.id, Part.part_number) + tuple(getattr(Part, f) for f in _PART_FILL_FIELDS)
+    for chunk in chunked(pns):
+        for row in session.exec(select(*cols).where(Part.part_number.in_(chunk))):
+            pid, pn, *values = row
+            found[pn] = {"id": pid, **dict(zip(_PART_FILL_FIELDS, values))}
+    return found
+
+
+def _prefetch_normalized(
+    session: Session, keys: Iterable[str]
+) -> dict[str, dict[str, Any] | None]:
+    """Return ``normalised PN -> column values`` of existing parts.
+
+    Keys shared by several parts map to ``None``: they are ambiguous and
+    never matched fuzzily.  Values carry ``part_number`` next to the
+    :func:`_prefetch_parts` columns.
+    """
+
+    found: dict[str, dict[str, Any] | None] = {}
+    cols = (Part.id, Part.part_number, Part.part_number_norm) + tuple(
+        getattr(Part, f) for f in _PART_FILL_FIELDS
+    )
+    for chunk in chunked(sorted(set(keys))):
+        for row in session.exec(select(*cols).where(Part.part_number_norm.in_(chunk))):
+            pid, pn, key, *values = row
+            found[key] = None if key in found else {
+                "id": pid,
+                "part_number": pn,
+                **dict(zip(_PART_FILL_FIELDS, values)),
+            }
+    return found
+
+
+def _prefetch_bom_items(session: Session, assembly_id: int) -> dict[str, dict[str, Any]]:
+    """Return ``reference -> column values`` for the assembly's existing BOM items."""
+
+    cols = (
+        BOMItem.id,
+        BOMItem.reference,
+        BOMItem.part_id,
+        BOMItem.qty,
+    ) + tuple(getattr(BOMItem, f) for f in _ITEM_OPTIONAL_FIELDS)
+    stmt = select(*cols).where(BOMItem.assembly_id == assembly_id).order_by(BOMItem.id)
+    found: dict[str, dict[str, Any]] = {}
+    for row in session.exec(stmt):
+        item_id, ref, *values = row
+        # Legacy databases may hold duplicate references; the first row wins,
+        # matching the previous ``.first()`` lookup.
+        found.setdefault(
+            ref, {"id": item_id, **dict(zip(("part_id", "qty") + _ITEM_OPTIONAL_FIELDS, values))}
+        )
+    return found
+
+
+def _insert_ignoring_conflicts(session: Session, table, rows: list[dict[str, Any]]) -> None:
+    """Bulk insert ``rows`` skipping rows that violate a unique constraint."""
+
+    if not rows:
+        return
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:  # pragma: no cover - other backends fall back to a plain insert
+        session.execute(sa_insert(table), rows)
+        return
+    session.execute(dialect_insert(table).on_conflict_do_nothing(), rows)
 
 
 # ---------------------------------------------------------------------------
@@ -213,166 +448,362 @@ def _cache_datasheet_for_pn(pn: str, url_or_path: str) -> str | None:
 ProgressCallback = Callable[[int, int], None]
 
 
+@dataclass
+class _ImportPlan:
+    """In-memory insert/update sets computed from the parsed rows."""
+
+    new_parts: dict[str, dict[str, Any]] = field(default_factory=dict)
+    part_updates: dict[int, dict[str, Any]] = field(default_factory=dict)
+    # reference -> {"id": existing id or None, "part_number": str, "values": {...}}
+    items: dict[str, dict[str, Any]] = field(default_factory=dict)
+    part_order: dict[str, None] = field(default_factory=dict)
+    # part_number -> datasheet URL/path to cache after commit
+    datasheets: dict[str, str] = field(default_factory=dict)
+
+
+def _plan_part(
+    plan: _ImportPlan,
+    existing_parts: dict[str, dict[str, Any]],
+    bom_row: BOMRow,
+) -> bool:
+    """Record part creation/fill-in for ``bom_row``; return ``True`` when matched."""
+
+    pn = bom_row.part_number
+    state = existing_parts.get(pn)
+    if state is None:
+        state = plan.new_parts.get(pn)
+    is_new = state is None
+    if is_new:
+        state = {f: None for f in _PART_FILL_FIELDS}
+        state["active_passive"] = PartType.passive
+        plan.new_parts[pn] = state
+    plan.part_order.setdefault(pn, None)
+
+    changes: dict[str, Any] = {}
+    if bom_row.active_passive:
+        try:
+            ap = PartType(bom_row.active_passive.lower())
+        except Exception:
+            ap = PartType.passive
+        if is_new or not state.get("active_passive"):
+            changes["active_passive"] = ap
+    for name in ("function", "tol_p", "tol_n"):
+        value = getattr(bom_row, name)
+        if value and (is_new or not state.get(name)):
+            changes[name] = value
+    if bom_row.datasheet_url and (is_new or not state.get("datasheet_url")):
+        # Only record the source here; the file is cached in the background
+        # once the import has committed.
+        changes["datasheet_url"] = bom_row.datasheet_url
+        plan.datasheets[pn] = bom_row.datasheet_url
+
+    state.update(changes)
+    part_id = state.get("id")
+    if part_id is not None and changes:
+        plan.part_updates.setdefault(part_id, {}).update(changes)
+    return not is_new
+
+
+def _plan_item(
+    plan: _ImportPlan,
+    existing_items: dict[str, dict[str, Any]],
+    ref: str,
+    bom_row: BOMRow,
+    qty: int,
+) -> None:
+    entry = plan.items.get(ref)
+    if entry is None:
+        existing = existing_items.get(ref)
+        entry = {"id": existing["id"] if existing else None, "values": {}}
+        plan.items[ref] = entry
+    entry["part_number"] = bom_row.part_number
+    values = entry["values"]
+    values["qty"] = qty
+    for name in _ITEM_OPTIONAL_FIELDS:
+        value = getattr(bom_row, name)
+        if name == "unit_cost":
+            if value is not None:
+                values[name] = value
+        elif value:
+            values[name] = value
+
+
+def _item_changes(
+    entry: dict[str, Any], existing: dict[str, Any] | None, part_id: int | None
+) -> dict[str, Any]:
+    """Return the column values of ``entry`` that differ from ``existing``."""
+
+    values = dict(entry["values"])
+    values["part_id"] = part_id
+    if existing is None:
+        return values
+    return {k: v for k, v in values.items() if existing.get(k) != v}
+
+
+def _diff_plan(
+    plan: _ImportPlan,
+    existing_parts: dict[str, dict[str, Any]],
+    existing_items: dict[str, dict[str, Any]],
+) -> ImportDiff:
+    diff = ImportDiff(
+        new_parts=list(plan.new_parts),
+        updated_parts=[
+            pn
+            for pn in plan.part_order
+            if pn in existing_parts and existing_parts[pn]["id"] in plan.part_updates
+        ],
+    )
+    for ref, entry in plan.items.items():
+        if entry["id"] is None:
+            diff.inserted_items.append(ref)
+            continue
+        pn = entry["part_number"]
+        part_id = None if pn in plan.new_parts else existing_parts.get(pn, {}).get("id")
+        changes = _item_changes(entry, existing_items.get(ref), part_id)
+        if changes or pn in plan.new_parts:
+            diff.updated_items.append(ref)
+        else:
+            diff.unchanged_items.append(ref)
+    diff.missing_items = [ref for ref in existing_items if ref not in plan.items]
+    return diff
+
+
+def _write_plan(
+    session: Session,
+    assembly_id: int,
+    plan: _ImportPlan,
+    existing_items: dict[str, dict[str, Any]],
+) -> dict[str, int]:
+    """Persist ``plan`` inside the current transaction; return ``pn -> part id``."""
+
+    part_table = Part.__table__
+    item_table = BOMItem.__table__
+
+    new_rows = [
+        {
+            "part_number": pn,
+            **part_number_keys(pn),
+            **{k: v for k, v in values.items() if v is not None},
+        }
+        for pn, values in plan.new_parts.items()
+    ]
+    # Executemany needs a uniform key set; fill the gaps with the column defaults.
+    keys = {k for row in new_rows for k in row}
+    for row in new_rows:
+        for key in keys:
+            if key not in row:
+                row[key] = PartType.passive if key == "active_passive" else None
+    _insert_ignoring_conflicts(session, part_table, new_rows)
+    bulk_update_by_id(session, part_table, plan.part_updates)
+
+    part_ids: dict[str, int] = {}
+    for chunk in chunked(list(plan.part_order)):
+        for pid, pn in session.exec(
+            select(Part.id, Part.part_number).where(Part.part_number.in_(chunk))
+        ):
+            part_ids[pn] = pid
+
+    inserts: list[dict[str, Any]] = []
+    updates: dict[int, dict[str, Any]] = {}
+    for ref, entry in plan.items.items():
+        part_id = part_ids.get(entry["part_number"])
+        if entry["id"] is None:
+            row = {name: None for name in _ITEM_INSERT_FIELDS}
+            row.update(_item_changes(entry, None, part_id))
+            row["assembly_id"] = assembly_id
+            row["reference"] = ref
+            row["reference_key"] = designator_sort_key(ref)
+            inserts.append(row)
+        else:
+            # Unchanged rows are skipped so re-imports only touch what moved.
+            changes = _item_changes(entry, existing_items.get(ref), part_id)
+            if changes:
+                updates[entry["id"]] = changes
+    if inserts:
+        session.execute(sa_insert(item_table), inserts)
+    bulk_update_by_id(session, item_table, updates)
+    return part_ids
+
+
+def _plan_row(
+    plan: _ImportPlan,
+    existing_parts: dict[str, dict[str, Any]],
+    existing_items: dict[str, dict[str, Any]],
+    label: str,
+    bom_row: BOMRow,
+    raw_qty: Any,
+    counts: dict[str, int],
+    errors: List[str],
+) -> None:
+    counts["total"] += 1
+    if _plan_part(plan, existing_parts, bom_row):
+        counts["matched"] += 1
+    else:
+        counts["unmatched"] += 1
+    refs = list(iter_designators(bom_row.reference))
+    if len(refs) > 1:
+        for ref in refs:
+            _plan_item(plan, existing_items, ref, bom_row, 1)
+        if raw_qty not in (None, "", " ") and bom_row.qty != len(refs):
+            errors.append(
+                f"{label}: qty={bom_row.qty} but {len(refs)} references expanded"
+            )
+    else:
+        ref = refs[0] if refs else bom_row.reference
+        _plan_item(plan, existing_items, ref, bom_row, bom_row.qty)
+
+
+def _auto_link_imported_parts(parts: dict[int, str]) -> None:
+    """Link imported parts to CE complexes once the import has committed."""
+
+    if not parts:
+        return
+    ce_settings = get_complex_editor_settings()
+    bridge_cfg = ce_settings.get('bridge', {}) if isinstance(ce_settings, dict) else {}
+    if not (isinstance(bridge_cfg, dict) and bridge_cfg.get('enabled')):
+        return
+    # The bridge stack (requests, supervisor) is only needed once enabled.
+    from ..domain.complex_linker import auto_link_parts
+    from ..integration.ce_bridge_client import CENetworkError
+    from ..integration.ce_supervisor import CEBridgeError, ensure_ready
+
+    try:
+        ensure_ready()
+        auto_link_parts(parts, max_workers=_AUTO_LINK_WORKERS)
+    except (CEBridgeError, CENetworkError) as exc:
+        logger.debug('Complex Editor bridge unavailable for import auto-link: %s', exc)
+
+
 def import_bom(
     assembly_id: int,
-    data: bytes,
+    data: ImportSource,
     session: Session,
     *,
     progress_cb: ProgressCallback | None = None,
+    dry_run: bool = False,
+    sheet: str | None = None,
 ) -> ImportReport:
-    errors: List[str] = []
-    ce_settings = get_complex_editor_settings()
-    bridge_cfg = ce_settings.get('bridge', {}) if isinstance(ce_settings, dict) else {}
-    auto_link_enabled = bool(bridge_cfg.get('enabled')) if isinstance(bridge_cfg, dict) else False
-    if auto_link_enabled:
-        try:
-            ensure_ready()
-        except CEBridgeError as exc:
-            logger.debug('Complex Editor bridge unavailable before import auto-link: %s', exc)
-            auto_link_enabled = False
-    attempted_links: set[int] = set()
-    try:
-        headers, raw_rows = _iter_rows(data)
-        col_map = validate_headers(headers)
-    except Exception as exc:
-        errors.append(str(exc))
-        return ImportReport(total=0, matched=0, unmatched=0, errors=errors)
+    """Import BOM rows for ``assembly_id`` from CSV/XLSX ``data``.
+
+    ``data`` may be raw bytes or a seekable binary file object; rows are
+    streamed from it rather than loaded up front.  Existing parts and BOM
+    items are prefetched once, the insert/update sets are computed in memory
+    and everything is written in a single transaction using executemany
+    statements.  Datasheet URLs are only recorded; downloads are queued once
+    the import has committed, followed by a batched CE auto-link pass, so
+    the transaction itself never waits on the network.
+
+    With ``dry_run`` nothing is written: the report carries an
+    :class:`ImportDiff` computed from the same prefetch and plan instead.
 
+    XLSX workbooks are read from one worksheet only: ``sheet`` when given,
+    otherwise the first sheet (active sheet first) whose headers validate.
+    The report's ``sheet`` names the worksheet that was imported.
+    """
+
+    errors: List[str] = []
     assembly = session.get(Assembly, assembly_id)
     if not assembly:
         errors.append("assembly not found")
         return ImportReport(total=0, matched=0, unmatched=0, errors=errors)
 
-    total = matched = unmatched = 0
-    processed = 0
-    total_rows = len(raw_rows)
+    try:
+        rows, total_rows, columns = _iter_rows(data, sheet)
+    except Exception as exc:
+        errors.append(str(exc))
+        return ImportReport(total=0, matched=0, unmatched=0, errors=errors)
+
+    imported_sheet = columns[0].sheet if columns else None
 
     if progress_cb:
         progress_cb(0, total_rows)
 
-    for i, row in enumerate(raw_rows, start=2):
-        processed += 1
-        try:
-            data_map = {key: row[idx] if idx < len(row) else "" for key, idx in col_map.items()}
-            raw_qty = data_map.get("qty")
-            if not data_map.get("part_number") or not data_map.get("reference"):
-                errors.append(f"Row {i}: missing part_number or reference")
+    existing_parts: dict[str, dict[str, Any]] = {}
+    existing_items = _prefetch_bom_items(session, assembly_id)
+    plan = _ImportPlan()
+    counts = {"total": 0, "matched": 0, "unmatched": 0}
+    processed = 0
+
+    # Normalised PN -> part number rows with that spelling resolve to
+    # (``None`` when ambiguous), so ``sn74hct-240n`` reuses ``SN74HCT240N``.
+    pn_aliases: dict[str, str | None] = {}
+
+    def _canonical_part_number(bom_row: BOMRow) -> None:
+        pn = bom_row.part_number
+        if pn in existing_parts or pn in plan.new_parts:
+            return
+        key = normalize_part_number(pn)
+        if not key:
+            return
+        alias = pn_aliases.setdefault(key, pn)
+        if alias is not None:
+            bom_row.part_number = alias
+
+    def _flush(batch: list[tuple[str, BOMRow, Any]]) -> None:
+        unseen = {r.part_number for _, r, _ in batch} - existing_parts.keys() - plan.new_parts.keys()
+        existing_parts.update(_prefetch_parts(session, unseen))
+        keys = {normalize_part_number(pn) for pn in unseen if pn not in existing_parts}
+        for key, state in _prefetch_normalized(session, keys - pn_aliases.keys() - {""}).items():
+            if state is None:
+                pn_aliases[key] = None
                 continue
+            pn = state.pop("part_number")
+            existing_parts.setdefault(pn, state)
+            pn_aliases[key] = pn
+        for label, bom_row, raw_qty in batch:
+            _canonical_part_number(bom_row)
+            _plan_row(plan, existing_parts, existing_items, label, bom_row, raw_qty, counts, errors)
+        batch.clear()
+
+    # Rows are validated as they stream in and planned in batches so part
+    # lookups stay at one query per ``PARAM_CHUNK`` rows.
+    batch: list[tuple[str, BOMRow, Any]] = []
+    for label, data_map in rows:
+        processed += 1
+        if not data_map.get("part_number") or not data_map.get("reference"):
+            errors.append(f"{label}: missing part_number or reference")
+        else:
             try:
-                bom_row = BOMRow(**data_map)
+                batch.append((label, BOMRow(**data_map), data_map.get("qty")))
             except Exception as e:
-                errors.append(f"Row {i}: {e}")
-                continue
+                errors.append(f"{label}: {e}")
+        if len(batch) >= PARAM_CHUNK:
+            _flush(batch)
+        if progress_cb:
+            progress_cb(processed, max(total_rows, processed))
+    _flush(batch)
+
+    if dry_run:
+        if progress_cb:
+            progress_cb(processed, processed)
+        diff = _diff_plan(plan, existing_parts, existing_items)
+        return ImportReport(
+            **counts, errors=errors, columns=columns, diff=diff, sheet=imported_sheet
+        )
 
-            total += 1
-            pn = bom_row.part_number
-            part = session.exec(select(Part).where(Part.part_number == pn)).first()
-            is_new = part is None
-            if part:
-                matched += 1
-            else:
-                unmatched += 1
-                part = Part(part_number=pn)
-
-            if bom_row.active_passive:
-                try:
-                    ap = PartType(bom_row.active_passive.lower())
-                except Exception:
-                    ap = PartType.passive
-                if is_new or not getattr(part, "active_passive", None):
-                    part.active_passive = ap
-            if bom_row.function and (is_new or not part.function):
-                part.function = bom_row.function
-            if bom_row.tol_p and (is_new or not part.tol_p):
-                part.tol_p = bom_row.tol_p
-            if bom_row.tol_n and (is_new or not part.tol_n):
-                part.tol_n = bom_row.tol_n
-            if bom_row.datasheet_url and (is_new or not part.datasheet_url):
-                cached = _cache_datasheet_for_pn(pn, bom_row.datasheet_url)
-                if cached:
-                    part.datasheet_url = cached
-
-            session.add(part)
-            try:
-                session.commit()
-            except IntegrityError:
-                session.rollback()
-                part = session.exec(select(Part).where(Part.part_number == pn)).first()
-                if not part:
-                    errors.append(f"Row {i}: duplicate part_number {pn}")
-                    continue
-            session.refresh(part)
-
-            if auto_link_enabled and part.id is not None and part.id not in attempted_links:
-                try:
-                    auto_link_by_pn(part.id, part.part_number)
-                except CENetworkError:
-                    logger.debug(
-                        "Complex Editor bridge unavailable during import auto-link for %s",
-                        part.part_number,
-                    )
-                finally:
-                    attempted_links.add(part.id)
-
-            refs = _expand_references(bom_row.reference)
-            if len(refs) > 1:
-                for ref in refs:
-                    item = session.exec(
-                        select(BOMItem).where(
-                            BOMItem.assembly_id == assembly_id, BOMItem.reference == ref
-                        )
-                    ).first()
-                    if not item:
-                        item = BOMItem(assembly_id=assembly_id, reference=ref)
-                    item.part_id = part.id
-                    item.qty = 1
-                    if bom_row.manufacturer:
-                        item.manufacturer = bom_row.manufacturer
-                    if bom_row.unit_cost is not None:
-                        item.unit_cost = bom_row.unit_cost
-                    if bom_row.currency:
-                        item.currency = bom_row.currency
-                    if bom_row.datasheet_url:
-                        item.datasheet_url = bom_row.datasheet_url
-                    if bom_row.notes:
-                        item.notes = bom_row.notes
-                    session.add(item)
-                session.commit()
-                if raw_qty not in (None, "", " ") and bom_row.qty != len(refs):
-                    errors.append(
-                        f"Row {i}: qty={bom_row.qty} but {len(refs)} references expanded"
-                    )
-            else:
-                ref = refs[0] if refs else bom_row.reference
-                item = session.exec(
-                    select(BOMItem).where(
-                        BOMItem.assembly_id == assembly_id, BOMItem.reference == ref
-                    )
-                ).first()
-                if not item:
-                    item = BOMItem(assembly_id=assembly_id, reference=ref)
-
-                item.part_id = part.id
-                item.qty = bom_row.qty
-                if bom_row.manufacturer:
-                    item.manufacturer = bom_row.manufacturer
-                if bom_row.unit_cost is not None:
-                    item.unit_cost = bom_row.unit_cost
-                if bom_row.currency:
-                    item.currency = bom_row.currency
-                if bom_row.datasheet_url:
-                    item.datasheet_url = bom_row.datasheet_url
-                if bom_row.notes:
-                    item.notes = bom_row.notes
-
-                session.add(item)
-                session.commit()
-        finally:
-            if progress_cb:
-                progress_cb(processed, total_rows)
+    try:
+        with bulk_write(session):
+            part_ids = _write_plan(session, assembly_id, plan, existing_items)
+        bump_bom_versions(session, assembly_ids=[assembly_id], part_ids=plan.part_updates)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    if progress_cb:
+        progress_cb(processed, processed)
+
+    if plan.datasheets:
+        bind = session.get_bind()
+        schedule_datasheet_downloads(
+            {part_ids[pn]: src for pn, src in plan.datasheets.items() if pn in part_ids},
+            lambda: Session(bind),
+        )
 
-    return ImportReport(total=total, matched=matched, unmatched=unmatched, errors=errors)
+    _auto_link_imported_parts(
+        {part_ids[pn]: pn for pn in plan.part_order if pn in part_ids}
+    )
 
+    return ImportReport(**counts, errors=errors, columns=columns, sheet=imported_sheet)
 
-__all__ = ["ImportReport", "validate_headers", "import_bom"]
 
+__all__ = ["HeaderMatch", "ImportDiff", "ImportReport", "match_headers", "validate_headers", "import_bom"]
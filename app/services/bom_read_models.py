@@ -1,13 +1,24 @@
 from __future__ import annotations
 
-from typing import List, Literal, Optional
+from collections import namedtuple
+from dataclasses import dataclass
+from typing import Iterable, List, Literal, Optional, Sequence, Tuple
 import re
 
 from pydantic import BaseModel
 from sqlmodel import Session, select
 
-from ..models import Assembly, BOMItem, Part, PartType, TestMode
-from .test_resolution import BOMTestResolver
+from ..models import (
+    Assembly,
+    BOMItem,
+    BOMItemTestOverride,
+    Part,
+    PartTestMap,
+    PartType,
+    TestMode,
+)
+from .bom_versions import get_bom_version, has_pending_bump
+from .test_resolution import RESOLVED_TESTS, BOMTestResolver, complex_links
 
 # Regex for natural sort
 _token = re.compile(r"(\d+)")
@@ -40,31 +51,197 @@ class JoinedBOMRow(BaseModel):
     test_resolution_message: str | None = None
 
 
-def get_joined_bom_for_assembly(session: Session, assembly_id: int) -> List[JoinedBOMRow]:
-    """Return joined BOM items with part data for an assembly."""
+_ITEM_COLUMNS = (
+    BOMItem.id,
+    BOMItem.assembly_id,
+    BOMItem.part_id,
+    BOMItem.reference,
+    BOMItem.qty,
+    BOMItem.manufacturer,
+    BOMItem.unit_cost,
+    BOMItem.currency,
+    BOMItem.datasheet_url,
+    BOMItem.alt_part_number,
+    BOMItem.is_fitted,
+    BOMItem.notes,
+)
+_PART_COLUMNS = (
+    Part.id,
+    Part.part_number,
+    Part.description,
+    Part.function,
+    Part.package,
+    Part.value,
+    Part.tol_p,
+    Part.tol_n,
+    Part.active_passive,
+    Part.datasheet_url,
+    Part.product_url,
+)
+_MAP_COLUMNS = (
+    PartTestMap.part_id,
+    PartTestMap.power_mode,
+    PartTestMap.profile,
+    PartTestMap.test_macro_id,
+    PartTestMap.python_test_id,
+    PartTestMap.detail,
+)
+_OVERRIDE_COLUMNS = (
+    BOMItemTestOverride.bom_item_id,
+    BOMItemTestOverride.power_mode,
+    BOMItemTestOverride.test_macro_id,
+    BOMItemTestOverride.python_test_id,
+    BOMItemTestOverride.detail,
+)
+
+# Plain tuples standing in for ORM rows; the resolver only reads attributes.
+BOMItemRow = namedtuple("BOMItemRow", [c.key for c in _ITEM_COLUMNS])
+PartRow = namedtuple("PartRow", [c.key for c in _PART_COLUMNS])
+_MapRow = namedtuple("_MapRow", [c.key for c in _MAP_COLUMNS])
+_OverrideRow = namedtuple("_OverrideRow", [c.key for c in _OVERRIDE_COLUMNS])
+
+
+@dataclass
+class BOMSnapshot:
+    """Column tuples for an assembly's BOM plus a resolver primed for them."""
+
+    assembly_id: int
+    test_mode: TestMode
+    rows: List[Tuple[BOMItemRow, Optional[PartRow]]]
+    resolver: BOMTestResolver
+
 
+def _coerce_mode(value: object) -> TestMode:
+    if isinstance(value, TestMode):
+        return value
+    try:
+        return TestMode(value)
+    except ValueError:
+        return TestMode.unpowered
+
+
+def _load_test_rows(
+    session: Session, item_scope
+) -> Tuple[List[_MapRow], List[_OverrideRow], List[int]]:
+    """Mappings, overrides and CE-linked part ids for the items in ``item_scope``."""
+
+    part_scope = select(BOMItem.part_id).where(BOMItem.id.in_(item_scope))
+    mappings = [
+        _MapRow._make(r)
+        for r in session.exec(
+            select(*_MAP_COLUMNS).where(PartTestMap.part_id.in_(part_scope))
+        )
+    ]
+    overrides = [
+        _OverrideRow._make(r)
+        for r in session.exec(
+            select(*_OVERRIDE_COLUMNS).where(BOMItemTestOverride.bom_item_id.in_(item_scope))
+        )
+    ]
+    linked = list(
+        session.exec(
+            select(complex_links.c.part_id).where(complex_links.c.part_id.in_(part_scope))
+        )
+    )
+    return mappings, overrides, linked
+
+
+def _cached_results(session: Session, assembly_id: int):
+    """Shared resolved-test map for the assembly's current change version."""
+
+    if has_pending_bump(session):
+        return None
+    version = get_bom_version(session, assembly_id)
+    if version is None:
+        return None
+    return RESOLVED_TESTS.results_for(session.get_bind(), assembly_id, version)
+
+
+def load_bom_snapshot(
+    session: Session,
+    assembly_id: int,
+    *,
+    item_ids: Optional[Sequence[int]] = None,
+    require_part: bool = False,
+    resolve: bool = True,
+) -> BOMSnapshot:
+    """Load an assembly's BOM rows and test data in a fixed number of queries.
+
+    One query fetches BOM, part and assembly-mode columns; mappings,
+    overrides and CE links follow with one query each, filtered by
+    sub-selects rather than parameter lists.  Only the needed columns are
+    selected, so nothing is hydrated into the ORM identity map.
+    ``item_ids`` restricts the load to a page of items; ``require_part``
+    drops items without a part (inner join); ``resolve=False`` skips the
+    three test queries.  Resolutions are kept in
+    :data:`~app.services.test_resolution.RESOLVED_TESTS` under the
+    assembly's change version, so an unchanged assembly is served without
+    re-running them.
+    """
+
+    n_item = len(_ITEM_COLUMNS)
     stmt = (
-        select(BOMItem, Part)
-        .join(Part, Part.id == BOMItem.part_id)
+        select(*_ITEM_COLUMNS, *_PART_COLUMNS, Assembly.test_mode)
+        .join(Assembly, Assembly.id == BOMItem.assembly_id)
+        .join(Part, Part.id == BOMItem.part_id, isouter=not require_part)
         .where(BOMItem.assembly_id == assembly_id)
     )
-    rows = session.exec(stmt).all()
-    assembly = session.get(Assembly, assembly_id)
-    resolver = BOMTestResolver.from_session(session, assembly_id, rows)
-    assembly_mode = TestMode.unpowered
-    if assembly is not None:
-        mode_val = getattr(assembly, "test_mode", None)
-        if isinstance(mode_val, TestMode):
-            assembly_mode = mode_val
-        elif isinstance(mode_val, str):
-            try:
-                assembly_mode = TestMode(mode_val)
-            except ValueError:
-                assembly_mode = TestMode.unpowered
+    item_scope = select(BOMItem.id).where(BOMItem.assembly_id == assembly_id)
+    if item_ids is not None:
+        stmt = stmt.where(BOMItem.id.in_(list(item_ids)))
+        item_scope = item_scope.where(BOMItem.id.in_(list(item_ids)))
+
+    # Read the change version before the rows: a commit landing in between
+    # then caches newer rows under the older version, never older rows
+    # under the newer one.
+    resolved = _cached_results(session, assembly_id) if resolve else None
+
+    rows: List[Tuple[BOMItemRow, Optional[PartRow]]] = []
+    test_mode: object = None
+    for raw in session.exec(stmt):
+        item = BOMItemRow._make(raw[:n_item])
+        part_values = raw[n_item:-1]
+        part = PartRow._make(part_values) if part_values[0] is not None else None
+        rows.append((item, part))
+        test_mode = raw[-1]
+    if test_mode is None:
+        test_mode = session.exec(
+            select(Assembly.test_mode).where(Assembly.id == assembly_id)
+        ).first()
+
+    mode = _coerce_mode(test_mode)
+    if resolved is not None and rows and all((item.id, mode) in resolved for item, _ in rows):
+        # Every row was resolved at this version already; skip the test queries.
+        resolve = False
+
+    mappings: List[_MapRow] = []
+    overrides: List[_OverrideRow] = []
+    linked: List[int] = []
+    if resolve and rows:
+        mappings, overrides, linked = _load_test_rows(session, item_scope)
+
+    resolver = BOMTestResolver(
+        assembly_id,
+        {item.id: item for item, _ in rows},
+        {item.id: part for item, part in rows},
+        mappings,
+        overrides,
+        ce_linked_parts=linked,
+        resolved=resolved,
+    )
+    return BOMSnapshot(assembly_id, mode, rows, resolver)
+
+
+def get_joined_bom_for_assembly(session: Session, assembly_id: int) -> List[JoinedBOMRow]:
+    """Return joined BOM items with part data for an assembly."""
+
+    snapshot = load_bom_snapshot(session, assembly_id, require_part=True)
+    resolve = snapshot.resolver.resolve_effective_test
+    mode = snapshot.test_mode
     result: List[JoinedBOMRow] = []
-    for item, part in rows:
+    for item, part in snapshot.rows:
         ap = part.active_passive.value if isinstance(part.active_passive, PartType) else part.active_passive
-        resolved = resolver.resolve_effective_test(item.id, assembly_mode)
+        resolved = resolve(item.id, mode)
         result.append(
             JoinedBOMRow(
                 bom_item_id=item.id,
@@ -92,3 +269,98 @@ def get_joined_bom_for_assembly(session: Session, assembly_id: int) -> List[Join
         )
     result.sort(key=lambda r: natural_key(r.reference))
     return result
+
+
+_BulkItemRow = namedtuple("_BulkItemRow", ["id", "reference"])
+_BulkPartRow = namedtuple("_BulkPartRow", ["id", "part_number", "active_passive"])
+
+
+@dataclass
+class BulkTestResolution:
+    """Effective tests for many assemblies as parallel columns.
+
+    Row ``i`` of every list describes the same BOM line; rows are ordered by
+    assembly id, then BOM item id.  ``power_mode`` holds the mode's string
+    value, or ``None`` when nothing resolved; ``part_type`` is ``"active"``,
+    ``"passive"`` or ``None``.
+    """
+
+    assembly_id: List[int]
+    bom_item_id: List[int]
+    part_id: List[Optional[int]]
+    reference: List[str]
+    part_type: List[Optional[str]]
+    method: List[Optional[str]]
+    detail: List[Optional[str]]
+    source: List[str]
+    power_mode: List[Optional[str]]
+
+    def __len__(self) -> int:
+        return len(self.bom_item_id)
+
+
+def resolve_tests_bulk(session: Session, assembly_ids: Iterable[int]) -> BulkTestResolution:
+    """Resolve the effective test of every BOM line of ``assembly_ids`` at once.
+
+    BOM lines come from one query; mappings, overrides and CE links are
+    loaded once for all assemblies.  A single resolver then serves every
+    line, and lines without overrides share one resolution per part and
+    mode, so the work scales with distinct parts rather than lines.
+    """
+
+    ids = sorted({int(a) for a in assembly_ids})
+    result = BulkTestResolution([], [], [], [], [], [], [], [], [])
+    if not ids:
+        return result
+
+    stmt = (
+        select(
+            BOMItem.id,
+            BOMItem.assembly_id,
+            BOMItem.reference,
+            Part.id,
+            Part.part_number,
+            Part.active_passive,
+            Assembly.test_mode,
+        )
+        .join(Assembly, Assembly.id == BOMItem.assembly_id)
+        .join(Part, Part.id == BOMItem.part_id, isouter=True)
+        .where(BOMItem.assembly_id.in_(ids))
+        .order_by(BOMItem.assembly_id, BOMItem.id)
+    )
+    lines = session.exec(stmt).all()
+    if not lines:
+        return result
+
+    items: dict[int, _BulkItemRow] = {}
+    parts: dict[int, Optional[_BulkPartRow]] = {}
+    for item_id, _aid, reference, part_id, part_number, active_passive, _mode in lines:
+        items[item_id] = _BulkItemRow(item_id, reference)
+        parts[item_id] = (
+            _BulkPartRow(part_id, part_number, active_passive) if part_id is not None else None
+        )
+    item_scope = select(BOMItem.id).where(BOMItem.assembly_id.in_(ids))
+    mappings, overrides, linked = _load_test_rows(session, item_scope)
+    resolver = BOMTestResolver(0, items, parts, mappings, overrides, ce_linked_parts=linked)
+
+    resolve = resolver.resolve_effective_test
+    modes: dict[object, TestMode] = {}
+    for item_id, aid, reference, part_id, _pn, active_passive, raw_mode in lines:
+        mode = modes.get(raw_mode)
+        if mode is None:
+            mode = modes[raw_mode] = _coerce_mode(raw_mode)
+        resolved = resolve(item_id, mode)
+        result.assembly_id.append(aid)
+        result.bom_item_id.append(item_id)
+        result.part_id.append(part_id)
+        result.reference.append(reference)
+        result.part_type.append(
+            active_passive.value if isinstance(active_passive, PartType) else active_passive
+        )
+        result.method.append(resolved.method)
+        result.detail.append(resolved.detail)
+        result.source.append(resolved.source)
+        result.power_mode.append(
+            resolved.power_mode.value if resolved.power_mode is not None else None
+        )
+    return result
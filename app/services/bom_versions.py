@@ -0,0 +1,249 @@
+"""Per-assembly BOM change versions used as cheap HTTP cache validators.
+
+Every flush touching rows that feed an assembly's BOM view bumps that
+assembly's counter in ``bom_change_version``.  Part-level rows (``Part``,
+test mappings, assignments and CE links) bump every assembly that uses the
+part.  Core DML statements cannot be attributed to a single assembly, so
+unless the caller bumps precisely inside :func:`bulk_write` they advance
+the global epoch (``assembly_id`` 0), which invalidates every assembly.
+"""
+
+from __future__ import annotations
+
+import weakref
+from contextlib import contextmanager
+from itertools import chain
+from typing import Iterable, Iterator
+
+from sqlalchemy import event, inspect as sa_inspect, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import ORMExecuteState, Session as ORMSession
+
+from ..models import BOMChangeVersion, BOMItem
+from ._sql import chunked
+
+GLOBAL_EPOCH = 0
+
+_ASSEMBLY_COLUMN = {"bomitem": "assembly_id", "assembly": "id"}
+_ITEM_COLUMN = {"bom_item_test_override": "bom_item_id"}
+_PART_COLUMN = {
+    "part": "id",
+    "part_test_map": "part_id",
+    "parttestassignment": "part_id",
+    "complex_links": "part_id",
+}
+_GLOBAL_TABLES = {"testmacro", "pythontest"}
+TRACKED_TABLES = frozenset(
+    chain(_ASSEMBLY_COLUMN, _ITEM_COLUMN, _PART_COLUMN, _GLOBAL_TABLES)
+)
+
+_SUPPRESS_KEY = "bom_versions_suppress"
+_PENDING_KEY = "bom_versions_pending"
+_ready_engines: "weakref.WeakKeyDictionary[Engine, bool]" = weakref.WeakKeyDictionary()
+
+
+def _has_version_table(conn: Connection) -> bool:
+    engine = conn.engine
+    if _ready_engines.get(engine):
+        return True
+    ok = sa_inspect(conn).has_table(BOMChangeVersion.__tablename__)
+    if ok:
+        _ready_engines[engine] = True
+    return ok
+
+
+def _assemblies_for(conn: Connection, column, ids: set[int]) -> set[int]:
+    found: set[int] = set()
+    for chunk in chunked(sorted(ids)):
+        stmt = select(BOMItem.assembly_id).where(column.in_(chunk)).distinct()
+        found.update(conn.execute(stmt).scalars())
+    return found
+
+
+def _increment(conn: Connection, assembly_ids: set[int]) -> None:
+    table = BOMChangeVersion.__table__
+    rows = [{"assembly_id": a, "version": 1} for a in sorted(assembly_ids)]
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:  # pragma: no cover - other backends update then insert
+        for row in rows:
+            result = conn.execute(
+                table.update()
+                .where(table.c.assembly_id == row["assembly_id"])
+                .values(version=table.c.version + 1)
+            )
+            if not result.rowcount:
+                conn.execute(table.insert(), row)
+        return
+    stmt = dialect_insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.assembly_id],
+        set_={"version": table.c.version + 1},
+    )
+    conn.execute(stmt, rows)
+
+
+def bump_bom_versions(
+    session: ORMSession,
+    *,
+    assembly_ids: Iterable[int] = (),
+    part_ids: Iterable[int] = (),
+    bom_item_ids: Iterable[int] = (),
+    everything: bool = False,
+) -> None:
+    """Advance the change version of the affected assemblies.
+
+    Runs in the session's current transaction, so the bump commits or rolls
+    back together with the change it describes.
+    """
+
+    conn = session.connection()
+    if not _has_version_table(conn):
+        return
+    targets = {a for a in assembly_ids if a is not None}
+    if everything:
+        targets.add(GLOBAL_EPOCH)
+    parts = {p for p in part_ids if p is not None}
+    items = {i for i in bom_item_ids if i is not None}
+    if parts:
+        targets |= _assemblies_for(conn, BOMItem.part_id, parts)
+    if items:
+        targets |= _assemblies_for(conn, BOMItem.id, items)
+    if targets:
+        _increment(conn, targets)
+        session.info[_PENDING_KEY] = True
+
+
+def has_pending_bump(session: ORMSession) -> bool:
+    """True while the session's transaction holds uncommitted version bumps.
+
+    Versions read in such a transaction may be rolled back and reused, so
+    they must not key anything that outlives it.
+    """
+
+    return bool(session.info.get(_PENDING_KEY))
+
+
+def get_bom_version(session: ORMSession, assembly_id: int) -> str | None:
+    """Return ``"<epoch>.<version>"`` for ``assembly_id`` or ``None`` if untracked."""
+
+    conn = session.connection()
+    if not _has_version_table(conn):
+        return None
+    table = BOMChangeVersion.__table__
+    stmt = select(table.c.assembly_id, table.c.version).where(
+        table.c.assembly_id.in_((GLOBAL_EPOCH, assembly_id))
+    )
+    versions = dict(conn.execute(stmt).all())
+    return f"{versions.get(GLOBAL_EPOCH, 0)}.{versions.get(assembly_id, 0)}"
+
+
+@contextmanager
+def bulk_write(session: ORMSession) -> Iterator[None]:
+    """Run Core DML without the global fallback bump.
+
+    The caller is responsible for calling :func:`bump_bom_versions` with the
+    assemblies/parts it touched.
+    """
+
+    session.info[_SUPPRESS_KEY] = session.info.get(_SUPPRESS_KEY, 0) + 1
+    try:
+        yield
+    finally:
+        session.info[_SUPPRESS_KEY] -= 1
+
+
+def _column_values(obj: object, column: str) -> list[int | None]:
+    """The row's current value plus any value it held before this flush.
+
+    Reads loaded state and attribute history only, so deleted/expired rows
+    never trigger a load.  The old value matters when a row moves: an item
+    re-pointed at another assembly changes both BOM views.
+    """
+
+    state = sa_inspect(obj)
+    values = [state.dict.get(column)]
+    if column in state.attrs:
+        values.extend(v for v in state.attrs[column].history.deleted if v is not None)
+    return values
+
+
+def _after_flush(session: ORMSession, _flush_context) -> None:
+    assemblies: set[int] = set()
+    parts: set[int] = set()
+    items: set[int] = set()
+    everything = False
+    dirty = (o for o in session.dirty if session.is_modified(o, include_collections=False))
+    for obj in chain(session.new, dirty, session.deleted):
+        table = getattr(type(obj), "__tablename__", None)
+        if table not in TRACKED_TABLES:
+            continue
+        if table in _GLOBAL_TABLES:
+            everything = True
+            continue
+        for mapping, bucket in (
+            (_ASSEMBLY_COLUMN, assemblies),
+            (_PART_COLUMN, parts),
+            (_ITEM_COLUMN, items),
+        ):
+            if table in mapping:
+                current, *previous = _column_values(obj, mapping[table])
+                if current is None:
+                    everything = True
+                else:
+                    bucket.add(current)
+                bucket.update(previous)
+    if assemblies or parts or items or everything:
+        bump_bom_versions(
+            session,
+            assembly_ids=assemblies,
+            part_ids=parts,
+            bom_item_ids=items,
+            everything=everything,
+        )
+
+
+def _end_transaction(session: ORMSession) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _on_execute(state: ORMExecuteState) -> None:
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    if state.session.info.get(_SUPPRESS_KEY):
+        return
+    table = getattr(state.statement, "table", None)
+    if getattr(table, "name", None) in TRACKED_TABLES:
+        bump_bom_versions(state.session, everything=True)
+
+
+def install_session_hooks() -> None:
+    """Register the version-bump hooks on every ORM session (idempotent).
+
+    Called when the application engine is created and when this module is
+    imported, so any code path that can open a session writes versions.
+    """
+
+    if event.contains(ORMSession, "after_flush", _after_flush):
+        return
+    event.listen(ORMSession, "after_flush", _after_flush)
+    event.listen(ORMSession, "do_orm_execute", _on_execute)
+    event.listen(ORMSession, "after_commit", _end_transaction)
+    event.listen(ORMSession, "after_rollback", _end_transaction)
+
+
+install_session_hooks()
+
+
+__all__ = [
+    "GLOBAL_EPOCH",
+    "TRACKED_TABLES",
+    "bulk_write",
+    "bump_bom_versions",
+    "get_bom_version",
+    "has_pending_bump",
+    "install_session_hooks",
+]
@@ -0,0 +1,177 @@
+"""Background datasheet downloads for parts referenced by BOM imports.
+
+Imports only record the datasheet URL/path given in the BOM.  The files are
+fetched afterwards on a bounded thread pool that shares a single HTTP
+session, deduplicates identical URLs and stores results in the
+hash-addressed datasheet store (:func:`register_datasheet_for_part`).
+Once a file is stored, parts still pointing at the original URL are
+switched over to the canonical store path.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Mapping
+
+from sqlalchemy import update as sa_update
+from sqlmodel import Session
+
+from .. import config
+from ..models import Part
+from .bom_versions import bulk_write, bump_bom_versions
+from .datasheets import register_datasheet_for_part
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import requests
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], Session]
+
+_DOWNLOAD_TIMEOUT = (10, 60)
+_CHUNK = 64 * 1024
+
+_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+_http: "requests.Session | None" = None
+# url -> part ids waiting for that download
+_inflight: dict[str, set[int]] = {}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, config.AUTO_DATASHEET_MAX_WORKERS),
+                thread_name_prefix="datasheet-dl",
+            )
+        return _executor
+
+
+def _get_http() -> "requests.Session":
+    global _http
+    with _lock:
+        if _http is None:
+            import requests
+
+            _http = requests.Session()
+        return _http
+
+
+def is_remote_url(value: str) -> bool:
+    return value.lower().startswith(("http://", "https://"))
+
+
+def normalize_datasheet_source(value: str | None) -> str | None:
+    """Return the datasheet URL/path as stored and downloaded, or ``None``.
+
+    Importers store this value on the part and the downloader matches on
+    it when switching parts to the cached file, so both sides must use it.
+    """
+
+    return (value or "").strip() or None
+
+
+def _download_to_temp(url: str) -> Path | None:
+    """Stream ``url`` into a temporary PDF file honouring ``MAX_DATASHEET_MB``."""
+
+    limit = max(1, int(config.MAX_DATASHEET_MB)) * 1024 * 1024
+    fd, tmp = tempfile.mkstemp(prefix="bom-ds-", suffix=".pdf")
+    path = Path(tmp)
+    try:
+        with os.fdopen(fd, "wb") as handle, _get_http().get(
+            url, stream=True, timeout=_DOWNLOAD_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            written = 0
+            for chunk in response.iter_content(_CHUNK):
+                written += len(chunk)
+                if written > limit:
+                    raise ValueError(f"exceeds {config.MAX_DATASHEET_MB} MB")
+                handle.write(chunk)
+        with path.open("rb") as handle:
+            if handle.read(5) != b"%PDF-":
+                raise ValueError("not a PDF")
+        return path
+    except Exception as exc:
+        logger.info("Datasheet download failed for %s: %s", url, exc)
+        path.unlink(missing_ok=True)
+        return None
+
+
+def _fetch_and_attach(source: str, session_factory: SessionFactory) -> str | None:
+    temp_path: Path | None = None
+    taken = False
+    try:
+        if is_remote_url(source):
+            temp_path = _download_to_temp(source)
+            pdf = temp_path
+        else:
+            local = Path(source)
+            pdf = local if local.is_file() else None
+        with _lock:
+            part_ids = sorted(_inflight.pop(source, set()))
+            taken = True
+        if pdf is None or not part_ids:
+            return None
+        with session_factory() as session:
+            canonical, _existed = register_datasheet_for_part(session, part_ids[0], pdf)
+            # Only replace the recorded source; edits made meanwhile win.
+            with bulk_write(session):
+                session.exec(
+                    sa_update(Part)
+                    .where(Part.id.in_(part_ids), Part.datasheet_url == source)
+                    .values(datasheet_url=str(canonical))
+                )
+            bump_bom_versions(session, part_ids=part_ids)
+            session.commit()
+        return str(canonical)
+    except Exception:
+        logger.exception("Failed to cache datasheet %s", source)
+        return None
+    finally:
+        # Once this job has taken its part ids, a later entry for the same
+        # source belongs to a newly queued job and must survive.
+        if not taken:
+            with _lock:
+                _inflight.pop(source, None)
+        if temp_path is not None:
+            temp_path.unlink(missing_ok=True)
+
+
+def schedule_datasheet_downloads(
+    sources: Mapping[int, str], session_factory: SessionFactory
+) -> list[Future]:
+    """Queue ``{part_id: url_or_path}`` for background caching.
+
+    Part ids sharing a source are served by a single download, including
+    sources already queued by an earlier call.  Returns the futures of the
+    newly queued downloads.
+    """
+
+    by_source: dict[str, set[int]] = {}
+    for part_id, raw in sources.items():
+        source = normalize_datasheet_source(raw)
+        if source:
+            by_source.setdefault(source, set()).add(part_id)
+
+    futures: list[Future] = []
+    executor = _get_executor()
+    for source, part_ids in by_source.items():
+        with _lock:
+            pending = _inflight.get(source)
+            if pending is not None:
+                pending.update(part_ids)
+                continue
+            _inflight[source] = set(part_ids)
+        futures.append(executor.submit(_fetch_and_attach, source, session_factory))
+    return futures
+
+
+__all__ = ["is_remote_url", "normalize_datasheet_source", "schedule_datasheet_downloads"]
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Tuple, Optional
 import re
 
+from ..logic.part_numbers import base_part_number, normalize_part_number
 from .pdf_utils import extract_text_first_pages
 from urllib.parse import urlparse
 
@@ -26,13 +27,11 @@ def pdf_matches_request(pn: str, mfg: str | None, desc: str | None, path: Path,
         return False, 0.0
 
     text_norm = _normalize(text)
-    pn_norm = _normalize(pn)
-    # Base PN: strip suffix after '-' (e.g., -20PU) and trailing package letters (e.g., ending N, AN)
-    pn_dash = pn.split('-')[0]
-    pn_base = _normalize(pn_dash)
-    # Core PN: also strip trailing letters after a trailing digit sequence (e.g., SN74HCT240N -> SN74HCT240)
-    m = re.match(r"^(.*?\d+)[A-Z]*$", pn_base)
-    pn_core = _normalize(m.group(1)) if m else pn_base
+    pn_norm = normalize_part_number(pn)
+    # Base PN: strip suffix after '-' (e.g., -20PU)
+    pn_base = normalize_part_number(pn.split('-')[0])
+    # Core PN: also strip trailing package letters (e.g., SN74HCT240N -> SN74HCT240)
+    pn_core = base_part_number(pn)
     if not pn_norm or len(pn_norm) < 4:
         return False, 0.0
 
@@ -21,6 +21,7 @@ from ..integration.ce_bridge_client import (
     CEExportStrictError,
     CEPNResolutionError,
 )
+from ..logic.designators import iter_designators
 from ..models import (
     Assembly,
     BOMItem,
@@ -202,7 +203,9 @@ def build_viva_groups(rows_from_gui: Iterable[dict], session: Session, assembly_
     for row in prepared:
         key = (row['part_number'], row['function'])
         if row['reference']:
-            groups[key].append(row['reference'])
+            # GUI rows may carry range notation (by-PN view); VIVA wants every
+            # designator listed explicitly.
+            groups[key].extend(iter_designators(row['reference']))
 
     # 4) Fetch Part fields for all PNs in one go
     pn_list = sorted({pn for (pn, _) in groups.keys()})
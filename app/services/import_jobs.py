@@ -0,0 +1,167 @@
+"""Background BOM import jobs with pollable progress.
+
+Large imports are copied to a temporary file and executed on a bounded
+thread pool so API requests can return immediately.  Job state lives in a
+process-local registry; callers poll :func:`get_import_job` for the same
+``(processed, total)`` progress reported through ``progress_cb``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import BinaryIO, Callable, Literal, Optional
+
+from sqlmodel import Session
+
+from .. import config
+from .bom_import import ImportReport, import_bom
+
+logger = logging.getLogger(__name__)
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+# Finished jobs are kept around for polling clients for this long.
+JOB_RETENTION = timedelta(hours=1)
+
+_COPY_CHUNK = 1024 * 1024
+
+
+@dataclass
+class ImportJob:
+    """Snapshot of a background BOM import."""
+
+    id: str
+    assembly_id: int
+    status: JobStatus = "queued"
+    processed: int = 0
+    total: int = 0
+    report: Optional[ImportReport] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+
+_jobs: dict[str, ImportJob] = {}
+_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=config.IMPORT_JOB_MAX_WORKERS,
+                thread_name_prefix="bom-import",
+            )
+        return _executor
+
+
+def _update(job_id: str, **changes) -> None:
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is not None:
+            for key, value in changes.items():
+                setattr(job, key, value)
+
+
+def _prune_finished(now: datetime) -> None:
+    cutoff = now - JOB_RETENTION
+    with _lock:
+        stale = [
+            job_id
+            for job_id, job in _jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in stale:
+            del _jobs[job_id]
+
+
+def _spool_to_temp(source: BinaryIO | bytes) -> str:
+    fd, path = tempfile.mkstemp(prefix="bom-import-", suffix=".upload")
+    with os.fdopen(fd, "wb") as handle:
+        if isinstance(source, (bytes, bytearray)):
+            handle.write(source)
+        else:
+            source.seek(0)
+            shutil.copyfileobj(source, handle, _COPY_CHUNK)
+    return path
+
+
+def _run_job(
+    job_id: str,
+    assembly_id: int,
+    path: str,
+    session_factory: Callable[[], Session],
+    dry_run: bool = False,
+    sheet: str | None = None,
+) -> None:
+    _update(job_id, status="running")
+    progress = lambda processed, total: _update(job_id, processed=processed, total=total)
+    try:
+        with open(path, "rb") as handle, session_factory() as session:
+            report = import_bom(
+                assembly_id,
+                handle,
+                session,
+                progress_cb=progress,
+                dry_run=dry_run,
+                sheet=sheet,
+            )
+    except Exception as exc:
+        logger.exception("Background BOM import %s failed", job_id)
+        _update(job_id, status="failed", error=str(exc), finished_at=datetime.utcnow())
+    else:
+        _update(job_id, status="succeeded", report=report, finished_at=datetime.utcnow())
+    finally:
+        try:
+            os.remove(path)
+        except OSError:  # pragma: no cover - best effort cleanup
+            pass
+
+
+def submit_import_job(
+    assembly_id: int,
+    source: BinaryIO | bytes,
+    session_factory: Callable[[], Session],
+    *,
+    dry_run: bool = False,
+    sheet: str | None = None,
+) -> ImportJob:
+    """Queue an import of ``source`` for ``assembly_id`` and return its job.
+
+    ``source`` is copied to a temporary file first because upload streams are
+    closed once the request finishes.  ``session_factory`` must return a new
+    session usable from a worker thread.  ``dry_run`` queues a preview that
+    reports the diff without writing; ``sheet`` names the XLSX worksheet.
+    """
+
+    now = datetime.utcnow()
+    _prune_finished(now)
+    path = _spool_to_temp(source)
+    job = ImportJob(id=uuid.uuid4().hex, assembly_id=assembly_id, created_at=now)
+    with _lock:
+        _jobs[job.id] = job
+    _get_executor().submit(
+        _run_job, job.id, assembly_id, path, session_factory, dry_run, sheet
+    )
+    return get_import_job(job.id) or job
+
+
+def get_import_job(job_id: str) -> ImportJob | None:
+    """Return a snapshot of the job or ``None`` when unknown/expired."""
+
+    with _lock:
+        job = _jobs.get(job_id)
+        return replace(job) if job is not None else None
+
+
+__all__ = ["ImportJob", "JobStatus", "submit_import_job", "get_import_job"]
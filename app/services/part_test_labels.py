@@ -0,0 +1,143 @@
+"""Default-test labels per part for catalogue and BOM views.
+
+:func:`load_part_test_labels` returns, for each part with published test
+defaults, the ``(method, detail)`` shown for the powered and unpowered
+modes.  The mapping is chosen exactly as
+:class:`~app.services.test_resolution.BOMTestResolver` chooses it.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from sqlmodel import Session, select
+
+from ..models import Part, PartTestMap, PythonTest, TestMacro, TestMode
+from ._sql import PARAM_CHUNK, chunked
+from .test_resolution import coerce_part_type, pick_part_mapping
+
+TestLabel = Tuple[str, str]
+_BLANK: TestLabel = ("", "")
+_QUICK_TEST = "quick test"
+# Part/test ids per ``IN (...)`` query.
+CHUNK_SIZE = PARAM_CHUNK
+
+
+class PartTestLabels(NamedTuple):
+    powered: TestLabel
+    unpowered: TestLabel
+
+
+_MAP_COLUMNS = (
+    PartTestMap.part_id,
+    PartTestMap.power_mode,
+    PartTestMap.profile,
+    PartTestMap.test_macro_id,
+    PartTestMap.python_test_id,
+    PartTestMap.detail,
+)
+
+
+class _MapRow(NamedTuple):
+    part_id: int
+    power_mode: object
+    profile: object
+    test_macro_id: Optional[int]
+    python_test_id: Optional[int]
+    detail: Optional[str]
+
+
+class TestNameCache:
+    """``PythonTest``/``TestMacro`` id -> name, per database bind.
+
+    Test rows are only ever created by name (see ``test_defaults``), never
+    renamed, so cached names stay valid; only unseen ids are queried.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._names: "weakref.WeakKeyDictionary[object, Dict[type, Dict[int, str]]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def names(self, session: Session, model: type, ids: Iterable[int]) -> Dict[int, str]:
+        bind = session.get_bind()
+        wanted = {i for i in ids if i is not None}
+        with self._lock:
+            known = self._names.setdefault(bind, {}).setdefault(model, {})
+            missing = sorted(wanted - known.keys())
+        fetched: Dict[int, str] = {}
+        for chunk in chunked(missing, CHUNK_SIZE):
+            stmt = select(model.id, model.name).where(model.id.in_(chunk))
+            fetched.update(session.exec(stmt).all())
+        with self._lock:
+            known.update(fetched)
+            return {i: known[i] for i in wanted if i in known}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._names.clear()
+
+
+TEST_NAMES = TestNameCache()
+
+
+def _label(
+    mapping: Optional[_MapRow], python_names: Dict[int, str], macro_names: Dict[int, str]
+) -> TestLabel:
+    if mapping is None:
+        return _BLANK
+    detail = mapping.detail or ""
+    if mapping.python_test_id:
+        name = python_names.get(mapping.python_test_id, "")
+        if name.strip().lower() == _QUICK_TEST:
+            return "Quick test (QT)", detail
+        return "Python code", detail or name
+    if mapping.test_macro_id:
+        return "Macro", detail or macro_names.get(mapping.test_macro_id, "")
+    return "", detail
+
+
+def load_part_test_labels(
+    session: Session, part_ids: Iterable[int]
+) -> Dict[int, PartTestLabels]:
+    """Return ``part_id -> (powered, unpowered)`` default-test labels.
+
+    Mappings and part types come from one query per chunk of ids; test and
+    macro names from :data:`TEST_NAMES`.  Parts without mappings are left
+    out.
+    """
+
+    ids = sorted({int(p) for p in part_ids if p is not None})
+    grouped: Dict[int, dict] = {}
+    part_types: Dict[int, object] = {}
+    for chunk in chunked(ids, CHUNK_SIZE):
+        stmt = (
+            select(*_MAP_COLUMNS, Part.active_passive)
+            .join(Part, Part.id == PartTestMap.part_id)
+            .where(PartTestMap.part_id.in_(chunk))
+        )
+        for *values, part_type in session.exec(stmt):
+            row = _MapRow._make(values)
+            grouped.setdefault(row.part_id, {})[(row.power_mode, row.profile)] = row
+            part_types[row.part_id] = part_type
+    if not grouped:
+        return {}
+
+    rows = [row for mappings in grouped.values() for row in mappings.values()]
+    python_names = TEST_NAMES.names(session, PythonTest, (r.python_test_id for r in rows))
+    macro_names = TEST_NAMES.names(session, TestMacro, (r.test_macro_id for r in rows))
+    result: Dict[int, PartTestLabels] = {}
+    for part_id, mappings in grouped.items():
+        part_type = coerce_part_type(part_types.get(part_id))
+        powered, unpowered = (
+            _label(pick_part_mapping(mappings, part_type, mode), python_names, macro_names)
+            for mode in (TestMode.powered, TestMode.unpowered)
+        )
+        result[part_id] = PartTestLabels(powered=powered, unpowered=unpowered)
+    return result
+
+
+__all__ = ["PartTestLabels", "TEST_NAMES", "TestNameCache", "load_part_test_labels"]
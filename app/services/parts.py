@@ -1,14 +1,35 @@
 from __future__ import annotations
 
-from typing import Literal
+from dataclasses import dataclass, field
+from typing import Any, Callable, Literal, Mapping
 from pathlib import Path
 import os
 
-from sqlalchemy import func, or_, update as sa_update, delete as sa_delete
+import threading
+import weakref
+
+from sqlalchemy import (
+    ColumnElement,
+    and_,
+    case,
+    column,
+    func,
+    literal_column,
+    not_,
+    or_,
+    table,
+    text,
+    update as sa_update,
+    delete as sa_delete,
+)
 from sqlalchemy.exc import IntegrityError, InvalidRequestError
 from sqlmodel import Session, select
 
-from ..models import BOMItem, Part, PartTestAssignment, PartType
+from ..db_safe_migrate import PART_FTS_TABLE
+from ..logic.part_numbers import base_part_number, normalize_part_number
+from ..models import BOMItem, Part, PartTestAssignment, PartType, part_number_keys
+from ._sql import bulk_update_by_id, chunked
+from .bom_versions import bulk_write, bump_bom_versions
 
 
 def update_part_active_passive(
@@ -211,11 +232,27 @@ SEARCHABLE_PART_COLUMNS = (
     Part.product_url,
 )
 
+# Columns ``search_parts(order_by=...)`` can sort a whole result set by.
+SORTABLE_PART_COLUMNS = {
+    name: getattr(Part, name)
+    for name in (
+        "part_number",
+        "description",
+        "package",
+        "value",
+        "function",
+        "active_passive",
+        "datasheet_url",
+        "product_url",
+        "tol_p",
+        "tol_n",
+        "created_at",
+    )
+}
 
-def create_part(session: Session, **fields) -> Part:
-    """Create a new :class:`Part` enforcing unique part numbers."""
 
-    allowed = {
+EDITABLE_PART_FIELDS = frozenset(
+    {
         "part_number",
         "description",
         "package",
@@ -228,7 +265,13 @@ def create_part(session: Session, **fields) -> Part:
         "tol_p",
         "tol_n",
     }
-    data = {k: v for k, v in fields.items() if k in allowed}
+)
+
+
+def create_part(session: Session, **fields) -> Part:
+    """Create a new :class:`Part` enforcing unique part numbers."""
+
+    data = {k: v for k, v in fields.items() if k in EDITABLE_PART_FIELDS}
     part_number = (data.get("part_number") or "").strip()
     if not part_number:
         raise ValueError("part_number is required")
@@ -246,19 +289,210 @@ def create_part(session: Session, **fields) -> Part:
     return part
 
 
-def search_parts(session: Session, query: str | None, limit: int = 500) -> list[Part]:
-    """Search for parts matching ``query`` across common attributes."""
+_part_fts = table(PART_FTS_TABLE, column("rowid"))
+# bm25 weights per FTS column: part number first, URLs last.
+_FTS_WEIGHTS = (10.0, 4.0, 2.0, 2.0, 2.0, 0.5, 0.5)
+_TRIGRAM = 3
+_MIN_FUZZY_PN = 4
+
+_fts_lock = threading.Lock()
+_fts_binds: "weakref.WeakKeyDictionary[object, bool]" = weakref.WeakKeyDictionary()
+
+
+def _has_part_fts(session: Session) -> bool:
+    """Whether the bind carries the trigram part index (cached once found)."""
+
+    bind = session.get_bind()
+    with _fts_lock:
+        if _fts_binds.get(bind):
+            return True
+    if bind.dialect.name != "sqlite":
+        return False
+    found = session.exec(
+        text("SELECT 1 FROM sqlite_master WHERE type='table' AND name=:name").bindparams(
+            name=PART_FTS_TABLE
+        )
+    ).first() is not None
+    if found:
+        with _fts_lock:
+            _fts_binds[bind] = True
+    return found
+
+
+def _like_any_column(token: str):
+    escaped = token.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    term = f"%{escaped}%"
+    return or_(*(col.ilike(term, escape="\\") for col in SEARCHABLE_PART_COLUMNS))
+
+
+def search_parts(
+    session: Session,
+    query: str | None,
+    limit: int = 500,
+    offset: int = 0,
+    *,
+    order_by: str | None = None,
+    descending: bool = False,
+) -> list[Part]:
+    """Search for parts matching ``query`` across common attributes.
+
+    When ``query`` is a single part-number-shaped token, parts whose
+    normalised or base part number equals that of ``query`` are listed
+    first.  The rest must contain every whitespace-separated
+    token (as a substring, ignoring case) in at least one searchable
+    column.  On SQLite databases carrying the ``part_fts`` trigram index,
+    tokens of three or more characters are answered from the index and
+    results are ranked: exact part number, then part-number prefix, then
+    bm25 relevance.  Other backends and shorter tokens fall back to
+    ``ILIKE`` filters.  ``offset``/``limit`` select a page of that order,
+    so callers can page through a whole catalogue.
+
+    ``order_by`` (a key of :data:`SORTABLE_PART_COLUMNS`) replaces that
+    ranking with a column sort over the same matches, ties broken by id,
+    so every page of a sorted view comes from one stable order.
+    """
+
+    tokens = (query or "").split()
+    if order_by is not None:
+        return _search_sorted(session, tokens, order_by, descending, limit, offset)
+    if not tokens:
+        stmt = (
+            select(Part)
+            .order_by(Part.created_at.desc(), Part.part_number)
+            .offset(offset)
+            .limit(limit)
+        )
+        return list(session.exec(stmt))
+
+    fuzzy = _fuzzy_match(tokens)
+    head: list[Part] = []
+    skipped = 0
+    if fuzzy is not None:
+        match, exact = fuzzy
+        head = list(
+            session.exec(
+                select(Part)
+                .where(match)
+                .order_by(case((exact, 0), else_=1), Part.part_number)
+                .offset(offset)
+                .limit(limit)
+            )
+        )
+        if len(head) == limit:
+            return head
+        # A short page means the fuzzy matches ran out; only count them
+        # when the page starts past their end.
+        if head:
+            skipped = offset + len(head)
+        else:
+            skipped = session.exec(select(func.count()).select_from(Part).where(match)).one()
+    rest = _search_text(
+        session,
+        tokens,
+        limit - len(head),
+        max(0, offset - skipped),
+        exclude=None if fuzzy is None else fuzzy[0],
+    )
+    return head + rest
+
+
+def _fuzzy_match(tokens: list[str]) -> tuple[ColumnElement[bool], ColumnElement[bool]] | None:
+    """``(match, exact)`` filters on the normalised (exact) or base part number.
 
+    Only a single part-number-shaped token (at least ``_MIN_FUZZY_PN``
+    alphanumerics, one of them a digit) qualifies; free text and values
+    such as ``10k resistor`` keep the every-token rule.  The base match is
+    skipped when the base is all digits or shorter than ``_MIN_FUZZY_PN``,
+    so ``10uF`` does not pull in every part whose base is ``10``.
+    """
+
+    if len(tokens) != 1:
+        return None
+    norm = normalize_part_number(tokens[0])
+    if len(norm) < _MIN_FUZZY_PN or not any(ch.isdigit() for ch in norm):
+        return None
+    exact = Part.part_number_norm == norm
+    # Base the normalised spelling: the dash rule would cut ``LM-317`` to
+    # the family prefix ``LM`` and match every ``LM-*`` part.
+    base = base_part_number(norm)
+    if len(base) < _MIN_FUZZY_PN or base.isdigit():
+        return exact, exact
+    return or_(exact, Part.part_number_base == base), exact
+
+
+def _fts_match(tokens: list[str]) -> str:
+    return " AND ".join('"' + t.replace('"', '""') + '"' for t in tokens)
+
+
+def _search_sorted(
+    session: Session,
+    tokens: list[str],
+    order_by: str,
+    descending: bool,
+    limit: int,
+    offset: int,
+) -> list[Part]:
+    """Parts matching ``tokens`` (fuzzy or every-token) sorted by one column."""
+
+    column = SORTABLE_PART_COLUMNS.get(order_by)
+    if column is None:
+        raise ValueError(f"Cannot sort parts by '{order_by}'")
     stmt = select(Part)
-    if query:
-        term = f"%{query.strip()}%"
-        conditions = [col.ilike(term) for col in SEARCHABLE_PART_COLUMNS]
-        stmt = stmt.where(or_(*conditions))
-        stmt = stmt.order_by(Part.part_number)
+    if tokens:
+        indexed = [t for t in tokens if len(t) >= _TRIGRAM]
+        if indexed and _has_part_fts(session):
+            fts = literal_column(PART_FTS_TABLE)
+            ids = select(_part_fts.c.rowid).where(fts.op("MATCH")(_fts_match(indexed)))
+            conditions = [Part.id.in_(ids)]
+            rest = [t for t in tokens if len(t) < _TRIGRAM]
+        else:
+            conditions = []
+            rest = tokens
+        conditions.extend(_like_any_column(t) for t in rest)
+        matched = and_(*conditions)
+        fuzzy = _fuzzy_match(tokens)
+        stmt = stmt.where(matched if fuzzy is None else or_(fuzzy[0], matched))
+    if descending:
+        stmt = stmt.order_by(column.desc(), Part.id.desc())
     else:
-        stmt = stmt.order_by(Part.created_at.desc(), Part.part_number)
-    stmt = stmt.limit(limit)
-    return list(session.exec(stmt))
+        stmt = stmt.order_by(column.asc(), Part.id)
+    return list(session.exec(stmt.offset(offset).limit(limit)))
+
+
+def _search_text(
+    session: Session,
+    tokens: list[str],
+    limit: int,
+    offset: int,
+    exclude: ColumnElement[bool] | None = None,
+) -> list[Part]:
+    """Token search over the searchable columns (FTS-backed where available)."""
+
+    indexed = [t for t in tokens if len(t) >= _TRIGRAM]
+    if indexed and _has_part_fts(session):
+        match = _fts_match(indexed)
+        fts = literal_column(PART_FTS_TABLE)
+        whole = " ".join(tokens).lower()
+        pn = func.lower(Part.part_number)
+        stmt = (
+            select(Part)
+            .join(_part_fts, _part_fts.c.rowid == Part.id)
+            .where(fts.op("MATCH")(match))
+            .order_by(
+                case((pn == whole, 0), (pn.startswith(whole, autoescape=True), 1), else_=2),
+                func.bm25(fts, *_FTS_WEIGHTS),
+                Part.part_number,
+            )
+        )
+        rest = [t for t in tokens if len(t) < _TRIGRAM]
+    else:
+        stmt = select(Part).order_by(Part.part_number)
+        rest = tokens
+    if rest:
+        stmt = stmt.where(and_(*(_like_any_column(t) for t in rest)))
+    if exclude is not None:
+        stmt = stmt.where(not_(exclude))
+    return list(session.exec(stmt.offset(offset).limit(limit)))
 
 
 def _raise_unique_part_number(part_number: str) -> None:
@@ -268,20 +502,7 @@ def _raise_unique_part_number(part_number: str) -> None:
 def update_part(session: Session, part_id: int, **fields) -> Part:
     """Update mutable fields for a part and enforce unique part numbers."""
 
-    allowed = {
-        "part_number",
-        "description",
-        "package",
-        "value",
-        "function",
-        "active_passive",
-        "power_required",
-        "datasheet_url",
-        "product_url",
-        "tol_p",
-        "tol_n",
-    }
-    updates = {k: v for k, v in fields.items() if k in allowed}
+    updates = {k: v for k, v in fields.items() if k in EDITABLE_PART_FIELDS}
     part = session.get(Part, part_id)
     if part is None:
         raise ValueError(f"Part {part_id} not found")
@@ -314,6 +535,143 @@ def update_part(session: Session, part_id: int, **fields) -> Part:
     return part
 
 
+def _strip_or_none(value: Any) -> str | None:
+    return (value or "").strip() or None
+
+
+def _required_part_number(value: Any) -> str:
+    number = (value or "").strip()
+    if not number:
+        raise ValueError("part_number must not be empty")
+    return number
+
+
+_TRUE_TEXT = frozenset({"1", "true", "yes", "on"})
+_FALSE_TEXT = frozenset({"0", "false", "no", "off"})
+
+
+def _parse_bool(value: Any) -> bool:
+    """Parse a flag from a checkbox, JSON or text; ``bool("false")`` is ``True``."""
+
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in _TRUE_TEXT:
+            return True
+        if text in _FALSE_TEXT:
+            return False
+    raise ValueError(f"Invalid boolean value: {value!r}")
+
+
+# Same normalisation as the single-field ``update_part_*`` helpers.
+_BULK_FIELD_COERCE: dict[str, Callable[[Any], Any]] = {
+    "part_number": _required_part_number,
+    "description": lambda v: (v or "").strip(),
+    "package": lambda v: v,
+    "value": lambda v: v,
+    "function": _strip_or_none,
+    "active_passive": lambda v: v if isinstance(v, PartType) else PartType(v),
+    "power_required": _parse_bool,
+    "datasheet_url": lambda v: v or None,
+    "product_url": lambda v: v or None,
+    "tol_p": lambda v: v or None,
+    "tol_n": lambda v: v or None,
+}
+
+
+@dataclass
+class BulkPartUpdateResult:
+    """Outcome of :func:`bulk_update_parts`: ids written and reasons per failed id."""
+
+    updated: list[int] = field(default_factory=list)
+    failed: dict[int, str] = field(default_factory=dict)
+
+
+def _coerce_part_edits(edits: Mapping[str, Any]) -> dict[str, Any]:
+    unknown = set(edits) - EDITABLE_PART_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown part field(s): {', '.join(sorted(unknown))}")
+    values = {key: _BULK_FIELD_COERCE[key](value) for key, value in edits.items()}
+    if "part_number" in values:
+        values.update(part_number_keys(values["part_number"]))
+    return values
+
+
+def _write_part_updates(session: Session, updates: dict[int, dict[str, Any]]) -> None:
+    with bulk_write(session):
+        bulk_update_by_id(session, Part.__table__, updates)
+    bump_bom_versions(session, part_ids=updates)
+
+
+def bulk_update_parts(
+    session: Session, updates: Mapping[int, Mapping[str, Any]]
+) -> BulkPartUpdateResult:
+    """Apply ``{part_id: {field: value}}`` edits in one transaction.
+
+    Values are normalised like the single-field helpers.  Edits naming a
+    missing part, an unknown field, an invalid value or a part number that
+    is empty or already taken are reported in ``failed`` and skipped; the
+    rest are written with one executemany ``UPDATE`` per distinct field set
+    and committed once.  Should the database still reject the batch, each
+    part is retried in its own savepoint so only the offending parts fail.
+    """
+
+    result = BulkPartUpdateResult()
+    pending: dict[int, dict[str, Any]] = {}
+    for part_id, edits in updates.items():
+        if not edits:
+            continue
+        try:
+            pending[part_id] = _coerce_part_edits(edits)
+        except ValueError as exc:
+            result.failed[part_id] = str(exc)
+
+    found: set[int] = set()
+    for chunk in chunked(sorted(pending)):
+        found.update(session.exec(select(Part.id).where(Part.id.in_(chunk))))
+    for part_id in [pid for pid in pending if pid not in found]:
+        result.failed[part_id] = f"Part {part_id} not found"
+        del pending[part_id]
+
+    renamed = {pid: v["part_number"] for pid, v in pending.items() if "part_number" in v}
+    claimed: dict[str, int] = {}
+    for part_id, number in renamed.items():
+        if number in claimed:
+            result.failed[part_id] = f"Part number '{number}' already exists."
+            del pending[part_id]
+        else:
+            claimed[number] = part_id
+    for chunk in chunked(sorted(claimed)):
+        stmt = select(Part.id, Part.part_number).where(Part.part_number.in_(chunk))
+        for owner, number in session.exec(stmt):
+            part_id = claimed[number]
+            if owner != part_id and owner not in renamed:
+                result.failed[part_id] = f"Part number '{number}' already exists."
+                pending.pop(part_id, None)
+
+    if not pending:
+        return result
+    try:
+        _write_part_updates(session, pending)
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+        for part_id, values in pending.items():
+            try:
+                with session.begin_nested():
+                    _write_part_updates(session, {part_id: values})
+            except IntegrityError as exc:
+                result.failed[part_id] = str(exc.orig)
+        session.commit()
+    result.updated = [pid for pid in pending if pid not in result.failed]
+    # Loaded instances would otherwise keep serving pre-update values.
+    session.expire_all()
+    return result
+
+
 def count_part_references(session: Session, part_id: int) -> int:
     """Return the number of BOM items referencing the part."""
 
@@ -13,11 +13,6 @@ import re
 import shutil
 from typing import Iterable
 
-try:  # PyMuPDF is an optional dependency but part of the default stack
-    import fitz  # type: ignore
-except Exception:  # pragma: no cover - dependency optional in some environments
-    fitz = None  # type: ignore
-
 from .. import config
 from ..models import Assembly, SchematicFile, SchematicPack
 
@@ -80,7 +75,10 @@ def _unique_filename(root: Path, original_name: str) -> str:
 
 
 def _analyse_pdf(path: Path) -> tuple[int, bool]:
-    if fitz is None:
+    # PyMuPDF is part of the default stack but slow to import; load on use.
+    try:
+        import fitz  # type: ignore
+    except Exception:  # pragma: no cover - dependency optional in some environments
         return 0, False
     try:
         with fitz.open(path) as doc:  # type: ignore[call-arg]
@@ -0,0 +1,96 @@
+"""Per-assembly test-coverage summaries for dashboards.
+
+Summaries are computed from :func:`resolve_tests_bulk` and memoised in
+the assembly's :data:`~app.services.test_resolution.RESOLVED_TESTS` entry,
+so they share its change-version invalidation and size limit; a dashboard
+polling an unchanged assembly costs one version lookup.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+from sqlmodel import Session
+
+from .bom_read_models import resolve_tests_bulk
+from .bom_versions import get_bom_version, has_pending_bump
+from .test_resolution import RESOLVED_TESTS
+
+_NONE = "none"
+
+
+class CoverageBucket(BaseModel):
+    part_type: str
+    power_mode: str
+    source: str
+    method: str
+    count: int
+
+
+class CoverageSummary(BaseModel):
+    assembly_id: int
+    version: Optional[str] = None
+    total: int
+    by_source: Dict[str, int]
+    by_method: Dict[str, int]
+    buckets: List[CoverageBucket]
+
+
+_SUMMARY_KEY = "coverage_summary"
+
+
+def _summarise(session: Session, assembly_id: int, version: Optional[str]) -> CoverageSummary:
+    bulk = resolve_tests_bulk(session, [assembly_id])
+    counts = Counter(
+        zip(
+            (t or _NONE for t in bulk.part_type),
+            (m or _NONE for m in bulk.power_mode),
+            bulk.source,
+            (m or _NONE for m in bulk.method),
+        )
+    )
+    by_source: Counter[str] = Counter()
+    by_method: Counter[str] = Counter()
+    buckets = []
+    for (part_type, power_mode, source, method), count in sorted(counts.items()):
+        by_source[source] += count
+        by_method[method] += count
+        buckets.append(
+            CoverageBucket(
+                part_type=part_type,
+                power_mode=power_mode,
+                source=source,
+                method=method,
+                count=count,
+            )
+        )
+    return CoverageSummary(
+        assembly_id=assembly_id,
+        version=version,
+        total=len(bulk),
+        by_source=dict(by_source),
+        by_method=dict(by_method),
+        buckets=buckets,
+    )
+
+
+def get_test_coverage(session: Session, assembly_id: int) -> CoverageSummary:
+    """Return counts of resolved tests by source, method, part type and mode.
+
+    Lines without a method count under ``"none"``; lines whose part has no
+    active/passive classification count under part type ``"none"``.
+    """
+
+    version = None if has_pending_bump(session) else get_bom_version(session, assembly_id)
+    if version is None:
+        return _summarise(session, assembly_id, None)
+    derived = RESOLVED_TESTS.derived_for(session.get_bind(), assembly_id, version)
+    summary = derived.get(_SUMMARY_KEY)
+    if summary is None:
+        summary = derived[_SUMMARY_KEY] = _summarise(session, assembly_id, version)
+    return summary
+
+
+__all__ = ["CoverageBucket", "CoverageSummary", "get_test_coverage"]
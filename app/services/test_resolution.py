@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import threading
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, Iterable, Mapping, MutableMapping, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, TypeVar
 
+from sqlalchemy import column, table
 from sqlmodel import Session, select
 
 from ..models import (
@@ -16,7 +20,12 @@ from ..models import (
     TestMode,
     TestProfile,
 )
-from ..domain.complex_linker import ComplexLink
+
+# Core handle on ``complex_links``: importing the ComplexLink model would pull
+# the Complex Editor bridge stack into every BOM read.
+complex_links = table("complex_links", column("part_id"))
+
+M = TypeVar("M")
 
 
 @dataclass(slots=True)
@@ -46,6 +55,53 @@ class ResolvedTest:
     powered_detail: str | None = None
 
 
+def coerce_part_type(value: object) -> PartType | None:
+    """Return ``value`` as a :class:`PartType`, or ``None`` if unclassified."""
+
+    if isinstance(value, PartType):
+        return value
+    if isinstance(value, str):
+        try:
+            return PartType(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _profiles_for(part_type: PartType | None, mode: TestMode) -> Tuple[TestProfile, ...]:
+    if part_type == PartType.passive:
+        return (TestProfile.PASSIVE,)
+    if mode == TestMode.powered:
+        return (TestProfile.ACTIVE, TestProfile.PASSIVE)
+    return (TestProfile.PASSIVE, TestProfile.ACTIVE)
+
+
+def pick_part_mapping(
+    mappings: Mapping[Tuple[TestMode, TestProfile], M] | None,
+    part_type: PartType | None,
+    mode: TestMode,
+) -> M | None:
+    """Choose a part's default test for ``mode`` from ``(mode, profile)`` keyed mappings.
+
+    Profiles are tried in the order the part type prefers; powered lookups
+    fall back to the unpowered mappings.
+    """
+
+    if not mappings:
+        return None
+    profiles = _profiles_for(part_type, mode)
+    for profile in profiles:
+        candidate = mappings.get((mode, profile))
+        if candidate is not None:
+            return candidate
+    if mode == TestMode.powered:
+        for profile in profiles:
+            candidate = mappings.get((TestMode.unpowered, profile))
+            if candidate is not None:
+                return candidate
+    return None
+
+
 class BOMTestResolver:
     """Resolve powered/unpowered tests for BOM items using cached lookups."""
 
@@ -58,6 +114,7 @@ class BOMTestResolver:
         overrides: Iterable[BOMItemTestOverride],
         *,
         ce_linked_parts: Iterable[int] | None = None,
+        resolved: MutableMapping[Tuple[int, TestMode], ResolvedTest] | None = None,
     ) -> None:
         self._assembly_id = assembly_id
         self._bom_items = bom_items
@@ -74,7 +131,10 @@ class BOMTestResolver:
                 override.power_mode
             ] = override
         self._cache: MutableMapping[Tuple[int, TestMode], TestSelection] = {}
+        self._part_results: dict[Tuple[int | None, TestMode], ResolvedTest] = {}
         self._ce_linked_parts: set[int] = set(ce_linked_parts or [])
+        # Optionally shared with RESOLVED_TESTS so results outlive the resolver.
+        self._resolved = resolved if resolved is not None else {}
 
     @classmethod
     def from_session(
@@ -111,7 +171,7 @@ class BOMTestResolver:
         ce_linked_parts: set[int] = set()
         if part_ids:
             linked_rows = session.exec(
-                select(ComplexLink.part_id).where(ComplexLink.part_id.in_(part_ids))
+                select(complex_links.c.part_id).where(complex_links.c.part_id.in_(part_ids))
             ).all()
             for row in linked_rows:
                 if isinstance(row, tuple):
@@ -144,7 +204,37 @@ class BOMTestResolver:
                 message=f"BOM item {bom_item_id} not loaded for assembly {self._assembly_id}",
             )
 
+        known = self._resolved.get((bom_item_id, assembly_test_mode))
+        if known is not None:
+            return known
+        resolved = self._resolve_with_part(bom_item_id, item, assembly_test_mode)
+        self._resolved[(bom_item_id, assembly_test_mode)] = resolved
+        return resolved
+
+    def _resolve_with_part(
+        self, bom_item_id: int, item: object, assembly_test_mode: TestMode
+    ) -> ResolvedTest:
         part = self._parts.get(bom_item_id)
+        # Without item overrides the result depends only on the part, so
+        # every reference of a part shares one resolution.
+        part_key = None
+        if part is not None and bom_item_id not in self._overrides:
+            part_key = (getattr(part, "id", None), assembly_test_mode)
+            shared = self._part_results.get(part_key)
+            if shared is not None:
+                return shared
+        resolved = self._resolve_item(bom_item_id, item, part, assembly_test_mode)
+        if part_key is not None:
+            self._part_results[part_key] = resolved
+        return resolved
+
+    def _resolve_item(
+        self,
+        bom_item_id: int,
+        item: object,
+        part: Part | None,
+        assembly_test_mode: TestMode,
+    ) -> ResolvedTest:
         part_type = self._part_type_for(part)
         if part is None:
             return ResolvedTest(
@@ -283,22 +373,7 @@ class BOMTestResolver:
     def _pick_mapping(
         self, part_id: int, part: Part, mode: TestMode
     ) -> Optional[PartTestMap]:
-        by_mode = self._mappings.get(part_id)
-        if not by_mode:
-            return None
-
-        part_type = self._part_type_for(part)
-        profiles = self._profiles_for(part_type, mode)
-        for profile in profiles:
-            candidate = by_mode.get((mode, profile))
-            if candidate is not None:
-                return candidate
-        if mode == TestMode.powered:
-            for profile in profiles:
-                candidate = by_mode.get((TestMode.unpowered, profile))
-                if candidate is not None:
-                    return candidate
-        return None
+        return pick_part_mapping(self._mappings.get(part_id), self._part_type_for(part), mode)
 
     @staticmethod
     def _method_label(obj: object) -> str | None:
@@ -314,23 +389,7 @@ class BOMTestResolver:
     def _part_type_for(part: Part | None) -> PartType | None:
         if part is None:
             return None
-        part_type = getattr(part, "active_passive", None)
-        if isinstance(part_type, PartType):
-            return part_type
-        if isinstance(part_type, str):
-            try:
-                return PartType(part_type)
-            except ValueError:
-                return None
-        return None
-
-    @staticmethod
-    def _profiles_for(part_type: PartType | None, mode: TestMode) -> Tuple[TestProfile, ...]:
-        if part_type == PartType.passive:
-            return (TestProfile.PASSIVE,)
-        if mode == TestMode.powered:
-            return (TestProfile.ACTIVE, TestProfile.PASSIVE)
-        return (TestProfile.PASSIVE, TestProfile.ACTIVE)
+        return coerce_part_type(getattr(part, "active_passive", None))
 
     @staticmethod
     def _missing_message(part: Part, mode: TestMode) -> str:
@@ -338,4 +397,72 @@ class BOMTestResolver:
         return f"Missing {mode.value} test assignment for part {pn}"
 
 
-__all__ = ["BOMTestResolver", "ResolvedTest", "TestSelection"]
+ResolvedMap = MutableMapping[Tuple[int, TestMode], ResolvedTest]
+# (change version, resolved tests, values derived from them)
+_CacheEntry = Tuple[str, ResolvedMap, Dict[str, Any]]
+
+
+class ResolvedTestCache:
+    """Process-wide resolved tests per assembly, tagged with a change version.
+
+    Entries are scoped to the database bind (engine) and hold the results
+    for one ``bom_change_version`` of an assembly; asking for any other
+    version drops the entry.  Because every write to parts, mappings,
+    overrides, CE links or the assembly bumps that version, a stale entry
+    can never be returned, including for writes made by another process.
+    Values derived from the same results (e.g. coverage summaries) live in
+    the entry's :meth:`derived_for` map and share its version and eviction.
+    """
+
+    def __init__(self, max_assemblies: int = 64) -> None:
+        self.max_assemblies = max_assemblies
+        self._lock = threading.Lock()
+        self._binds: "weakref.WeakKeyDictionary[object, OrderedDict[int, _CacheEntry]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _entry(self, bind: object, assembly_id: int, version: str) -> _CacheEntry:
+        with self._lock:
+            entries = self._binds.get(bind)
+            if entries is None:
+                entries = self._binds[bind] = OrderedDict()
+            entry = entries.get(assembly_id)
+            if entry is None or entry[0] != version:
+                entry = (version, {}, {})
+                entries[assembly_id] = entry
+            entries.move_to_end(assembly_id)
+            while len(entries) > self.max_assemblies:
+                entries.popitem(last=False)
+            return entry
+
+    def results_for(self, bind: object, assembly_id: int, version: str) -> ResolvedMap:
+        """Return the (possibly empty) result map for ``assembly_id`` at ``version``."""
+
+        return self._entry(bind, assembly_id, version)[1]
+
+    def derived_for(self, bind: object, assembly_id: int, version: str) -> Dict[str, Any]:
+        """Return the (possibly empty) map of values derived at ``version``."""
+
+        return self._entry(bind, assembly_id, version)[2]
+
+    def cached_assemblies(self, bind: object) -> List[int]:
+        """Assembly ids held for ``bind``, least recently used first."""
+
+        with self._lock:
+            return list(self._binds.get(bind) or ())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._binds.clear()
+
+
+RESOLVED_TESTS = ResolvedTestCache()
+
+
+__all__ = [
+    "BOMTestResolver",
+    "RESOLVED_TESTS",
+    "ResolvedTest",
+    "ResolvedTestCache",
+    "TestSelection",
+]
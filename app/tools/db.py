@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import sys
+from pathlib import Path
 
 from sqlalchemy.engine import Engine
 
-from ..database import engine as default_engine
+from .. import database
 from ..db_safe_migrate import pending_sqlite_migrations, run_sqlite_safe_migrations
 
 
@@ -17,21 +18,56 @@ def _print_pending(engine: Engine) -> None:
             print(f"Missing column {table}.{column} ({ddl})")
 
 
+def _print_stamp(engine: Engine) -> None:
+    recorded = database.read_schema_stamp(engine)
+    expected = database.schema_fingerprint()
+    if recorded == expected:
+        print(f"Schema stamp current ({expected[:12]})")
+    elif recorded is None:
+        print("Schema not stamped; run 'python -m app.tools.db stamp'")
+    else:
+        print(f"Schema stamp outdated ({recorded[:12]} != {expected[:12]})")
+
+
+_MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+
+
+def _run_alembic_upgrade(engine: Engine) -> bool:
+    """Upgrade a server database to the Alembic head revision."""
+
+    try:
+        from alembic import command
+        from alembic.config import Config
+    except ImportError:
+        print("Alembic is not installed; install it to migrate non-SQLite databases")
+        return False
+    cfg = Config(str(_MIGRATIONS_DIR / "alembic.ini"))
+    cfg.set_main_option("script_location", str(_MIGRATIONS_DIR))
+    url = engine.url.render_as_string(hide_password=False)
+    cfg.set_main_option("sqlalchemy.url", url.replace("%", "%%"))
+    command.upgrade(cfg, "head")
+    print("Upgraded to Alembic head")
+    return True
+
+
 def main() -> None:
     if len(sys.argv) < 2:
-        print("Usage: python -m app.tools.db [doctor|migrate]")
+        print("Usage: python -m app.tools.db [doctor|migrate|stamp]")
         return
     cmd = sys.argv[1]
-    engine = default_engine
+    engine = database.resolve_engine()
     print(f"Dialect: {engine.dialect.name}")
     if cmd == "doctor":
         if engine.dialect.name == "sqlite":
             _print_pending(engine)
         else:
             print("Non-SQLite database, nothing to do")
+        _print_stamp(engine)
     elif cmd == "migrate":
         if engine.dialect.name != "sqlite":
-            print("Non-SQLite database, skipping")
+            if _run_alembic_upgrade(engine):
+                fingerprint = database.verify_schema(engine)
+                print(f"Recorded schema version {fingerprint[:12]}")
             return
         applied = run_sqlite_safe_migrations(engine)
         if not applied:
@@ -39,6 +75,11 @@ def main() -> None:
         else:
             for table, column in applied:
                 print(f"Added column {table}.{column}")
+        fingerprint = database.verify_schema(engine)
+        print(f"Recorded schema version {fingerprint[:12]}")
+    elif cmd == "stamp":
+        fingerprint = database.verify_schema(engine)
+        print(f"Recorded schema version {fingerprint[:12]}")
     else:
         print("Unknown command", cmd)
 
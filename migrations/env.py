@@ -2,10 +2,11 @@ from logging.config import fileConfig
 from sqlalchemy import engine_from_config, pool
 from alembic import context
 from sqlmodel import SQLModel
-import app.main as models
+import app.models  # noqa: F401  (registers tables on SQLModel.metadata)
 
 config = context.config
-fileConfig(config.config_file_name)
+if config.config_file_name and config.file_config.has_section("formatters"):
+    fileConfig(config.config_file_name)
 
 target_metadata = SQLModel.metadata
 
@@ -1,9 +0,0 @@
-# placeholder for milestone 6
-from alembic import op
-import sqlalchemy as sa
-
-def upgrade():
-    pass
-
-def downgrade():
-    pass
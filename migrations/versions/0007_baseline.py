@@ -0,0 +1,78 @@
+"""Baseline schema as of milestone 7.
+
+Replaces the unnumbered milestone scripts 0001-0007, which carried no
+revision ids and could not be chained.  Tables come from the application
+models except where a later revision reshapes them: ``assembly`` and
+``part_test_map`` are created in their pre-0008 form, and the tables added
+by 0009/0010 are left to those revisions.  Existing tables are left alone,
+so a database created before Alembic was wired up is adopted as-is.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0007_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+_LATER_TABLES = {"bom_item_test_override", "bom_change_version"}
+
+
+def _create_assembly() -> None:
+    op.create_table(
+        "assembly",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("project_id", sa.Integer, sa.ForeignKey("project.id"), nullable=False),
+        sa.Column("rev", sa.String(), nullable=False),
+        sa.Column("notes", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+
+
+def _create_part_test_map() -> None:
+    op.create_table(
+        "part_test_map",
+        sa.Column(
+            "part_id",
+            sa.Integer,
+            sa.ForeignKey("part.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "test_macro_id",
+            sa.Integer,
+            sa.ForeignKey("testmacro.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("part_id", "test_macro_id", name="part_test_map_pkey"),
+    )
+
+
+_LEGACY_TABLES = {"assembly": _create_assembly, "part_test_map": _create_part_test_map}
+
+
+def upgrade() -> None:
+    from sqlmodel import SQLModel
+
+    import app.models  # noqa: F401  (registers tables on SQLModel.metadata)
+
+    bind = op.get_bind()
+    existing = set(sa.inspect(bind).get_table_names())
+    for table in SQLModel.metadata.sorted_tables:
+        if table.name in existing or table.name in _LATER_TABLES:
+            continue
+        legacy = _LEGACY_TABLES.get(table.name)
+        if legacy is not None:
+            legacy()
+        else:
+            table.create(bind)
+
+
+def downgrade() -> None:
+    from sqlmodel import SQLModel
+
+    import app.models  # noqa: F401
+
+    SQLModel.metadata.drop_all(op.get_bind(), checkfirst=True)
@@ -5,12 +5,18 @@ import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision = "0008_add_power_mode_and_profile"
-down_revision = "0007_test_methods"
+down_revision = "0007_baseline"
 branch_labels = None
 depends_on = None
 
 
 def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    assembly_cols = {c["name"] for c in inspector.get_columns("assembly")}
+    mapping_cols = {c["name"] for c in inspector.get_columns("part_test_map")}
+    if "test_mode" in assembly_cols and "profile" in mapping_cols:
+        # Created by the baseline with the current schema.
+        return
     test_mode_enum = sa.Enum("powered", "non_powered", name="test_mode_enum")
     test_profile_enum = sa.Enum("ACTIVE", "PASSIVE", name="test_profile_enum")
     bind = op.get_bind()
@@ -37,6 +43,10 @@ def upgrade() -> None:
                 server_default="PASSIVE",
             )
         )
+
+    # Separate batch: SQLite batch mode drops constraints on columns added
+    # in the same batch.
+    with op.batch_alter_table("part_test_map") as batch:
         batch.drop_constraint("part_test_map_pkey", type_="primary")
         batch.create_primary_key("pk_part_test_map", ["part_id", "test_id", "profile"])
         batch.create_unique_constraint(
@@ -14,10 +14,8 @@ def _rename_enum_value(bind, enum_name: str, old: str, new: str) -> None:
     if bind.dialect.name == "postgresql":
         op.execute(f"ALTER TYPE {enum_name} RENAME VALUE '{old}' TO '{new}'")
     else:
-        op.execute(
-            sa.text(
-                f"UPDATE assembly SET test_mode = :new WHERE test_mode = :old"
-            ),
+        bind.execute(
+            sa.text("UPDATE assembly SET test_mode = :new WHERE test_mode = :old"),
             {"old": old, "new": new},
         )
 
@@ -72,6 +70,10 @@ def _dedupe_part_test_map(bind) -> None:
 def upgrade() -> None:
     bind = op.get_bind()
     inspector = sa.inspect(bind)
+    mapping_cols = {c["name"] for c in inspector.get_columns("part_test_map")}
+    if "power_mode" in mapping_cols and "bom_item_test_override" in inspector.get_table_names():
+        # Created by the baseline with the current schema.
+        return
 
     _rename_enum_value(bind, "test_mode_enum", "non_powered", "unpowered")
 
@@ -106,11 +108,20 @@ def upgrade() -> None:
             sa.Column(
                 "python_test_id",
                 sa.Integer,
-                sa.ForeignKey("pythontest.id", ondelete="CASCADE"),
+                # Named: SQLite batch mode cannot add an unnamed constraint.
+                sa.ForeignKey(
+                    "pythontest.id",
+                    ondelete="CASCADE",
+                    name="fk_part_test_map_python_test_id",
+                ),
                 nullable=True,
             )
         )
         batch.add_column(sa.Column("detail", sa.Text, nullable=True))
+
+    # Separate batch: SQLite batch mode drops constraints on columns added
+    # in the same batch.
+    with op.batch_alter_table("part_test_map") as batch:
         batch.drop_index("ptm_part_profile_idx")
         batch.drop_constraint("uq_part_test_map_part_test_profile", type_="unique")
         batch.drop_constraint("pk_part_test_map", type_="primary")
@@ -0,0 +1,25 @@
+"""Per-assembly BOM change versions for HTTP cache validation."""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0010_bom_change_version"
+down_revision = "0009_board_test_modes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if "bom_change_version" in sa.inspect(bind).get_table_names():
+        return
+    op.create_table(
+        "bom_change_version",
+        sa.Column("assembly_id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("bom_change_version")
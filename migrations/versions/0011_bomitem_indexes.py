@@ -0,0 +1,57 @@
+"""Indexes on BOM item lookup paths and unique (assembly_id, reference)."""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0011_bomitem_indexes"
+down_revision = "0010_bom_change_version"
+branch_labels = None
+depends_on = None
+
+# Every (assembly_id, reference) pair keeps its lowest id, matching the
+# importer's "first row wins" lookup.
+_DUPLICATES = """
+SELECT id FROM bomitem WHERE id NOT IN (
+  SELECT MIN(id) FROM bomitem GROUP BY assembly_id, reference
+)
+"""
+
+
+def _dedupe_bom_items(bind) -> None:
+    dup_ids = [row[0] for row in bind.execute(sa.text(_DUPLICATES))]
+    if not dup_ids:
+        return
+    tables = sa.inspect(bind).get_table_names()
+    for start in range(0, len(dup_ids), 500):
+        chunk = dup_ids[start : start + 500]
+        params = {f"id{i}": value for i, value in enumerate(chunk)}
+        placeholders = ", ".join(f":id{i}" for i in range(len(chunk)))
+        if "bom_item_test_override" in tables:
+            bind.execute(
+                sa.text(
+                    f"DELETE FROM bom_item_test_override WHERE bom_item_id IN ({placeholders})"
+                ),
+                params,
+            )
+        bind.execute(sa.text(f"DELETE FROM bomitem WHERE id IN ({placeholders})"), params)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    existing = {ix["name"] for ix in sa.inspect(bind).get_indexes("bomitem")}
+    if "ux_bomitem_assembly_reference" not in existing:
+        _dedupe_bom_items(bind)
+        op.create_index(
+            "ux_bomitem_assembly_reference",
+            "bomitem",
+            ["assembly_id", "reference"],
+            unique=True,
+        )
+    if "ix_bomitem_part_id" not in existing:
+        op.create_index("ix_bomitem_part_id", "bomitem", ["part_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_bomitem_part_id", table_name="bomitem")
+    op.drop_index("ux_bomitem_assembly_reference", table_name="bomitem")
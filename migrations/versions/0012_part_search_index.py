@@ -0,0 +1,83 @@
+"""Indexed substring search over the searchable part columns.
+
+SQLite gets a trigram FTS5 table kept in sync by triggers; PostgreSQL gets
+pg_trgm GIN indexes, which serve the ``ILIKE '%term%'`` fallback.  The DDL
+is spelled out here so this revision keeps its meaning if the safe
+migrations change later.
+"""
+
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0012_part_search_index"
+down_revision = "0011_bomitem_indexes"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = (
+    "part_number",
+    "description",
+    "package",
+    "value",
+    "function",
+    "datasheet_url",
+    "product_url",
+)
+_LIST = ", ".join(_COLUMNS)
+_NEW = ", ".join(f"new.{c}" for c in _COLUMNS)
+_OLD = ", ".join(f"old.{c}" for c in _COLUMNS)
+_FTS_TABLE = (
+    f"CREATE VIRTUAL TABLE part_fts USING fts5("
+    f"{_LIST}, content='part', content_rowid='id', tokenize='trigram')"
+)
+_FTS_TRIGGERS = (
+    f"CREATE TRIGGER IF NOT EXISTS part_fts_ai AFTER INSERT ON part BEGIN "
+    f"INSERT INTO part_fts(rowid, {_LIST}) VALUES (new.id, {_NEW}); END",
+    f"CREATE TRIGGER IF NOT EXISTS part_fts_ad AFTER DELETE ON part BEGIN "
+    f"INSERT INTO part_fts(part_fts, rowid, {_LIST}) VALUES ('delete', old.id, {_OLD}); END",
+    f"CREATE TRIGGER IF NOT EXISTS part_fts_au AFTER UPDATE OF id, {_LIST} ON part BEGIN "
+    f"INSERT INTO part_fts(part_fts, rowid, {_LIST}) VALUES ('delete', old.id, {_OLD}); "
+    f"INSERT INTO part_fts(rowid, {_LIST}) VALUES (new.id, {_NEW}); END",
+)
+
+
+def _upgrade_sqlite(bind) -> None:
+    if sa.inspect(bind).has_table("part_fts"):
+        return
+    try:
+        op.execute(_FTS_TABLE)
+    except Exception:  # pragma: no cover - SQLite built without FTS5/trigram (< 3.34)
+        logging.getLogger(__name__).warning(
+            "SQLite lacks FTS5 trigram support; part search stays unindexed"
+        )
+        return
+    for ddl in _FTS_TRIGGERS:
+        op.execute(ddl)
+    op.execute("INSERT INTO part_fts(part_fts) VALUES ('rebuild')")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        _upgrade_sqlite(bind)
+    elif bind.dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for name in _COLUMNS:
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_part_{name}_trgm "
+                f"ON part USING gin ({name} gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        for trigger in ("part_fts_ai", "part_fts_ad", "part_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS part_fts")
+    elif bind.dialect.name == "postgresql":
+        for name in _COLUMNS:
+            op.execute(f"DROP INDEX IF EXISTS ix_part_{name}_trgm")
@@ -0,0 +1,57 @@
+"""Normalised and base part-number columns for fuzzy PN lookups."""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0013_part_number_keys"
+down_revision = "0012_part_search_index"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ("part_number_norm", "part_number_base")
+
+
+def upgrade() -> None:
+    from app.logic.part_numbers import base_part_number, normalize_part_number
+
+    bind = op.get_bind()
+    existing = {c["name"] for c in sa.inspect(bind).get_columns("part")}
+    for name in _COLUMNS:
+        if name not in existing:
+            op.add_column("part", sa.Column(name, sa.String(), nullable=True))
+
+    part = sa.table(
+        "part",
+        sa.column("id"),
+        sa.column("part_number"),
+        sa.column("part_number_norm"),
+        sa.column("part_number_base"),
+    )
+    rows = bind.execute(
+        sa.select(part.c.id, part.c.part_number).where(part.c.part_number_norm.is_(None))
+    ).fetchall()
+    if rows:
+        bind.execute(
+            part.update()
+            .where(part.c.id == sa.bindparam("b_id"))
+            .values(
+                part_number_norm=sa.bindparam("b_norm"),
+                part_number_base=sa.bindparam("b_base"),
+            ),
+            [
+                {"b_id": pid, "b_norm": normalize_part_number(pn), "b_base": base_part_number(pn)}
+                for pid, pn in rows
+            ],
+        )
+
+    indexes = {ix["name"] for ix in sa.inspect(bind).get_indexes("part")}
+    for name in _COLUMNS:
+        if f"ix_part_{name}" not in indexes:
+            op.create_index(f"ix_part_{name}", "part", [name])
+
+
+def downgrade() -> None:
+    for name in _COLUMNS:
+        op.drop_index(f"ix_part_{name}", table_name="part")
+        op.drop_column("part", name)
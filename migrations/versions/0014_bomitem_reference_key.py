@@ -0,0 +1,42 @@
+"""Stored natural-order designator key for keyset BOM pagination."""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0014_bomitem_reference_key"
+down_revision = "0013_part_number_keys"
+branch_labels = None
+depends_on = None
+
+_INDEX = "ix_bomitem_assembly_reference_key"
+
+
+def upgrade() -> None:
+    from app.logic.designators import designator_sort_key
+
+    bind = op.get_bind()
+    existing = {c["name"] for c in sa.inspect(bind).get_columns("bomitem")}
+    if "reference_key" not in existing:
+        op.add_column("bomitem", sa.Column("reference_key", sa.String(), nullable=True))
+
+    item = sa.table("bomitem", sa.column("id"), sa.column("reference"), sa.column("reference_key"))
+    rows = bind.execute(
+        sa.select(item.c.id, item.c.reference).where(item.c.reference_key.is_(None))
+    ).fetchall()
+    if rows:
+        bind.execute(
+            item.update()
+            .where(item.c.id == sa.bindparam("b_id"))
+            .values(reference_key=sa.bindparam("b_key")),
+            [{"b_id": item_id, "b_key": designator_sort_key(ref or "")} for item_id, ref in rows],
+        )
+
+    indexes = {ix["name"] for ix in sa.inspect(bind).get_indexes("bomitem")}
+    if _INDEX not in indexes:
+        op.create_index(_INDEX, "bomitem", ["assembly_id", "reference_key", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index(_INDEX, table_name="bomitem")
+    op.drop_column("bomitem", "reference_key")
@@ -0,0 +1,144 @@
+from importlib import reload
+
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+import app.models as models
+from app.services import import_bom
+
+
+def setup_db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.clear()
+    reload(models)
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def _assembly(session: Session) -> models.Assembly:
+    cust = models.Customer(name="Cust")
+    session.add(cust); session.commit(); session.refresh(cust)
+    proj = models.Project(customer_id=cust.id, code="PRJ", title="Proj")
+    session.add(proj); session.commit(); session.refresh(proj)
+    asm = models.Assembly(project_id=proj.id, rev="A")
+    session.add(asm); session.commit(); session.refresh(asm)
+    return asm
+
+
+def test_repeated_pn_counts_as_matched_after_first_row():
+    engine = setup_db()
+    with Session(engine) as session:
+        asm = _assembly(session)
+        data = (
+            "PN,Reference,Function\n"
+            "P1,R1,\n"
+            "P1,R2,Resistor\n"
+        ).encode()
+        report = import_bom(asm.id, data, session)
+        assert report.errors == []
+        assert (report.total, report.matched, report.unmatched) == (2, 1, 1)
+        part = session.exec(select(models.Part)).one()
+        assert part.function == "Resistor"
+
+
+def test_reimport_updates_existing_items_in_place():
+    engine = setup_db()
+    with Session(engine) as session:
+        asm = _assembly(session)
+        import_bom(asm.id, b"PN,Reference,Manufacturer\nP1,R1,ACME\nP2,R2,\n", session)
+        before = {i.reference: i.id for i in session.exec(select(models.BOMItem))}
+
+        report = import_bom(
+            asm.id, b"PN,Reference,Qty\nP3,R1,2\nP2,R2-R3,\n", session
+        )
+        assert report.errors == []
+        assert (report.matched, report.unmatched) == (1, 1)
+
+        items = {i.reference: i for i in session.exec(select(models.BOMItem))}
+        assert set(items) == {"R1", "R2", "R3"}
+        assert items["R1"].id == before["R1"]
+        assert items["R2"].id == before["R2"]
+        assert items["R1"].qty == 2
+        assert items["R1"].manufacturer == "ACME"
+        parts = {p.id: p.part_number for p in session.exec(select(models.Part))}
+        assert parts[items["R1"].part_id] == "P3"
+
+
+def test_statement_count_does_not_scale_with_rows():
+    engine = setup_db()
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with Session(engine) as session:
+        asm = _assembly(session)
+        lines = ["PN,Reference"] + [f"P{i},R{i}" for i in range(300)]
+        statements.clear()
+        report = import_bom(asm.id, "\n".join(lines).encode(), session)
+        assert report.total == 300
+        assert len(statements) < 15
+        assert len(session.exec(select(models.BOMItem)).all()) == 300
+
+
+def test_dry_run_reports_diff_without_writing():
+    engine = setup_db()
+    with Session(engine) as session:
+        asm = _assembly(session)
+        import_bom(asm.id, b"PN,Reference,Manufacturer\nP1,R1,ACME\nP2,R2,\nP2,R9,\n", session)
+        snapshot = sorted(
+            (i.reference, i.part_id, i.qty, i.manufacturer)
+            for i in session.exec(select(models.BOMItem))
+        )
+
+        data = (
+            "PN,Reference,Manufacturer,Function\n"
+            "P1,R1,ACME,\n"
+            "P2,R2,Other,Cap\n"
+            "P3,R3,,\n"
+            ",R4,,\n"
+        ).encode()
+        report = import_bom(asm.id, data, session, dry_run=True)
+
+        assert (report.total, report.matched, report.unmatched) == (3, 2, 1)
+        assert len(report.errors) == 1
+        diff = report.diff
+        assert diff.new_parts == ["P3"]
+        assert diff.updated_parts == ["P2"]
+        assert diff.inserted_items == ["R3"]
+        assert diff.updated_items == ["R2"]
+        assert diff.unchanged_items == ["R1"]
+        assert diff.missing_items == ["R9"]
+
+        session.expire_all()
+        after = sorted(
+            (i.reference, i.part_id, i.qty, i.manufacturer)
+            for i in session.exec(select(models.BOMItem))
+        )
+        assert after == snapshot
+        assert session.exec(select(models.Part).where(models.Part.part_number == "P3")).first() is None
+
+
+def test_reimport_skips_unchanged_items():
+    engine = setup_db()
+    with Session(engine) as session:
+        asm = _assembly(session)
+        data = b"PN,Reference\n" + b"".join(f"P{i},R{i}\n".encode() for i in range(50))
+        import_bom(asm.id, data, session)
+
+        statements: list[str] = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            report = import_bom(asm.id, data, session)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert report.errors == []
+        assert not [s for s in statements if s.lstrip().upper().startswith("UPDATE")]
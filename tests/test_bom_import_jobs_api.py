@@ -0,0 +1,106 @@
+import os
+import time
+from importlib import import_module, reload
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+
+def _setup_app(tmp_path):
+    os.environ["BOM_DATA_ROOT"] = str(tmp_path / "data")
+    config = reload(import_module("app.config"))
+    config.refresh_paths()
+
+    SQLModel.metadata.clear()
+    models = reload(import_module("app.models"))
+    auth = reload(import_module("app.auth"))
+    reload(import_module("app.routers.jobs"))
+    api_module = reload(import_module("app.api"))
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    def session_override():
+        with Session(engine) as session:
+            yield session
+
+    api_module.app.dependency_overrides[api_module.get_session] = session_override
+    api_module.app.dependency_overrides[auth.get_current_user] = lambda: models.User(
+        id=1, username="tester", hashed_password="x"
+    )
+    return api_module, models, engine
+
+
+@pytest.fixture()
+def client(tmp_path):
+    api_module, models, engine = _setup_app(tmp_path)
+    client = TestClient(api_module.app)
+    try:
+        yield client, models, engine
+    finally:
+        client.close()
+        api_module.app.dependency_overrides.clear()
+
+
+def _assembly(models, engine) -> int:
+    with Session(engine) as session:
+        cust = models.Customer(name="Cust")
+        session.add(cust); session.commit(); session.refresh(cust)
+        proj = models.Project(customer_id=cust.id, code="PRJ", title="Proj")
+        session.add(proj); session.commit(); session.refresh(proj)
+        asm = models.Assembly(project_id=proj.id, rev="A")
+        session.add(asm); session.commit(); session.refresh(asm)
+        return asm.id
+
+
+def _wait_for(client_app, job_id: str) -> dict:
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        resp = client_app.get(f"/jobs/{job_id}")
+        assert resp.status_code == 200
+        body = resp.json()
+        if body["status"] in ("succeeded", "failed"):
+            return body
+        time.sleep(0.02)
+    raise AssertionError("import job did not finish")
+
+
+def test_async_import_returns_job_and_reports_progress(client):
+    client_app, models, engine = client
+    asm_id = _assembly(models, engine)
+    csv_bytes = b"PN,Reference\nP1,R1\nP2,R2-R4\n"
+
+    resp = client_app.post(
+        f"/assemblies/{asm_id}/bom/import",
+        params={"async": "1"},
+        files={"file": ("bom.csv", csv_bytes, "text/csv")},
+    )
+    assert resp.status_code == 202
+    job = resp.json()
+    assert resp.headers["Location"] == f"/jobs/{job['id']}"
+    assert job["assembly_id"] == asm_id
+
+    body = _wait_for(client_app, job["id"])
+    assert body["status"] == "succeeded"
+    assert (body["processed"], body["total"]) == (2, 2)
+    assert body["report"]["total"] == 2
+    assert body["report"]["errors"] == []
+    with Session(engine) as session:
+        refs = {i.reference for i in session.exec(select(models.BOMItem))}
+    assert refs == {"R1", "R2", "R3", "R4"}
+
+
+def test_async_import_unknown_assembly_and_job(client):
+    client_app, _models, _engine = client
+    resp = client_app.post(
+        "/assemblies/999/bom/import?async=1",
+        files={"file": ("bom.csv", b"PN,Reference\n", "text/csv")},
+    )
+    assert resp.status_code == 404
+    assert client_app.get("/jobs/does-not-exist").status_code == 404
@@ -36,3 +36,29 @@ def test_import_minimal_csv():
         items = session.exec(select(models.BOMItem)).all()
         assert len(parts) == 1 and parts[0].part_number == "P1"
         assert len(items) == 1 and items[0].qty == 1
+
+
+def test_import_reuses_part_with_punctuation_variant():
+    engine = setup_db()
+    with Session(engine) as session:
+        cust = models.Customer(name="Cust")
+        session.add(cust); session.commit(); session.refresh(cust)
+        proj = models.Project(customer_id=cust.id, code="PRJ", title="Proj")
+        session.add(proj); session.commit(); session.refresh(proj)
+        asm = models.Assembly(project_id=proj.id, rev="A")
+        session.add(asm); session.commit(); session.refresh(asm)
+        session.add(models.Part(part_number="SN74HCT240N")); session.commit()
+
+        data = b"PN,Reference\nsn74hct-240n,U1\nAB-12,U2\nab12,U3\n"
+        report = import_bom(asm.id, data, session)
+        assert not report.errors and report.matched == 2
+
+        parts = {p.part_number: p for p in session.exec(select(models.Part))}
+        assert set(parts) == {"SN74HCT240N", "AB-12"}
+        assert parts["AB-12"].part_number_norm == "AB12"
+        items = {i.reference: i.part_id for i in session.exec(select(models.BOMItem))}
+        assert items == {
+            "U1": parts["SN74HCT240N"].id,
+            "U2": parts["AB-12"].id,
+            "U3": parts["AB-12"].id,
+        }
@@ -0,0 +1,114 @@
+import io
+import tempfile
+from importlib import reload
+
+from openpyxl import Workbook
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+import app.models as models
+from app.services import import_bom
+
+
+def setup_db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.clear()
+    reload(models)
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def _assembly(session: Session) -> models.Assembly:
+    cust = models.Customer(name="Cust")
+    session.add(cust); session.commit(); session.refresh(cust)
+    proj = models.Project(customer_id=cust.id, code="PRJ", title="Proj")
+    session.add(proj); session.commit(); session.refresh(proj)
+    asm = models.Assembly(project_id=proj.id, rev="A")
+    session.add(asm); session.commit(); session.refresh(asm)
+    return asm
+
+
+def test_import_from_spooled_file_streams_rows_and_keeps_file_open():
+    engine = setup_db()
+    with Session(engine) as session:
+        asm = _assembly(session)
+        spooled = tempfile.SpooledTemporaryFile(max_size=64)
+        spooled.write(b"\xef\xbb\xbfPN,Reference\n")
+        for i in range(1200):
+            spooled.write(f"P{i % 7},R{i}\n".encode())
+        progress: list[tuple[int, int]] = []
+
+        report = import_bom(
+            asm.id, spooled, session, progress_cb=lambda c, t: progress.append((c, t))
+        )
+        assert report.errors == []
+        assert report.total == 1200
+        assert report.unmatched == 7
+        assert progress[0] == (0, 1200)
+        assert progress[-1] == (1200, 1200)
+        assert not spooled.closed
+        assert len(session.exec(select(models.BOMItem)).all()) == 1200
+
+
+def _workbook() -> bytes:
+    wb = Workbook()
+    cover = wb.active
+    cover.title = "Cover"
+    cover.append(["Customer export"])
+    current = wb.create_sheet("BOM")
+    current.append(["PN", "Reference"])
+    current.append(["P1", "R1"])
+    current.append(["P2", "R2"])
+    old = wb.create_sheet("BOM (rev A)")
+    old.append(["Designator", "MPN", "Qty"])
+    old.append(["R1", "P9", "1"])
+    old.append(["C1", "P2", "x"])
+    old.append(["C2", "P2", ""])
+    bio = io.BytesIO()
+    wb.save(bio)
+    return bio.getvalue()
+
+
+def test_import_xlsx_reads_first_valid_sheet_only():
+    engine = setup_db()
+    with Session(engine) as session:
+        asm = _assembly(session)
+        report = import_bom(asm.id, _workbook(), session)
+        assert report.errors == []
+        assert report.total == 2
+        assert report.sheet == "BOM"
+        items = {i.reference: i.part_id for i in session.exec(select(models.BOMItem))}
+        # The old revision's R1 -> P9 and C1/C2 rows are not merged in.
+        assert set(items) == {"R1", "R2"}
+        p9 = session.exec(select(models.Part).where(models.Part.part_number == "P9")).first()
+        assert p9 is None
+
+
+def test_import_xlsx_named_sheet():
+    engine = setup_db()
+    with Session(engine) as session:
+        asm = _assembly(session)
+        report = import_bom(asm.id, _workbook(), session, sheet="BOM (rev A)")
+        assert report.sheet == "BOM (rev A)"
+        assert report.errors and report.errors[0].startswith("Row 3")
+        refs = {i.reference for i in session.exec(select(models.BOMItem))}
+        assert refs == {"R1", "C2"}
+
+        missing = import_bom(asm.id, _workbook(), session, sheet="Panel Z")
+        assert missing.errors == ["Worksheet 'Panel Z' not found"]
+
+
+def test_import_expands_panel_designator_ranges():
+    engine = setup_db()
+    with Session(engine) as session:
+        asm = _assembly(session)
+        data = b'PN,Reference\nP1,"C1-C400"\nP2,R10A-R10C U1:U2\n'
+        report = import_bom(asm.id, data, session)
+        assert report.errors == []
+        refs = {i.reference for i in session.exec(select(models.BOMItem))}
+    assert len(refs) == 405
+    assert {"C400", "R10A", "R10C", "U2"} <= refs
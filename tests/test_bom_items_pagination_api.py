@@ -0,0 +1,217 @@
+import os
+from importlib import import_module, reload
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.domain.complex_linker import ComplexLink
+
+
+@pytest.fixture()
+def client(tmp_path):
+    os.environ["BOM_DATA_ROOT"] = str(tmp_path / "data")
+    config = reload(import_module("app.config"))
+    config.refresh_paths()
+
+    SQLModel.metadata.clear()
+    models = reload(import_module("app.models"))
+    auth = reload(import_module("app.auth"))
+    api_module = reload(import_module("app.api"))
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    ComplexLink.__table__.create(engine)
+
+    def session_override():
+        with Session(engine) as session:
+            yield session
+
+    api_module.app.dependency_overrides[api_module.get_session] = session_override
+    api_module.app.dependency_overrides[auth.get_current_user] = lambda: models.User(
+        id=1, username="tester", hashed_password="x"
+    )
+    client = TestClient(api_module.app)
+    try:
+        yield client, models, engine
+    finally:
+        client.close()
+        api_module.app.dependency_overrides.clear()
+
+
+def _seed(models, engine, refs) -> int:
+    with Session(engine) as session:
+        cust = models.Customer(name="Cust")
+        session.add(cust); session.commit(); session.refresh(cust)
+        proj = models.Project(customer_id=cust.id, code="PRJ", title="Proj")
+        session.add(proj); session.commit(); session.refresh(proj)
+        asm = models.Assembly(project_id=proj.id, rev="A")
+        session.add(asm); session.commit(); session.refresh(asm)
+        part = models.Part(part_number="P1")
+        session.add(part); session.commit(); session.refresh(part)
+        for ref in refs:
+            session.add(models.BOMItem(assembly_id=asm.id, reference=ref, part_id=part.id))
+        session.commit()
+        return asm.id
+
+
+def test_keyset_pages_follow_natural_order(client):
+    client_app, models, engine = client
+    asm_id = _seed(models, engine, ["R10", "C2", "R2", "C10", "R1", "C1", "U1"])
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3, "fields": "reference,part_number"}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client_app.get(f"/assemblies/{asm_id}/bom/items", params=params)
+        assert resp.status_code == 200
+        body = resp.json()
+        assert all(set(item) == {"reference", "part_number"} for item in body["items"])
+        seen.extend(item["reference"] for item in body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == ["C1", "C2", "C10", "R1", "R2", "R10", "U1"]
+
+
+def test_imported_items_page_in_sql_by_reference_key(client):
+    from sqlalchemy import text
+
+    from app.services import import_bom
+
+    client_app, models, engine = client
+    asm_id = _seed(models, engine, [])
+    with Session(engine) as session:
+        report = import_bom(asm_id, b"PN,Reference\nP1,R10 R9 C100 C99 R007\n", session)
+        assert not report.errors
+
+    first = client_app.get(
+        f"/assemblies/{asm_id}/bom/items", params={"limit": 3, "fields": "reference"}
+    ).json()
+    rest = client_app.get(
+        f"/assemblies/{asm_id}/bom/items",
+        params={"limit": 3, "fields": "reference", "cursor": first["next_cursor"]},
+    ).json()
+    assert [i["reference"] for i in first["items"] + rest["items"]] == [
+        "C99", "C100", "R007", "R9", "R10"
+    ]
+    assert rest["next_cursor"] is None
+
+    with engine.connect() as conn:
+        plan = " ".join(
+            str(r[-1])
+            for r in conn.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT id FROM bomitem WHERE assembly_id = 1 "
+                    "AND (reference_key, id) > ('x', 1) ORDER BY reference_key, id LIMIT 3"
+                )
+            )
+        )
+    assert "ix_bomitem_assembly_reference_key" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_legacy_list_and_bad_params(client):
+    client_app, models, engine = client
+    asm_id = _seed(models, engine, ["R1", "R2"])
+
+    resp = client_app.get(f"/assemblies/{asm_id}/bom/items")
+    assert resp.status_code == 200
+    assert {row["reference"] for row in resp.json()} == {"R1", "R2"}
+
+    assert client_app.get(
+        f"/assemblies/{asm_id}/bom/items", params={"fields": "nope"}
+    ).status_code == 400
+    assert client_app.get(
+        f"/assemblies/{asm_id}/bom/items", params={"cursor": "%%%"}
+    ).status_code == 400
+
+
+def test_etag_short_circuits_unchanged_bom(client, monkeypatch):
+    import app.services.assemblies as assemblies_mod
+    from app.services import delete_bom_items
+
+    client_app, models, engine = client
+    asm_id = _seed(models, engine, ["R1", "R2"])
+    url = f"/assemblies/{asm_id}/bom/items"
+
+    first = client_app.get(url)
+    etag = first.headers["ETag"]
+
+    def boom(*args, **kwargs):
+        raise AssertionError("BOM should not be loaded for a 304")
+
+    with monkeypatch.context() as m:
+        m.setattr(assemblies_mod, "load_bom_snapshot", boom)
+        cached = client_app.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert client_app.get(url, params={"limit": 1}).headers["ETag"] != etag
+
+    with Session(engine) as session:
+        part = session.exec(select(models.Part)).one()
+        part.description = "changed"
+        session.add(part); session.commit()
+    changed = client_app.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    etag = changed.headers["ETag"]
+
+    with Session(engine) as session:
+        item_id = session.exec(select(models.BOMItem.id)).first()
+        delete_bom_items(session, [item_id])
+    after_delete = client_app.get(url, headers={"If-None-Match": etag})
+    assert after_delete.status_code == 200
+    assert len(after_delete.json()) == 1
+
+
+def test_moving_item_bumps_both_assemblies(client):
+    from app.services.bom_versions import get_bom_version
+
+    _client_app, models, engine = client
+    source_id = _seed(models, engine, ["R1", "R2"])
+    with Session(engine) as session:
+        source = session.get(models.Assembly, source_id)
+        target = models.Assembly(project_id=source.project_id, rev="B")
+        session.add(target); session.commit(); session.refresh(target)
+        target_id = target.id
+        before = {a: get_bom_version(session, a) for a in (source_id, target_id)}
+
+    with Session(engine) as session:
+        item = session.exec(select(models.BOMItem).where(models.BOMItem.reference == "R2")).one()
+        item.assembly_id = target_id
+        session.add(item); session.commit()
+        after = {a: get_bom_version(session, a) for a in (source_id, target_id)}
+
+    assert after[source_id] != before[source_id]
+    assert after[target_id] != before[target_id]
+
+
+def test_engine_creation_registers_version_hooks(tmp_path):
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    env = dict(os.environ)
+    env["BOM_DATA_ROOT"] = str(tmp_path / "data")
+    env["BOM_SETTINGS_PATH"] = str(tmp_path / "settings.toml")
+    # A CLI-style process: models and the session factory, never app.services.
+    code = (
+        "import sys, app.models, app.database\n"
+        "from sqlalchemy import event\n"
+        "from sqlalchemy.orm import Session\n"
+        "hooks = sys.modules['app.services.bom_versions']\n"
+        "assert event.contains(Session, 'after_flush', hooks._after_flush)\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        env=env,
+        check=True,
+    )
@@ -1,6 +1,6 @@
 from importlib import reload
 from sqlalchemy.pool import StaticPool
-from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel import SQLModel, create_engine, Session, select
 
 import app.models as models
 from app.services.bom_read_models import get_joined_bom_for_assembly
@@ -48,3 +48,129 @@ def test_get_joined_bom_for_assembly_sorting_and_fields():
         assert first.manufacturer == "M1"
         assert first.active_passive == "passive"
         assert rows[2].part_id == p1.id
+
+
+def test_joined_bom_uses_fixed_query_count():
+    from sqlalchemy import event
+
+    engine = setup_db()
+    with Session(engine) as session:
+        cust = models.Customer(name="Cust")
+        session.add(cust); session.commit(); session.refresh(cust)
+        proj = models.Project(customer_id=cust.id, code="PRJ", title="Proj")
+        session.add(proj); session.commit(); session.refresh(proj)
+        asm = models.Assembly(project_id=proj.id, rev="A")
+        session.add(asm); session.commit(); session.refresh(asm)
+        parts = [models.Part(part_number=f"P{i}") for i in range(20)]
+        session.add_all(parts); session.commit()
+        for i in range(200):
+            part = parts[i % len(parts)]
+            session.add(models.BOMItem(assembly_id=asm.id, part_id=part.id, reference=f"R{i}", qty=1))
+        session.commit()
+        asm_id = asm.id
+
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+        rows = get_joined_bom_for_assembly(session, asm_id)
+    assert len(rows) == 200
+    assert rows[0].reference == "R0" and rows[-1].reference == "R199"
+    # Change version, BOM/part/assembly join, then mappings, overrides and CE links.
+    assert len(statements) == 5
+    # The version is read first so rows are never older than the cache key.
+    assert "bom_change_version" in statements[0]
+    assert "FROM bomitem" in statements[1]
+
+
+def test_resolved_tests_cached_until_relevant_change():
+    from sqlalchemy import event
+    from app.services.test_resolution import RESOLVED_TESTS
+
+    RESOLVED_TESTS.clear()
+    engine = setup_db()
+    with Session(engine) as session:
+        cust = models.Customer(name="Cust")
+        session.add(cust); session.commit(); session.refresh(cust)
+        proj = models.Project(customer_id=cust.id, code="PRJ", title="Proj")
+        session.add(proj); session.commit(); session.refresh(proj)
+        asm = models.Assembly(project_id=proj.id, rev="A")
+        part = models.Part(part_number="P1", active_passive=models.PartType.passive)
+        session.add(asm); session.add(part); session.commit()
+        session.add(models.BOMItem(assembly_id=asm.id, part_id=part.id, reference="R1", qty=1))
+        macro = models.TestMacro(name="Resistance")
+        session.add(macro); session.commit()
+        asm_id, part_id, macro_id = asm.id, part.id, macro.id
+
+        first = get_joined_bom_for_assembly(session, asm_id)
+        assert first[0].test_method is None
+
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+        again = get_joined_bom_for_assembly(session, asm_id)
+        assert again[0].test_resolution_message == first[0].test_resolution_message
+        assert len(statements) == 2  # version + BOM rows; no test queries
+
+        session.add(
+            models.PartTestMap(
+                part_id=part_id,
+                power_mode=models.TestMode.unpowered,
+                profile=models.TestProfile.PASSIVE,
+                test_macro_id=macro_id,
+            )
+        )
+        session.commit()
+        rows = get_joined_bom_for_assembly(session, asm_id)
+    assert rows[0].test_method == "Macro"
+    assert rows[0].test_resolution_source == "mapping"
+
+
+def test_resolve_tests_bulk_matches_per_assembly_view():
+    from app.services.bom_read_models import resolve_tests_bulk
+
+    engine = setup_db()
+    with Session(engine) as session:
+        cust = models.Customer(name="Cust")
+        session.add(cust); session.commit(); session.refresh(cust)
+        proj = models.Project(customer_id=cust.id, code="PRJ", title="Proj")
+        session.add(proj); session.commit(); session.refresh(proj)
+        powered = models.Assembly(project_id=proj.id, rev="A", test_mode=models.TestMode.powered)
+        unpowered = models.Assembly(project_id=proj.id, rev="B")
+        active = models.Part(part_number="U", active_passive=models.PartType.active)
+        passive = models.Part(part_number="R", active_passive=models.PartType.passive)
+        session.add_all([powered, unpowered, active, passive]); session.commit()
+        session.add_all([
+            models.PartTestMap(part_id=active.id, power_mode=models.TestMode.powered,
+                               profile=models.TestProfile.ACTIVE, python_test_id=1, detail="boot"),
+            models.PartTestMap(part_id=active.id, power_mode=models.TestMode.unpowered,
+                               profile=models.TestProfile.ACTIVE, test_macro_id=1, detail="diode"),
+        ])
+        for asm in (powered, unpowered):
+            session.add(models.BOMItem(assembly_id=asm.id, part_id=active.id, reference="U1", qty=1))
+            session.add(models.BOMItem(assembly_id=asm.id, part_id=passive.id, reference="R1", qty=1))
+        session.commit()
+        item = session.exec(
+            select(models.BOMItem).where(models.BOMItem.assembly_id == unpowered.id,
+                                         models.BOMItem.reference == "R1")
+        ).one()
+        session.add(models.BOMItemTestOverride(bom_item_id=item.id, power_mode=models.TestMode.unpowered,
+                                               test_macro_id=2, detail="custom"))
+        session.commit()
+        ids = [powered.id, unpowered.id]
+        override_item_id = item.id
+
+        bulk = resolve_tests_bulk(session, ids)
+        expected = {}
+        for aid in ids:
+            for row in get_joined_bom_for_assembly(session, aid):
+                expected[row.bom_item_id] = (aid, row.test_method, row.test_detail, row.test_resolution_source)
+
+    assert len(bulk) == 4
+    assert bulk.assembly_id == sorted(bulk.assembly_id)
+    got = {
+        bulk.bom_item_id[i]: (bulk.assembly_id[i], bulk.method[i], bulk.detail[i], bulk.source[i])
+        for i in range(len(bulk))
+    }
+    assert got == expected
+    modes = dict(zip(zip(bulk.assembly_id, bulk.reference), bulk.power_mode))
+    assert modes[(ids[0], "U1")] == "powered"
+    assert modes[(ids[1], "U1")] == "unpowered"
+    assert bulk.detail[bulk.bom_item_id.index(override_item_id)] == "custom"
@@ -372,3 +372,82 @@ def test_auto_link_by_pn_skips_review_needed(monkeypatch):
 
     assert complex_linker.auto_link_by_pn(11, "PN-123") is False
     assert attached == []
+
+
+def test_auto_link_parts_probes_once_and_skips_linked(monkeypatch, sqlite_engine):
+    import threading
+
+    with Session(sqlite_engine) as session:
+        session.add(ComplexLink(part_id=1, ce_complex_id="ce-old"))
+        session.commit()
+
+    probes = []
+    monkeypatch.setattr(
+        complex_linker.ce_bridge_linker,
+        "probe_bridge_state",
+        lambda timeout=None: probes.append(1) or {},
+    )
+    invalidated = []
+    monkeypatch.setattr(
+        complex_linker.ce_bridge_linker,
+        "invalidate_bridge_state",
+        lambda: invalidated.append(1),
+    )
+
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+    searched = []
+
+    def fake_link(part_id, pn, limit=10):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            searched.append(pn)
+        threading.Event().wait(0.02)
+        with lock:
+            active["now"] -= 1
+        return pn != "PN-4"
+
+    monkeypatch.setattr(complex_linker, "auto_link_by_pn", fake_link)
+
+    parts = {1: "PN-1", 2: "PN-2", 3: "PN-3", 4: "PN-4", 5: "PN-5", 6: "  "}
+    result = complex_linker.auto_link_parts(parts, max_workers=2)
+
+    assert probes == [1]
+    assert result == {2: True, 3: True, 4: False, 5: True}
+    # New links were written, so the cached bridge state is dropped once.
+    assert invalidated == [1]
+    assert sorted(searched) == ["PN-2", "PN-3", "PN-4", "PN-5"]
+    assert active["peak"] <= 2
+
+
+def test_auto_link_parts_bridge_down_skips_searches(monkeypatch, sqlite_engine):
+    def offline(timeout=None):
+        raise LinkerError("offline")
+
+    monkeypatch.setattr(complex_linker.ce_bridge_linker, "probe_bridge_state", offline)
+    monkeypatch.setattr(
+        complex_linker,
+        "auto_link_by_pn",
+        lambda *a, **k: pytest.fail("searched while bridge offline"),
+    )
+
+    assert complex_linker.auto_link_parts({7: "PN-7"}) == {7: False}
+
+
+def test_invalidate_bridge_state_forces_a_fresh_probe(monkeypatch):
+    from app.integration import ce_bridge_linker
+
+    payload = {"features": {"search_match_kind": True, "normalization_rules_version": "v1"}}
+    requests = []
+    monkeypatch.setattr(ce_bridge_linker, "_STATE_CACHE", None)
+    monkeypatch.setattr(
+        ce_bridge_linker, "_request_json", lambda path, **kw: requests.append(path) or payload
+    )
+
+    ce_bridge_linker.probe_bridge_state()
+    ce_bridge_linker.probe_bridge_state()
+    assert requests == ["/state"]
+    ce_bridge_linker.invalidate_bridge_state()
+    ce_bridge_linker.probe_bridge_state()
+    assert requests == ["/state", "/state"]
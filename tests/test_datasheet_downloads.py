@@ -0,0 +1,140 @@
+import itertools
+from importlib import reload
+from pathlib import Path
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+import app.models as models
+from app.services import datasheet_downloads, import_bom
+import app.services.bom_import as bom_import_mod
+
+
+def setup_db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.clear()
+    reload(models)
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def test_downloads_are_deduplicated_and_stored_by_hash(tmp_path, monkeypatch):
+    import app.services.datasheets as ds
+
+    monkeypatch.setattr(ds, "DATASHEET_STORE", tmp_path / "store")
+    calls: list[str] = []
+
+    def fake_download(url: str) -> Path:
+        calls.append(url)
+        path = tmp_path / f"dl-{len(calls)}.pdf"
+        path.write_bytes(b"%PDF-1.4 fake")
+        return path
+
+    monkeypatch.setattr(datasheet_downloads, "_download_to_temp", fake_download)
+
+    url = "https://vendor.example/ds.pdf"
+    engine = setup_db()
+    with Session(engine) as session:
+        p1 = models.Part(part_number="P1", datasheet_url=url)
+        p2 = models.Part(part_number="P2", datasheet_url=url)
+        p3 = models.Part(part_number="P3", datasheet_url="manual.pdf")
+        session.add_all([p1, p2, p3]); session.commit()
+        ids = [p1.id, p2.id, p3.id]
+
+    futures = datasheet_downloads.schedule_datasheet_downloads(
+        {ids[0]: url, ids[1]: url, ids[2]: url}, lambda: Session(engine)
+    )
+    results = [f.result(timeout=10) for f in futures]
+
+    assert calls == [url]
+    assert len(results) == 1 and results[0]
+    canonical = Path(results[0])
+    assert canonical.exists()
+    assert canonical.parent.parent.parent == tmp_path / "store"
+    with Session(engine) as session:
+        urls = {p.part_number: p.datasheet_url for p in session.exec(select(models.Part))}
+    assert urls == {"P1": str(canonical), "P2": str(canonical), "P3": "manual.pdf"}
+
+
+def test_source_requeued_during_download_is_not_dropped(tmp_path, monkeypatch):
+    import app.services.datasheets as ds
+
+    monkeypatch.setattr(ds, "DATASHEET_STORE", tmp_path / "store")
+
+    counter = itertools.count()
+
+    def fake_download(url: str) -> Path:
+        # Unique per call: the two jobs may run at once and each deletes its file.
+        path = tmp_path / f"dl-{next(counter)}.pdf"
+        path.write_bytes(b"%PDF-1.4 fake")
+        return path
+
+    monkeypatch.setattr(datasheet_downloads, "_download_to_temp", fake_download)
+
+    url = "https://vendor.example/requeued.pdf"
+    engine = setup_db()
+    with Session(engine) as session:
+        p1 = models.Part(part_number="P1", datasheet_url=url)
+        p2 = models.Part(part_number="P2", datasheet_url=url)
+        session.add_all([p1, p2]); session.commit()
+        ids = [p1.id, p2.id]
+
+    requeued = []
+
+    def factory():
+        return Session(engine)
+
+    def session_factory():
+        # The first job has already taken P1; queue P2 for the same URL
+        # before that job finishes.
+        if not requeued:
+            requeued.extend(
+                datasheet_downloads.schedule_datasheet_downloads({ids[1]: url}, factory)
+            )
+        return Session(engine)
+
+    first = datasheet_downloads.schedule_datasheet_downloads({ids[0]: url}, session_factory)
+    assert first[0].result(timeout=10)
+    assert len(requeued) == 1
+    canonical = requeued[0].result(timeout=10)
+    assert canonical
+
+    with Session(engine) as session:
+        urls = {p.part_number: p.datasheet_url for p in session.exec(select(models.Part))}
+    assert urls == {"P1": canonical, "P2": canonical}
+    assert url not in datasheet_downloads._inflight
+
+
+def test_import_records_urls_and_defers_downloads(monkeypatch):
+    scheduled: list[dict[int, str]] = []
+    monkeypatch.setattr(
+        bom_import_mod,
+        "schedule_datasheet_downloads",
+        lambda sources, factory: scheduled.append(dict(sources)) or [],
+    )
+
+    engine = setup_db()
+    with Session(engine) as session:
+        cust = models.Customer(name="Cust")
+        session.add(cust); session.commit(); session.refresh(cust)
+        proj = models.Project(customer_id=cust.id, code="PRJ", title="Proj")
+        session.add(proj); session.commit(); session.refresh(proj)
+        asm = models.Assembly(project_id=proj.id, rev="A")
+        session.add(asm); session.commit(); session.refresh(asm)
+
+        data = (
+            "PN,Reference,Datasheet\n"
+            "P1,R1,  https://slow.example/p1.pdf \n"
+            "P2,R2,\n"
+        ).encode()
+        report = import_bom(asm.id, data, session)
+        assert report.errors == []
+
+        part = session.exec(select(models.Part).where(models.Part.part_number == "P1")).one()
+        # Stored exactly as handed to the downloader, which matches on it.
+        assert part.datasheet_url == "https://slow.example/p1.pdf"
+        assert scheduled == [{part.id: "https://slow.example/p1.pdf"}]
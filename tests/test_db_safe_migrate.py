@@ -3,6 +3,7 @@ from sqlalchemy import inspect, text
 from sqlmodel import create_engine
 
 from app.db_safe_migrate import run_sqlite_safe_migrations
+from app.logic.designators import designator_sort_key
 
 
 def _mk_engine():
@@ -65,3 +66,65 @@ def test_part_number_column_and_index_added():
     assert "part_number" in cols
     idx = {i["name"] for i in insp.get_indexes("part")}
     assert "ix_part_part_number" in idx
+
+
+def test_bomitem_indexes_added_after_dedupe():
+    engine = _mk_engine()
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                'CREATE TABLE "bomitem" (id INTEGER PRIMARY KEY, assembly_id INTEGER, '
+                "part_id INTEGER, reference TEXT, qty INTEGER)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE TABLE bom_item_test_override (id INTEGER PRIMARY KEY, "
+                "bom_item_id INTEGER, power_mode TEXT)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO bomitem(id, assembly_id, part_id, reference, qty) VALUES "
+                "(1, 1, 10, 'R1', 1), (2, 1, 11, 'R1', 1), (3, 1, 10, 'R2', 1), (4, 2, 10, 'R1', 1)"
+            )
+        )
+        conn.execute(
+            text("INSERT INTO bom_item_test_override(bom_item_id, power_mode) VALUES (1, 'powered'), (2, 'powered')")
+        )
+    applied = run_sqlite_safe_migrations(engine)
+    assert ("bomitem", "ux_bomitem_assembly_reference") in applied
+    assert ("bomitem", "ix_bomitem_part_id") in applied
+    assert ("bomitem", "ix_bomitem_assembly_reference_key") in applied
+
+    insp = inspect(engine)
+    indexes = {ix["name"]: ix for ix in insp.get_indexes("bomitem")}
+    assert indexes["ux_bomitem_assembly_reference"]["unique"]
+    assert indexes["ix_bomitem_part_id"]["column_names"] == ["part_id"]
+    with engine.begin() as conn:
+        ids = [r[0] for r in conn.execute(text("SELECT id FROM bomitem ORDER BY id"))]
+        overrides = [r[0] for r in conn.execute(text("SELECT bom_item_id FROM bom_item_test_override"))]
+        plan = " ".join(
+            str(r[-1])
+            for r in conn.execute(
+                text("EXPLAIN QUERY PLAN SELECT id FROM bomitem WHERE assembly_id = 1 AND reference = 'R2'")
+            )
+        )
+        keys = dict(conn.execute(text("SELECT id, reference_key FROM bomitem")).all())
+    assert ids == [1, 3, 4]
+    assert keys == {1: designator_sort_key("R1"), 3: designator_sort_key("R2"), 4: designator_sort_key("R1")}
+    assert overrides == [1]
+    assert "ux_bomitem_assembly_reference" in plan
+    assert run_sqlite_safe_migrations(engine) == []
+
+
+def test_part_number_keys_backfilled_and_indexed():
+    engine = _mk_engine()
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE part (id INTEGER PRIMARY KEY, part_number TEXT NOT NULL)"))
+        conn.execute(text("INSERT INTO part (id, part_number) VALUES (1, 'sn74hct240n-tr')"))
+    applied = run_sqlite_safe_migrations(engine)
+    assert ("part", "ix_part_part_number_norm") in applied
+    with engine.connect() as conn:
+        row = conn.execute(text("SELECT part_number_norm, part_number_base FROM part")).one()
+    assert tuple(row) == ("SN74HCT240NTR", "SN74HCT240")
@@ -0,0 +1,33 @@
+from app.logic.designators import (
+    compress_designators,
+    count_designators,
+    iter_designators,
+)
+
+
+def test_expand_mixed_forms():
+    text = "R10A-R10F, U1:U3; C1 - C3 R001-R003 R5-3 X1-Y2 R20a-c"
+    assert list(iter_designators(text)) == [
+        "R10A", "R10B", "R10C", "R10D", "R10E", "R10F",
+        "U1", "U2", "U3",
+        "C1", "C2", "C3",
+        "R001", "R002", "R003",
+        "R3", "R4", "R5",
+        "X1-Y2",
+        "R20a", "R20b", "R20c",
+    ]
+
+
+def test_expansion_is_lazy_and_countable():
+    refs = iter_designators("C1-C100000000")
+    assert next(refs) == "C1"
+    assert count_designators("C1-C400,R10A-R10F,U1:U8") == 414
+
+
+def test_compress_round_trips():
+    refs = list(iter_designators("C1-C400,R10A-R10F,U1:U8,R1,R2,R4,R001-R003,TP-X"))
+    text = compress_designators(refs)
+    assert text == "C1-C400,R1,R001-R003,R2,R4,R10A-R10F,TP-X,U1-U8"
+    assert sorted(iter_designators(text)) == sorted(set(refs))
+    assert compress_designators(["R2", "R1"]) == "R1,R2"
+    assert compress_designators(["R9", "R11", "R10", "R10"]) == "R9-R11"
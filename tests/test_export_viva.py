@@ -69,3 +69,15 @@ def test_build_viva_groups_macro_missing_detail():
         rows_gui = [{"reference": "R1", "part_number": "PN1", "test_method": "macro", "test_detail": ""}]
         with pytest.raises(ValueError, match="requires Test detail"):
             build_viva_groups(rows_gui, session, assembly_id=1)
+
+
+def test_build_viva_groups_expands_range_references():
+    engine = setup_db()
+    with Session(engine) as session:
+        rows_gui = [
+            {"reference": "C3-C5,C1", "part_number": "CAP", "test_method": "Macro", "test_detail": "CAPACITOR"},
+            {"reference": "C4", "part_number": "CAP", "test_method": "Macro", "test_detail": "CAPACITOR"},
+        ]
+        groups = build_viva_groups(rows_gui, session, assembly_id=1)
+        assert groups[0]["reference"] == "C1,C3,C4,C5"
+        assert groups[0]["quantity"] == "4"
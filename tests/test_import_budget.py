@@ -0,0 +1,58 @@
+"""Cold-start import budgets for the API worker and the desktop GUI.
+
+Each check runs ``python -X importtime`` in a fresh interpreter and fails
+when a heavy optional stack is pulled in eagerly or the cumulative import
+time of the entry module exceeds a generous ceiling.
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+# Seconds; far above a warm-cache start so only real regressions trip it.
+API_BUDGET = 4.0
+GUI_BUDGET = 8.0
+_HEAVY = ("requests", "fitz", "pymupdf", "openpyxl", "app.integration.ce_supervisor")
+
+
+def _importtime(module: str, tmp_path: Path) -> dict[str, int]:
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env["BOM_DATA_ROOT"] = str(tmp_path / "data")
+    env["BOM_SETTINGS_PATH"] = str(tmp_path / "settings.toml")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = (part.strip() for part in line.split("|"))
+        if cum.isdigit():
+            cumulative[name] = int(cum)
+    return cumulative
+
+
+@pytest.mark.parametrize("module", ["app.services", "app.api"])
+def test_api_boot_stays_lazy(module, tmp_path):
+    times = _importtime(module, tmp_path)
+    assert not [m for m in _HEAVY if m in times]
+    assert times[module] / 1e6 < API_BUDGET
+
+
+def test_gui_launch_budget(tmp_path):
+    if importlib.util.find_spec("PyQt6") is None:
+        pytest.skip("PyQt6 not available")
+    times = _importtime("app.gui.main", tmp_path)
+    assert "fitz" not in times and "pymupdf" not in times
+    assert times["app.gui.main"] / 1e6 < GUI_BUDGET
@@ -0,0 +1,153 @@
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app import services
+from app.db_safe_migrate import run_sqlite_safe_migrations
+from app.services import parts as parts_service
+
+
+def _engine(indexed: bool = True):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    if indexed:
+        assert ("part_fts", "create") in run_sqlite_safe_migrations(engine)
+    return engine
+
+
+def _seed(session):
+    services.create_part(session, part_number="SN74HCT240N", description="Octal buffer", package="DIP-20")
+    services.create_part(session, part_number="HCT240", description="Buffer IC")
+    services.create_part(session, part_number="RC0603-10K", description="Resistor 10k", package="0603")
+    services.create_part(session, part_number="GRM188", description="Capacitor 100n", package="0603")
+
+
+def _numbers(session, query):
+    return [p.part_number for p in services.search_parts(session, query)]
+
+
+def test_fts_search_ranks_and_matches_tokens():
+    engine = _engine()
+    with Session(engine) as session:
+        _seed(session)
+        assert parts_service._has_part_fts(session)
+        assert _numbers(session, "hct240") == ["HCT240", "SN74HCT240N"]
+        assert _numbers(session, "0603 resistor") == ["RC0603-10K"]
+        assert _numbers(session, "0603 10k") == ["RC0603-10K"]
+        assert set(_numbers(session, "buf")) == {"HCT240", "SN74HCT240N"}
+        assert _numbers(session, 'say "hi"') == []
+
+
+def test_fts_index_follows_updates_and_deletes():
+    engine = _engine()
+    with Session(engine) as session:
+        _seed(session)
+        part = services.search_parts(session, "GRM188")[0]
+        services.update_part(session, part.id, description="Ceramic cap")
+        assert _numbers(session, "capacitor") == []
+        assert _numbers(session, "ceramic") == ["GRM188"]
+        services.delete_part(session, part.id)
+        assert _numbers(session, "ceramic") == []
+        count = session.exec(text("SELECT count(*) FROM part_fts WHERE part_fts MATCH '\"0603\"'")).one()
+        assert count[0] == 1
+
+
+def test_index_built_for_existing_rows_and_fallback_agrees():
+    plain = _engine(indexed=False)
+    with Session(plain) as session:
+        _seed(session)
+        assert not parts_service._has_part_fts(session)
+        unindexed = {q: sorted(_numbers(session, q)) for q in ("hct240", "0603 10k", "10", "")}
+        assert unindexed["hct240"] == ["HCT240", "SN74HCT240N"]
+        assert unindexed["0603 10k"] == ["RC0603-10K"]
+    run_sqlite_safe_migrations(plain)
+    with Session(plain) as session:
+        for q, expected in unindexed.items():
+            assert sorted(_numbers(session, q)) == expected
+
+
+def test_normalised_part_number_matches_first():
+    engine = _engine()
+    with Session(engine) as session:
+        _seed(session)
+        services.create_part(session, part_number="SN74HCT240DW", description="Octal buffer SOIC")
+        assert _numbers(session, "sn74hct-240n")[:2] == ["SN74HCT240N", "SN74HCT240DW"]
+        part = services.search_parts(session, "SN74HCT240N")[0]
+        assert (part.part_number_norm, part.part_number_base) == ("SN74HCT240N", "SN74HCT240")
+
+        services.update_part(session, part.id, part_number="SN74HCT245N")
+        session.refresh(part)
+        assert part.part_number_base == "SN74HCT245"
+
+
+def test_dashed_query_does_not_match_whole_family():
+    engine = _engine()
+    with Session(engine) as session:
+        for number in ("LM-317T", "LM-7805", "LM-358N", "LM-1117", "LM317T"):
+            services.create_part(session, part_number=number, description="Regulator")
+        assert _numbers(session, "LM-317") == ["LM317T", "LM-317T"]
+
+
+def test_values_and_free_text_keep_the_every_token_rule():
+    engine = _engine()
+    with Session(engine) as session:
+        _seed(session)
+        services.create_part(session, part_number="10-89-7062", description="Header 2x31")
+        services.create_part(session, part_number="GRM21BR61A106", description="Capacitor 10uF", package="0805")
+        assert _numbers(session, "10k resistor") == ["RC0603-10K"]
+        assert _numbers(session, "10uF") == ["GRM21BR61A106"]
+        assert _numbers(session, "10-89-7062") == ["10-89-7062"]
+
+
+def test_search_pages_cover_every_match_once():
+    engine = _engine()
+    with Session(engine) as session:
+        for i in range(25):
+            services.create_part(session, part_number=f"RES-{i:03d}", description="Resistor")
+        services.create_part(session, part_number="RES000", description="Fuzzy twin")
+        for query in ("", "res000", "resistor"):
+            everything = [p.id for p in services.search_parts(session, query, limit=1000)]
+            paged = []
+            for offset in range(0, len(everything) + 7, 7):
+                paged.extend(p.id for p in services.search_parts(session, query, limit=7, offset=offset))
+            assert paged == everything
+        assert len(services.search_parts(session, "", limit=1000)) == 26
+
+
+def test_fuzzy_matches_are_paged_and_excluded_in_sql():
+    engine = _engine()
+    with Session(engine) as session:
+        for i in range(30):
+            suffix = chr(65 + i // 26) + chr(65 + i % 26)
+            services.create_part(session, part_number=f"OPA2134{suffix}", description="Op amp")
+        services.create_part(session, part_number="EVM-OPA2134", description="Op amp board")
+
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+        tail = [p.part_number for p in services.search_parts(session, "OPA2134", limit=5, offset=28)]
+        assert tail == ["OPA2134BC", "OPA2134BD", "EVM-OPA2134"]
+        past = [p.part_number for p in services.search_parts(session, "OPA2134", limit=5, offset=30)]
+        assert past == ["EVM-OPA2134"]
+    # Fuzzy matches are paged and excluded by the query itself, not by id lists.
+    assert not any("NOT IN" in sql for sql in statements)
+
+
+def test_sorted_search_pages_one_stable_order():
+    engine = _engine()
+    with Session(engine) as session:
+        _seed(session)
+        services.create_part(session, part_number="SN74HCT240DW", description="Octal buffer SOIC")
+
+        def page(query, offset, **kw):
+            return [p.part_number for p in services.search_parts(session, query, limit=1, offset=offset, **kw)]
+
+        expected = ["SN74HCT240N", "SN74HCT240DW", "HCT240"]
+        paged = [n for offset in range(4) for n in page("hct240", offset, order_by="part_number", descending=True)]
+        assert paged == expected
+        by_package = services.search_parts(session, "", order_by="package")
+        assert [p.package for p in by_package][-2:] == ["0603", "DIP-20"]
+        with pytest.raises(ValueError, match="power_required"):
+            services.search_parts(session, "", order_by="power_required")
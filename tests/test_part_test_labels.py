@@ -0,0 +1,93 @@
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app import services
+from app.models import PartType, TestMode, TestProfile
+from app.services import part_test_labels
+from app.services.part_test_labels import TEST_NAMES, PartTestLabels
+from app.services.test_defaults import upsert_part_test_map
+
+
+def _engine():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def _part(session, pn, part_type):
+    part = services.create_part(session, part_number=pn)
+    part.active_passive = part_type
+    session.add(part)
+    session.commit()
+    return part.id
+
+
+def _count_selects(engine):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, params, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+def test_labels_follow_resolver_profile_rules():
+    engine = _engine()
+    with Session(engine) as session:
+        active = _part(session, "U1", PartType.active)
+        passive = _part(session, "R1", PartType.passive)
+        bare = _part(session, "X1", PartType.active)
+        upsert_part_test_map(
+            session, active, TestMode.powered, TestProfile.ACTIVE,
+            "Quick test (QT)", None, qt_path="C:/qt/u1.xml",
+        )
+        upsert_part_test_map(
+            session, active, TestMode.unpowered, TestProfile.PASSIVE, "Macro", "CONT"
+        )
+        upsert_part_test_map(
+            session, passive, TestMode.unpowered, TestProfile.ACTIVE, "Python code", "ohms.py"
+        )
+        upsert_part_test_map(
+            session, passive, TestMode.unpowered, TestProfile.PASSIVE, "Macro", "RES"
+        )
+        session.commit()
+
+        labels = services.load_part_test_labels(session, [active, passive, bare, None])
+
+    assert labels[active] == PartTestLabels(
+        powered=("Quick test (QT)", "u1.xml"), unpowered=("Macro", "CONT")
+    )
+    # Passive parts only use PASSIVE-profile defaults; powered falls back to unpowered.
+    assert labels[passive] == PartTestLabels(powered=("Macro", "RES"), unpowered=("Macro", "RES"))
+    assert bare not in labels
+
+
+def test_large_id_sets_are_chunked_and_names_cached(monkeypatch):
+    monkeypatch.setattr(part_test_labels, "CHUNK_SIZE", 2)
+    TEST_NAMES.clear()
+    engine = _engine()
+    with Session(engine) as session:
+        ids = [_part(session, f"U{i}", PartType.active) for i in range(5)]
+        for pid in ids:
+            upsert_part_test_map(
+                session, pid, TestMode.unpowered, TestProfile.ACTIVE, "Python code", f"t{pid}.py"
+            )
+        session.commit()
+
+        statements = _count_selects(engine)
+        first = services.load_part_test_labels(session, ids)
+        # Three mapping chunks plus three name chunks for five python tests.
+        assert len(statements) == 6
+        assert {pid: first[pid].unpowered for pid in ids} == {
+            pid: ("Python code", f"t{pid}.py") for pid in ids
+        }
+
+        statements.clear()
+        assert services.load_part_test_labels(session, ids) == first
+        assert len(statements) == 3
+    TEST_NAMES.clear()
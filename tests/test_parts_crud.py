@@ -4,7 +4,7 @@ import pytest
 from sqlmodel import SQLModel, Session, create_engine
 
 from app import services
-from app.models import Assembly, BOMItem, Customer, Part, Project
+from app.models import Assembly, BOMItem, Customer, Part, PartType, Project
 
 
 def make_session():
@@ -58,3 +58,71 @@ def test_delete_part_with_references():
         assert refreshed_item is not None
         assert refreshed_item.part_id is None
         assert session.get(Part, part.id) is None
+
+
+def test_bulk_update_parts_single_commit_and_failures():
+    from sqlalchemy import event
+
+    with make_session() as session:
+        a = services.create_part(session, part_number="PN-A")
+        b = services.create_part(session, part_number="PN-B")
+        c = services.create_part(session, part_number="PN-C")
+        ids = (a.id, b.id, c.id)
+
+        commits = []
+        event.listen(session, "after_commit", lambda s: commits.append(1))
+        result = services.bulk_update_parts(
+            session,
+            {
+                ids[0]: {"package": "0603", "value": "10k", "tol_p": "", "function": "  "},
+                ids[1]: {"package": "0402", "active_passive": "active", "part_number": "pn-b2 "},
+                ids[2]: {"part_number": "PN-A"},
+                999: {"package": "SOT-23"},
+                ids[0] + 100: {"colour": "red"},
+            },
+        )
+        assert commits == [1]
+        assert sorted(result.updated) == [ids[0], ids[1]]
+        assert set(result.failed) == {ids[2], 999, ids[0] + 100}
+        assert "already exists" in result.failed[ids[2]]
+
+        first, second, third = (session.get(Part, pid) for pid in ids)
+        assert (first.package, first.value, first.tol_p, first.function) == ("0603", "10k", None, None)
+        assert second.active_passive == PartType.active
+        assert (second.part_number, second.part_number_norm) == ("pn-b2", "PNB2")
+        assert third.part_number == "PN-C"
+        assert services.search_parts(session, "0402")[0].id == ids[1]
+
+
+def test_bulk_update_parts_isolates_database_errors():
+    with make_session() as session:
+        a = services.create_part(session, part_number="PN-A")
+        b = services.create_part(session, part_number="PN-B")
+        c = services.create_part(session, part_number="PN-C")
+        a_id, b_id, c_id = a.id, b.id, c.id
+        # A swap passes the pre-checks but violates the unique index mid-batch.
+        result = services.bulk_update_parts(
+            session,
+            {a_id: {"part_number": "PN-B"}, b_id: {"part_number": "PN-A"}, c_id: {"value": "1u"}},
+        )
+        assert result.updated == [c_id]
+        assert set(result.failed) == {a_id, b_id}
+        assert session.get(Part, a_id).part_number == "PN-A"
+        assert session.get(Part, c_id).value == "1u"
+
+
+def test_bulk_update_parts_parses_power_required_text():
+    with make_session() as session:
+        ids = [services.create_part(session, part_number=f"PN-{i}").id for i in range(4)]
+        result = services.bulk_update_parts(
+            session,
+            {
+                ids[0]: {"power_required": "true"},
+                ids[1]: {"power_required": "0"},
+                ids[2]: {"power_required": " No "},
+                ids[3]: {"power_required": "maybe"},
+            },
+        )
+        assert sorted(result.updated) == ids[:3]
+        assert "maybe" in result.failed[ids[3]]
+        assert [session.get(Part, pid).power_required for pid in ids[:3]] == [True, False, False]
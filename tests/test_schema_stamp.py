@@ -0,0 +1,55 @@
+import sqlalchemy
+from sqlalchemy import event, inspect
+from sqlmodel import create_engine
+
+from app import database
+
+
+def _engine():
+    return create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=sqlalchemy.pool.StaticPool,
+    )
+
+
+def test_schema_verified_once_then_stamp_skips_introspection(monkeypatch):
+    engine = _engine()
+    monkeypatch.setattr(database, "engine", engine)
+    database.ensure_schema()
+    assert "bomitem" in inspect(engine).get_table_names()
+    assert database.read_schema_stamp(engine) == database.schema_fingerprint()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    database.ensure_schema()
+    assert statements == []
+
+    # A cold start (new process) trusts the stamp: one SELECT, no create_all.
+    database._verified_engines.clear()
+    monkeypatch.setattr(database, "verify_schema", lambda bind: (_ for _ in ()).throw(AssertionError))
+    database.ensure_schema()
+    assert len(statements) == 1
+
+
+def test_outdated_stamp_triggers_full_check(monkeypatch):
+    engine = _engine()
+    monkeypatch.setattr(database, "engine", engine)
+    database.record_schema_version(engine, "stale")
+    database.ensure_schema()
+    assert "bomitem" in inspect(engine).get_table_names()
+    assert database.read_schema_stamp(engine) == database.schema_fingerprint()
+
+
+def test_db_tool_stamp_command(monkeypatch, capsys):
+    from app.tools import db as db_tool
+
+    engine = _engine()
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr("sys.argv", ["db", "stamp"])
+    db_tool.main()
+    monkeypatch.setattr("sys.argv", ["db", "doctor"])
+    db_tool.main()
+    out = capsys.readouterr().out
+    assert "Recorded schema version" in out
+    assert "Schema stamp current" in out
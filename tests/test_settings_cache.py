@@ -0,0 +1,45 @@
+import os
+
+import app.config as config
+
+
+def _use_settings(monkeypatch, tmp_path, body: str):
+    settings = tmp_path / "settings.toml"
+    settings.write_text(body, encoding="utf-8")
+    monkeypatch.setattr(config, "SETTINGS_PATH", settings)
+    config.invalidate_settings_cache()
+    return settings
+
+
+def test_settings_parsed_once_until_file_changes(tmp_path, monkeypatch):
+    settings = _use_settings(monkeypatch, tmp_path, "[imports]\nmax_workers = 3\n")
+    calls = []
+    real_parse = config._parse_settings_file
+
+    def counting_parse():
+        calls.append(1)
+        return real_parse()
+
+    monkeypatch.setattr(config, "_parse_settings_file", counting_parse)
+    for _ in range(5):
+        assert config._load_import_job_max_workers() == 3
+    assert len(calls) == 1
+
+    # Callers get copies, so mutating a result cannot poison the cache.
+    config._read_settings_dict()["imports"]["max_workers"] = 9
+    assert config._load_import_job_max_workers() == 3
+
+    settings.write_text("[imports]\nmax_workers = 7\n", encoding="utf-8")
+    stat = settings.stat()
+    os.utime(settings, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert config._load_import_job_max_workers() == 7
+    assert len(calls) == 2
+
+
+def test_save_functions_invalidate_cache(tmp_path, monkeypatch):
+    _use_settings(monkeypatch, tmp_path, "[complex_editor]\nexe_path = \"old.exe\"\n")
+    assert config.get_complex_editor_settings()["exe_path"] == "old.exe"
+    assert config._settings_cache is not None
+    config.save_complex_editor_settings(exe_path="new.exe")
+    assert config._settings_cache is None
+    assert config.get_complex_editor_settings()["exe_path"] == "new.exe"
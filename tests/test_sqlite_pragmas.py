@@ -0,0 +1,62 @@
+from sqlalchemy import text
+
+import app.config as config
+
+
+def _use_settings(monkeypatch, tmp_path, body: str) -> None:
+    settings = tmp_path / "settings.toml"
+    settings.write_text(body, encoding="utf-8")
+    monkeypatch.setattr(config, "SETTINGS_PATH", settings)
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_default_profile_applied_to_file_database(tmp_path, monkeypatch):
+    _use_settings(monkeypatch, tmp_path, "[database]\n")
+    engine, _ = config._create_engine(f"sqlite:///{(tmp_path / 'app.db').as_posix()}")
+    try:
+        assert _pragma(engine, "journal_mode") == "wal"
+        assert _pragma(engine, "synchronous") == 1  # NORMAL
+        assert _pragma(engine, "busy_timeout") == 5000
+        assert _pragma(engine, "cache_size") == -20000
+        assert _pragma(engine, "temp_store") == 2  # MEMORY
+    finally:
+        engine.dispose()
+
+
+def test_profile_overrides_and_invalid_values(tmp_path, monkeypatch):
+    _use_settings(
+        monkeypatch,
+        tmp_path,
+        "[database.sqlite]\n"
+        'journal_mode = "delete"\n'
+        'synchronous = "sometimes"\n'
+        "busy_timeout = 250\n"
+        "mmap_size = -1\n",
+    )
+    pragmas = config.get_sqlite_pragmas()
+    assert pragmas["journal_mode"] == "DELETE"
+    assert pragmas["synchronous"] == "NORMAL"
+    assert pragmas["busy_timeout"] == 250
+    assert pragmas["mmap_size"] == config._SQLITE_PRAGMA_DEFAULTS["mmap_size"]
+
+    engine, _ = config._create_engine(f"sqlite:///{(tmp_path / 'app.db').as_posix()}")
+    try:
+        assert _pragma(engine, "journal_mode") == "delete"
+        assert _pragma(engine, "busy_timeout") == 250
+    finally:
+        engine.dispose()
+
+
+def test_profile_can_be_disabled(tmp_path, monkeypatch):
+    _use_settings(monkeypatch, tmp_path, "[database.sqlite]\nenabled = false\n")
+    assert config.get_sqlite_pragmas() == {}
+    engine, pragmas = config._create_engine(f"sqlite:///{(tmp_path / 'app.db').as_posix()}")
+    try:
+        assert pragmas == (("pragmas", ()),)
+        assert _pragma(engine, "journal_mode") == "delete"
+    finally:
+        engine.dispose()
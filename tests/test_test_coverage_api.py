@@ -0,0 +1,124 @@
+import os
+from importlib import import_module, reload
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.domain.complex_linker import ComplexLink
+
+
+@pytest.fixture()
+def client(tmp_path):
+    os.environ["BOM_DATA_ROOT"] = str(tmp_path / "data")
+    config = reload(import_module("app.config"))
+    config.refresh_paths()
+
+    SQLModel.metadata.clear()
+    models = reload(import_module("app.models"))
+    auth = reload(import_module("app.auth"))
+    api_module = reload(import_module("app.api"))
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    ComplexLink.__table__.create(engine)
+
+    def session_override():
+        with Session(engine) as session:
+            yield session
+
+    api_module.app.dependency_overrides[api_module.get_session] = session_override
+    api_module.app.dependency_overrides[auth.get_current_user] = lambda: models.User(
+        id=1, username="tester", hashed_password="x"
+    )
+    client = TestClient(api_module.app)
+    try:
+        yield client, models, engine
+    finally:
+        client.close()
+        api_module.app.dependency_overrides.clear()
+
+
+def test_coverage_counts_and_invalidation(client):
+    client_app, models, engine = client
+    with Session(engine) as session:
+        cust = models.Customer(name="Cust")
+        session.add(cust); session.commit(); session.refresh(cust)
+        proj = models.Project(customer_id=cust.id, code="PRJ", title="Proj")
+        session.add(proj); session.commit(); session.refresh(proj)
+        asm = models.Assembly(project_id=proj.id, rev="A")
+        mapped = models.Part(part_number="R-MAPPED", active_passive=models.PartType.passive)
+        bare = models.Part(part_number="U-BARE", active_passive=models.PartType.active)
+        session.add_all([asm, mapped, bare]); session.commit()
+        session.add(
+            models.PartTestMap(
+                part_id=mapped.id,
+                power_mode=models.TestMode.unpowered,
+                profile=models.TestProfile.PASSIVE,
+                test_macro_id=1,
+            )
+        )
+        for i in range(3):
+            session.add(models.BOMItem(assembly_id=asm.id, part_id=mapped.id, reference=f"R{i}"))
+        session.add(models.BOMItem(assembly_id=asm.id, part_id=bare.id, reference="U1"))
+        session.commit()
+        asm_id, u1_id = asm.id, session.exec(
+            select(models.BOMItem.id).where(models.BOMItem.reference == "U1")
+        ).one()
+
+    resp = client_app.get(f"/assemblies/{asm_id}/test-coverage")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["total"] == 4
+    assert body["by_source"] == {"mapping": 3, "unresolved": 1}
+    assert body["by_method"] == {"Macro": 3, "none": 1}
+    assert {
+        (b["part_type"], b["power_mode"], b["source"], b["count"]) for b in body["buckets"]
+    } == {("passive", "unpowered", "mapping", 3), ("active", "unpowered", "unresolved", 1)}
+
+    etag = resp.headers["ETag"]
+    cached = client_app.get(f"/assemblies/{asm_id}/test-coverage", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    with Session(engine) as session:
+        session.add(
+            models.BOMItemTestOverride(
+                bom_item_id=u1_id, power_mode=models.TestMode.unpowered, python_test_id=1
+            )
+        )
+        session.commit()
+    resp = client_app.get(f"/assemblies/{asm_id}/test-coverage", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["by_source"] == {"mapping": 3, "override": 1}
+
+
+def test_coverage_unknown_assembly(client):
+    client_app, _models, _engine = client
+    assert client_app.get("/assemblies/999/test-coverage").status_code == 404
+
+
+def test_cached_summaries_are_bounded(client, monkeypatch):
+    from app.services import test_coverage
+    from app.services.test_resolution import RESOLVED_TESTS
+
+    _client_app, models, engine = client
+    RESOLVED_TESTS.clear()
+    monkeypatch.setattr(RESOLVED_TESTS, "max_assemblies", 2)
+    with Session(engine) as session:
+        cust = models.Customer(name="Cust")
+        session.add(cust); session.commit(); session.refresh(cust)
+        proj = models.Project(customer_id=cust.id, code="PRJ", title="Proj")
+        session.add(proj); session.commit(); session.refresh(proj)
+        asms = [models.Assembly(project_id=proj.id, rev=rev) for rev in "ABC"]
+        session.add_all(asms); session.commit()
+        ids = [a.id for a in asms]
+
+        for asm_id in ids:
+            assert test_coverage.get_test_coverage(session, asm_id).assembly_id == asm_id
+        # Summaries live in the shared resolved-test cache and its LRU bound.
+        assert RESOLVED_TESTS.cached_assemblies(session.get_bind()) == ids[1:]
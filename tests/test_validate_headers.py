@@ -4,7 +4,8 @@ from sqlalchemy.pool import StaticPool
 from importlib import reload
 
 import app.models as models
-from app.services import validate_headers, import_bom
+from app.services import import_bom, match_headers, validate_headers
+import app.services.bom_import as bom_import_mod
 
 
 def setup_db():
@@ -39,3 +40,42 @@ def test_import_bom_bad_headers():
         session.add(asm); session.commit(); session.refresh(asm)
         report = import_bom(asm.id, b"bad,header\n", session)
         assert report.errors
+
+
+def test_match_headers_reports_alias_and_duplicates():
+    matches = match_headers(["Designator", "MPN", "Tolerance", "Tolerance", "Misc"])
+    assert [(m.field, m.alias) for m in matches] == [
+        ("reference", "designator"),
+        ("part_number", "mpn"),
+        ("tol_p", "tolerance+"),
+        ("tol_n", "tolerance-"),
+        (None, None),
+    ]
+
+
+def test_header_aliases_from_settings(monkeypatch):
+    monkeypatch.setattr(
+        bom_import_mod,
+        "get_bom_header_aliases",
+        lambda: {"reference": ["Designator List"], "part_number": ["Cust PN"], "bogus": ["x"]},
+    )
+    assert validate_headers(["Cust PN", "Designator List"]) == {
+        "part_number": 0,
+        "reference": 1,
+    }
+
+    engine = setup_db()
+    with Session(engine) as session:
+        cust = models.Customer(name="Cust")
+        session.add(cust); session.commit(); session.refresh(cust)
+        proj = models.Project(customer_id=cust.id, code="PRJ", title="Proj")
+        session.add(proj); session.commit(); session.refresh(proj)
+        asm = models.Assembly(project_id=proj.id, rev="A")
+        session.add(asm); session.commit(); session.refresh(asm)
+        report = import_bom(asm.id, b"Cust PN,Designator List,Remark\nP1,R1,x\n", session)
+    assert report.errors == []
+    assert [(c.header, c.field, c.alias) for c in report.columns] == [
+        ("Cust PN", "part_number", "Cust PN"),
+        ("Designator List", "reference", "Designator List"),
+        ("Remark", None, None),
+    ]